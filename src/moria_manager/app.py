@@ -98,7 +98,7 @@ def main():
     """Application entry point."""
     # Initialize logging first
     logger = setup_logging(debug="--debug" in sys.argv)
-    logger.info(f"Starting Moria Manager v{__version__}")
+    logger.info("Starting Moria Manager v%s", __version__)
 
     try:
         app = MoriaManagerApp()
@@ -50,7 +50,7 @@ class ConfigurationManager:
             return not self.config.settings.first_run_complete
         except (ET.ParseError, FileNotFoundError, ValueError, KeyError) as e:
             # Corrupted config = treat as first run
-            logger.warning(f"Could not load config, treating as first run: {e}")
+            logger.warning("Could not load config, treating as first run: %s", e)
             return True
 
     def load(self) -> AppConfiguration:
@@ -63,7 +63,7 @@ class ConfigurationManager:
             FileNotFoundError: If config file doesn't exist
             ET.ParseError: If XML is malformed
         """
-        logger.debug(f"Loading configuration from {self.config_path}")
+        logger.debug("Loading configuration from %s", self.config_path)
         tree = ET.parse(self.config_path)
         root = tree.getroot()
 
@@ -89,6 +89,7 @@ class ConfigurationManager:
                 backup_location=self._parse_path(settings_elem, "BackupLocation"),
                 auto_backup_on_launch=self._parse_bool(settings_elem, "AutoBackupOnLaunch", False),
                 enable_deletion=self._parse_bool(settings_elem, "EnableDeletion", False),
+                prefer_hardlinks=self._parse_bool(settings_elem, "PreferHardlinks", False),
                 server_info=server_info,
             )
         else:
@@ -98,6 +99,7 @@ class ConfigurationManager:
                 backup_location=None,
                 auto_backup_on_launch=False,
                 enable_deletion=False,
+                prefer_hardlinks=False,
                 server_info=None,
             )
 
@@ -131,7 +133,7 @@ class ConfigurationManager:
                     backups.append(backup)
                 except (ValueError, TypeError) as e:
                     # Skip malformed backup entries
-                    logger.warning(f"Skipping malformed backup entry: {e}")
+                    logger.warning("Skipping malformed backup entry: %s", e)
                     continue
 
         self.config = AppConfiguration(
@@ -139,7 +141,7 @@ class ConfigurationManager:
             installations=installations,
             backups=backups,
         )
-        logger.debug(f"Configuration loaded: {len(installations)} installations, {len(backups)} backups")
+        logger.debug("Configuration loaded: %d installations, %d backups", len(installations), len(backups))
         return self.config
 
     def save(self) -> None:
@@ -150,7 +152,7 @@ class ConfigurationManager:
         if self.config is None:
             raise ValueError("No configuration to save")
 
-        logger.debug(f"Saving configuration to {self.config_path}")
+        logger.debug("Saving configuration to %s", self.config_path)
 
         # Ensure config directory exists
         GamePaths.ensure_config_dir()
@@ -163,6 +165,7 @@ class ConfigurationManager:
         ET.SubElement(settings_elem, "BackupLocation").text = str(self.config.settings.backup_location or GamePaths.BACKUP_DEFAULT)
         ET.SubElement(settings_elem, "AutoBackupOnLaunch").text = str(self.config.settings.auto_backup_on_launch).lower()
         ET.SubElement(settings_elem, "EnableDeletion").text = str(self.config.settings.enable_deletion).lower()
+        ET.SubElement(settings_elem, "PreferHardlinks").text = str(self.config.settings.prefer_hardlinks).lower()
 
         # Server info section
         if self.config.settings.server_info:
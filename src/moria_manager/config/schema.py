@@ -41,6 +41,57 @@ class ServerInfo:
     notes: str = ""
 
 
+@dataclass(slots=True)
+class ServerEntries:
+    """Saved server list for one installation, stored as parallel field lists"""
+    names: list[str] = field(default_factory=list)
+    addresses: list[str] = field(default_factory=list)
+    passwords: list[str] = field(default_factory=list)
+    notes: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def append(self, name: str = "", address: str = "", password: str = "", notes: str = "") -> None:
+        """Add a server entry to the end of the list."""
+        self.names.append(name)
+        self.addresses.append(address)
+        self.passwords.append(password)
+        self.notes.append(notes)
+
+    def pop(self, index: int) -> None:
+        """Remove the server entry at index."""
+        del self.names[index]
+        del self.addresses[index]
+        del self.passwords[index]
+        del self.notes[index]
+
+    def clear(self) -> None:
+        """Remove all server entries."""
+        self.names.clear()
+        self.addresses.clear()
+        self.passwords.clear()
+        self.notes.clear()
+
+    def row(self, index: int) -> tuple[str, str, str, str]:
+        """Get a server entry.
+
+        Args:
+            index: Row index of the entry
+
+        Returns:
+            Tuple of (name, address, password, notes)
+        """
+        return self.names[index], self.addresses[index], self.passwords[index], self.notes[index]
+
+    def set_row(self, index: int, name: str, address: str, password: str, notes: str) -> None:
+        """Replace all fields of the server entry at index."""
+        self.names[index] = name
+        self.addresses[index] = address
+        self.passwords[index] = password
+        self.notes[index] = notes
+
+
 @dataclass
 class Settings:
     """Application settings"""
@@ -48,6 +99,12 @@ class Settings:
     backup_location: Optional[Path] = None
     auto_backup_on_launch: bool = False
     enable_deletion: bool = False
+    # Back up by hardlinking when the backup is on the same volume. Off by
+    # default: it is only safe if nothing writes into a save in place (an
+    # in-place write changes the "backup" too). The manager's own restores
+    # always copy to a temp file and rename it over the save, with or
+    # without this setting.
+    prefer_hardlinks: bool = False
     server_info: Optional[ServerInfo] = None
 
 
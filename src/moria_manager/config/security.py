@@ -62,21 +62,20 @@ def _get_cipher():
         return None
 
 
-def encrypt_password(plain_text: str) -> str:
-    """Encrypt a password for storage.
+def _encrypt_with(cipher, plain_text: str) -> str:
+    """Encrypt a password with an already-created cipher.
 
     Args:
+        cipher: Fernet cipher, or None if encryption is not available
         plain_text: The plain text password to encrypt
 
     Returns:
-        Base64-encoded encrypted string, or the original string if
-        encryption is not available. Encrypted strings are prefixed
-        with 'ENC:' to identify them.
+        'ENC:'-prefixed encrypted string, or the original string if
+        encryption is not available
     """
     if not plain_text:
         return ""
 
-    cipher = _get_cipher()
     if cipher is None:
         return plain_text
 
@@ -84,10 +83,43 @@ def encrypt_password(plain_text: str) -> str:
         encrypted = cipher.encrypt(plain_text.encode('utf-8'))
         return f"ENC:{encrypted.decode('utf-8')}"
     except (TypeError, ValueError, UnicodeError) as e:
-        logger.error(f"Failed to encrypt password: {e}")
+        logger.error("Failed to encrypt password: %s", e)
         return plain_text
 
 
+def encrypt_password(plain_text: str) -> str:
+    """Encrypt a password for storage.
+
+    Args:
+        plain_text: The plain text password to encrypt
+
+    Returns:
+        Base64-encoded encrypted string, or the original string if
+        encryption is not available. Encrypted strings are prefixed
+        with 'ENC:' to identify them.
+    """
+    if not plain_text:
+        return ""
+
+    return _encrypt_with(_get_cipher(), plain_text)
+
+
+def encrypt_password_many(plain_texts: list[str]) -> list[str]:
+    """Encrypt several passwords, deriving the key only once.
+
+    Args:
+        plain_texts: The plain text passwords to encrypt
+
+    Returns:
+        Encrypted strings in the same order, as returned by encrypt_password
+    """
+    if not any(plain_texts):
+        return ["" for _ in plain_texts]
+
+    cipher = _get_cipher()
+    return [_encrypt_with(cipher, text) for text in plain_texts]
+
+
 def decrypt_password(encrypted_text: str) -> str:
     """Decrypt a stored password.
 
@@ -117,7 +149,7 @@ def decrypt_password(encrypted_text: str) -> str:
         decrypted = cipher.decrypt(encrypted_data)
         return decrypted.decode('utf-8')
     except (TypeError, ValueError, UnicodeError) as e:
-        logger.error(f"Failed to decrypt password: {e}")
+        logger.error("Failed to decrypt password: %s", e)
         # Return empty string for security rather than the encrypted data
         return ""
 
@@ -1,5 +1,6 @@
 """Backup index management for tracking world/character backups."""
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -246,9 +247,20 @@ class BackupIndexManager:
         Returns:
             Number of stale entries removed
         """
+        return self.remove_entries(self.find_stale_entries())
+
+    def find_stale_entries(self) -> list[str]:
+        """Find index entries that cleanup_stale_entries would remove.
+
+        Only reads the filesystem and a snapshot of the entries, so it can
+        run on a worker thread while the index is in use elsewhere.
+
+        Returns:
+            Filenames of the stale entries
+        """
         stale_filenames = []
 
-        for filename, entry in self._entries.items():
+        for filename, entry in list(self._entries.items()):
             safe_name = self._sanitize_dirname(entry.display_name)
             item_dir = self.category_dir / safe_name
 
@@ -267,15 +279,27 @@ class BackupIndexManager:
             if not has_timestamps:
                 stale_filenames.append(filename)
 
-        # Remove stale entries
-        for filename in stale_filenames:
-            del self._entries[filename]
+        return stale_filenames
+
+    def remove_entries(self, filenames: list[str]) -> int:
+        """Remove entries from the index, saving it if anything changed.
+
+        Args:
+            filenames: Filenames of the entries to remove
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for filename in filenames:
+            if self._entries.pop(filename, None) is not None:
+                removed += 1
 
         # Save updated index if any entries were removed
-        if stale_filenames:
+        if removed:
             self._save_index()
 
-        return len(stale_filenames)
+        return removed
 
     def get_backup_timestamps(self, entry: BackupIndexEntry) -> list[Path]:
         """Get all backup timestamp directories for an entry.
@@ -311,7 +335,9 @@ class BackupIndexManager:
         Returns:
             List of Path objects for backup files
         """
-        if not timestamp_dir.exists():
+        # One scandir pass; DirEntry.is_file() uses the type from the listing
+        try:
+            with os.scandir(timestamp_dir) as it:
+                return [Path(e.path) for e in it if e.name.endswith(".sav") and e.is_file()]
+        except FileNotFoundError:
             return []
-
-        return [f for f in timestamp_dir.iterdir() if f.is_file() and f.suffix == ".sav"]
@@ -83,7 +83,7 @@ class WorldSaveInfo:
         name = self.file_path.name
         # Extract everything before the first '.'
         if '.' in name:
-            return name.split('.')[0]
+            return name.partition('.')[0]
         return name
 
 
@@ -148,7 +148,7 @@ class CharacterSaveInfo:
         name = self.file_path.name
         # Extract everything before the first '.'
         if '.' in name:
-            return name.split('.')[0]
+            return name.partition('.')[0]
         return name
 
     @property
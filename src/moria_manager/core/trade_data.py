@@ -4,6 +4,7 @@ The trade data is pre-parsed and embedded in trade_data_embedded.py,
 eliminating the need for the DT_OrderDecks.json file at runtime.
 """
 
+import sys
 from dataclasses import dataclass
 
 from .trade_data_embedded import MERCHANTS_DATA
@@ -30,6 +31,9 @@ class Merchant:
 def load_merchants() -> list[Merchant]:
     """Load the embedded merchant and order data.
 
+    Raw names are interned since they are used as dict keys throughout
+    the trade manager UI and config loading.
+
     Returns:
         List of Merchant objects with their orders
     """
@@ -37,11 +41,11 @@ def load_merchants() -> list[Merchant]:
 
     for raw_name, display_name, orders_data in MERCHANTS_DATA:
         orders = [
-            Order(raw_name=order_raw, display_name=order_display)
+            Order(raw_name=sys.intern(order_raw), display_name=order_display)
             for order_raw, order_display in orders_data
         ]
         merchants.append(Merchant(
-            raw_name=raw_name,
+            raw_name=sys.intern(raw_name),
             display_name=display_name,
             orders=orders
         ))
@@ -272,6 +272,29 @@ class ConfigDialog(ctk.CTkToplevel):
         )
         deletion_desc.pack(anchor="w", padx=(25, 0))
 
+        # Hardlink backups checkbox
+        hardlink_frame = ctk.CTkFrame(section, fg_color="transparent")
+        hardlink_frame.pack(fill="x", padx=PADDING["medium"], pady=PADDING["small"])
+
+        self.prefer_hardlinks_var = ctk.BooleanVar(
+            value=self.config_manager.config.settings.prefer_hardlinks
+        )
+        hardlink_cb = ctk.CTkCheckBox(
+            hardlink_frame,
+            text="Hardlink Backups",
+            variable=self.prefer_hardlinks_var,
+            font=FONTS["body"],
+        )
+        hardlink_cb.pack(anchor="w")
+
+        hardlink_desc = ctk.CTkLabel(
+            hardlink_frame,
+            text="Link instead of copy on the same drive; only safe if nothing edits saves in place",
+            font=FONTS["small"],
+            text_color="gray"
+        )
+        hardlink_desc.pack(anchor="w", padx=(25, 0))
+
     def _create_buttons(self, parent):
         """Create the dialog buttons."""
         button_frame = ctk.CTkFrame(parent, fg_color="transparent")
@@ -335,6 +358,9 @@ class ConfigDialog(ctk.CTkToplevel):
         # Update enable deletion setting
         self.config_manager.config.settings.enable_deletion = self.enable_deletion_var.get()
 
+        # Update hardlink backups setting
+        self.config_manager.config.settings.prefer_hardlinks = self.prefer_hardlinks_var.get()
+
         # Mark first run complete
         self.config_manager.config.settings.first_run_complete = True
 
@@ -1,9 +1,25 @@
 """Main application window with vertical tabs and split panes."""
 
+import ctypes
+import errno
+import functools
+import hashlib
 import json
+import os
+import queue
 import re
+import shutil
+import stat
+import sys
+import threading
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import tkinter as tk
+from tkinter import filedialog, ttk
 
 import customtkinter as ctk
 from PIL import Image, ImageTk, ImageEnhance, ImageDraw
@@ -22,8 +38,9 @@ except ImportError:
 from .. import __app_name__, __version__
 from ..assets.loader import get_asset_path
 from ..config.manager import ConfigurationManager
-from ..config.schema import Installation
-from ..config.security import decrypt_password, encrypt_password
+from ..config.path_validator import is_safe_path, is_path_under_root, sanitize_filename, validate_save_path
+from ..config.schema import Installation, ServerEntries
+from ..config.security import decrypt_password, encrypt_password_many
 from ..core.backup_index import BackupIndexManager, BackupIndexEntry
 from ..core.save_parser import (
     MoriaSaveParser, WorldWithVersions, CharacterWithVersions, SaveFileVersion
@@ -35,6 +52,16 @@ from .config_dialog import ConfigDialog
 from .styles import COLORS, FONTS, PADDING, WINDOW_SIZES
 
 
+_IS_WINDOWS = sys.platform == "win32"
+
+# Server list saves are debounced per installation: wait for a pause in typing,
+# but never hold edits back longer than the max wait
+_SERVER_SAVE_DELAY_MS = 1000
+_SERVER_SAVE_MAX_WAIT_MS = 5000
+
+# Separator for "merchant|order" lookup keys (ASCII unit separator, never in raw names)
+_TRADE_KEY_SEP = "\x1f"
+
 # Regex pattern to match Windows copy suffixes like " (2)", " (3)", etc.
 _WINDOWS_COPY_SUFFIX_PATTERN = re.compile(r" \(\d+\)$")
 
@@ -57,9 +84,466 @@ def _strip_windows_copy_suffix(filename: str) -> str:
         >>> _strip_windows_copy_suffix("MW_ABCD1234")
         'MW_ABCD1234'
     """
+    # Most names have no suffix; skip the regex unless one could be there
+    if not filename.endswith(")"):
+        return filename
     return _WINDOWS_COPY_SUFFIX_PATTERN.sub("", filename)
 
 
+# Right-pane list refreshes wait this long so a burst of selection clicks rebuilds once
+_VERSIONS_REFRESH_DELAY_MS = 60
+
+# Long lists create this many rows up front, then another batch each time the
+# view is scrolled past _LAZY_ROWS_THRESHOLD of the way down
+_LAZY_ROWS_BATCH = 40
+_LAZY_ROWS_THRESHOLD = 0.9
+
+# Icons created on row selection; decoded once at startup instead of on the first click
+_ROW_ACTION_ICONS = (
+    ("icons/trash.png", (16, 16)),
+    ("icons/trash.png", (18, 18)),
+    ("icons/mark_bad.png", (16, 16)),
+    ("icons/restore.png", (16, 16)),
+    ("icons/restore_green.png", (16, 16)),
+)
+
+# Characters that make a drop payload a real Tcl list (spaces, braces, quotes, escapes)
+_TCL_LIST_SPECIAL_CHARS = frozenset(' \t\n{}"\\')
+# Characters that stop the text of a single {braced} element from being literal
+_TCL_BRACED_SPECIAL_CHARS = frozenset('{}\n')
+
+# Import scan: the worker reports progress every N files; the Tk thread polls
+# its queue every N ms and handles at most N messages per poll
+_IMPORT_SCAN_PROGRESS_EVERY = 50
+_IMPORT_SCAN_POLL_MS = 50
+_IMPORT_SCAN_POLL_MAX = 500
+
+# Rows inserted into the import preview per event-loop turn
+_PREVIEW_INSERT_CHUNK = 200
+
+# Chunk size for buffered file copies (1 MiB)
+_COPY_BUFSIZE = 1024 * 1024
+
+
+def _copy_file_range(fsrc, fdst) -> bool:
+    """Copy an open file with os.copy_file_range (in-kernel, reflink-aware).
+
+    Returns:
+        True if the file was copied, False if copy_file_range is not
+        supported for these files and nothing was written
+    """
+    infd, outfd = fsrc.fileno(), fdst.fileno()
+    copied = 0
+    while True:
+        try:
+            sent = os.copy_file_range(infd, outfd, 1 << 30)
+        except OSError as e:
+            if copied == 0 and e.errno in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                return False
+            raise
+        if sent == 0:
+            return True
+        copied += sent
+
+
+def _copy_file_data(src, dst, buf: Optional[bytearray] = None) -> None:
+    """Copy a file's contents only (no timestamps or permissions).
+
+    Uses os.copy_file_range where the platform provides it, otherwise a
+    readinto loop over buf (a fresh 1 MiB buffer if not given), so callers
+    copying several files can share one buffer.
+    """
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+        if hasattr(os, "copy_file_range") and _copy_file_range(fsrc, fdst):
+            return
+        if buf is None:
+            buf = bytearray(_COPY_BUFSIZE)
+        view = memoryview(buf)
+        while n := fsrc.readinto(buf):
+            # Unbuffered writes may be short; write until the chunk is all out
+            written = 0
+            while written < n:
+                written += fdst.write(view[written:n])
+
+
+def _fastcopy(src, dst):
+    """Copy a file's data and metadata, as a drop-in for shutil.copy2.
+
+    On Windows the whole copy (timestamps and attributes included) is a
+    single CopyFileExW call. Also usable as copytree's copy_function.
+    """
+    if _IS_WINDOWS:
+        if not ctypes.windll.kernel32.CopyFileExW(os.fspath(src), os.fspath(dst), None, None, None, 0):
+            raise ctypes.WinError()
+        return dst
+
+    _copy_file_data(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _fastcopy_times(src, dst):
+    """Copy a file's data and timestamps only (no mode bits or xattrs).
+
+    For save copies that land in a fresh backup directory, where only the
+    modification time matters; skips copystat's chmod and xattr calls.
+    On Windows this is the same single CopyFileExW call as _fastcopy.
+    """
+    if _IS_WINDOWS:
+        return _fastcopy(src, dst)
+
+    _copy_file_data(src, dst)
+    st = os.stat(src)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    return dst
+
+
+def _replace_with_copy(src, dst, keep_path=None) -> None:
+    """Replace dst with a copy of src without ever leaving dst missing.
+
+    src is copied (as _fastcopy) to a hidden temp file next to dst and
+    then renamed over it. If the copy fails, dst is untouched. dst is
+    never written in place, so restoring over a save that is hardlinked
+    into a backup (Settings.prefer_hardlinks) leaves that backup as it was.
+
+    Args:
+        src: File to copy
+        dst: File to replace (it may not exist yet)
+        keep_path: Where to keep the replaced dst, or None to discard it.
+            It is renamed there, so no data is copied, and renamed back
+            if the new file can't be moved into place.
+    """
+    dst = os.fspath(dst)
+    dst_dir, dst_name = os.path.split(dst)
+    # Leading '.' keeps a leftover temp file from being listed as a save version
+    tmp_path = os.path.join(dst_dir, f".{dst_name}.restore-tmp")
+    try:
+        _fastcopy(src, tmp_path)
+        if keep_path is None:
+            os.replace(tmp_path, dst)
+            return
+
+        os.replace(dst, keep_path)
+        try:
+            os.replace(tmp_path, dst)
+        except OSError:
+            os.replace(keep_path, dst)
+            raise
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@functools.lru_cache(maxsize=256)
+def _file_digest(path: str, size: int, mtime_ns: int) -> bytes:
+    """Get a file's BLAKE2b content digest.
+
+    Cached on (path, size, mtime_ns), so an unchanged file is only hashed once
+    per session; size and mtime_ns only serve as the cache key.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    buf = bytearray(_COPY_BUFSIZE)
+    view = memoryview(buf)
+    with open(path, "rb", buffering=0) as f:
+        while n := f.readinto(buf):
+            digest.update(view[:n])
+    return digest.digest()
+
+
+def _same_file_content(a: Path, b: Path) -> bool:
+    """Check whether two files have identical contents (size first, then digest)."""
+    a_stat, b_stat = a.stat(), b.stat()
+    if a_stat.st_size != b_stat.st_size:
+        return False
+    return (_file_digest(str(a), a_stat.st_size, a_stat.st_mtime_ns)
+            == _file_digest(str(b), b_stat.st_size, b_stat.st_mtime_ns))
+
+
+def _extract_zip(zip_ref: zipfile.ZipFile, dest_dir: Path) -> None:
+    """Extract every member of a zip into dest_dir using 1 MiB copy chunks.
+
+    Like ZipFile.extractall, empty, "." and ".." path components are dropped,
+    and members that would still land outside dest_dir are skipped.
+    """
+    buf = bytearray(_COPY_BUFSIZE)
+    view = memoryview(buf)
+    made_dirs = set()
+
+    for info in zip_ref.infolist():
+        parts = [p for p in info.filename.replace("\\", "/").split("/") if p not in ("", ".", "..")]
+        if not parts:
+            continue
+        dest = dest_dir.joinpath(*parts)
+        if dest_dir not in dest.parents:
+            continue
+
+        target_dir = dest if info.is_dir() else dest.parent
+        if target_dir not in made_dirs:
+            target_dir.mkdir(parents=True, exist_ok=True)
+            made_dirs.add(target_dir)
+        if info.is_dir():
+            continue
+
+        with zip_ref.open(info) as src, open(dest, "wb") as dst:
+            while n := src.readinto(buf):
+                dst.write(view[:n])
+
+
+@functools.lru_cache(maxsize=64)
+def _load_icon_image(relative_path: str, size: tuple[int, int], /) -> Optional[ctk.CTkImage]:
+    """Load an icon as a CTkImage (cached; see MainWindow._load_icon).
+
+    Missing icons are cached as None too, so fallbacks don't re-stat the disk.
+    The PNG is decoded up front so the cached image doesn't hold the file open.
+    """
+    try:
+        icon_path = get_asset_path(relative_path)
+        if icon_path.exists():
+            with Image.open(icon_path) as icon_file:
+                image = icon_file.copy()
+            return ctk.CTkImage(light_image=image, dark_image=image, size=size)
+    except (OSError, IOError, ValueError) as e:
+        logger.debug("Could not load icon %s: %s", relative_path, e)
+    return None
+
+
+@functools.lru_cache(maxsize=512)
+def _backup_ts_name(when: datetime) -> str:
+    """Get the backup timestamp directory name (YYYY-MM-DD_HHMMSS) for a time.
+
+    Cached, since saves written together (a world and its characters, or
+    copies of the same save) share a modification time.
+    """
+    return when.strftime("%Y-%m-%d_%H%M%S")
+
+
+@functools.lru_cache(maxsize=2048)
+def _format_backup_ts(name: str) -> str:
+    """Format a backup timestamp directory name (YYYY-MM-DD_HHMMSS) for display.
+
+    Slices the fixed-width fields directly instead of a strptime/strftime
+    round trip. Names in any other format are returned unchanged. Cached,
+    since each name is formatted again on every refresh and selection.
+    """
+    digits = name[0:4] + name[5:7] + name[8:10] + name[11:17]
+    if (len(name) != 17 or name[4] != "-" or name[7] != "-" or name[10] != "_"
+            or not (digits.isascii() and digits.isdigit())):
+        return name
+    return f"{name[0:4]}-{name[5:7]}-{name[8:10]} {name[11:13]}:{name[13:15]}:{name[15:17]}"
+
+
+def _clear_readonly_tree(root) -> None:
+    """Make a directory tree writable so it can be deleted.
+
+    One scandir pass over the tree. On Windows only entries whose cached
+    attributes include FILE_ATTRIBUTE_READONLY are changed; elsewhere file
+    modes don't affect deletion, so only directories are made writable and
+    traversable. Entries that can't be changed are skipped; rmtree's
+    onerror handler retries those.
+    """
+    dir_mode = stat.S_IWRITE | stat.S_IREAD | stat.S_IEXEC
+    try:
+        os.chmod(root, dir_mode)
+    except OSError as e:
+        logger.debug("Could not clear read-only on %s: %s", root, e)
+
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.debug("Could not list %s: %s", e.filename, e)
+            continue
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False
+            try:
+                if _IS_WINDOWS:
+                    if entry.stat(follow_symlinks=False).st_file_attributes & stat.FILE_ATTRIBUTE_READONLY:
+                        os.chmod(entry.path, dir_mode if is_dir else stat.S_IWRITE | stat.S_IREAD)
+                elif is_dir:
+                    os.chmod(entry.path, dir_mode)
+            except OSError as e:
+                logger.debug("Could not clear read-only on %s: %s", entry.name, e)
+            if is_dir:
+                pending.append(entry.path)
+
+
+def _move_file(src, dst) -> None:
+    """Move a file by renaming it, copying only across volumes.
+
+    os.replace overwrites an existing dst in place; shutil.move would fall
+    back to copying the whole file there on Windows.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+
+def _iter_files(root):
+    """Yield a DirEntry for every non-directory below root, like os.walk's files.
+
+    Directories are visited top-down in listing order, each one's files
+    before its subdirectories; symlinked directories are not followed and
+    unreadable ones are skipped. The entries' cached type and (on Windows)
+    stat data save a syscall per file compared with os.walk + Path.stat.
+    """
+    pending = [os.fspath(root)]
+    while pending:
+        subdirs = []
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        subdirs.append(entry.path)
+                    else:
+                        yield entry
+        except OSError as e:
+            logger.debug("Could not list %s: %s", e.filename, e)
+        pending.extend(reversed(subdirs))
+
+
+# Files making up one packaged mod (the .pak and its IoStore companions)
+_MOD_FILE_EXTENSIONS = (".pak", ".ucas", ".utoc")
+
+
+def _find_mod_files(dir_path, mod_name: str) -> list[os.DirEntry]:
+    """Find the .pak/.ucas/.utoc files of a mod in one directory read.
+
+    One scandir pass replaces an exists() stat per extension; names are
+    compared case-insensitively. A missing directory has no files.
+    """
+    wanted = {f"{mod_name}{ext}".lower() for ext in _MOD_FILE_EXTENSIONS}
+    try:
+        with os.scandir(dir_path) as it:
+            return [entry for entry in it if entry.name.lower() in wanted and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+class _TradeConfigLoader:
+    """XMLParser target that applies saved trade state without building a tree.
+
+    Orders are looked up by "merchant\x1forder" key and updated in place as
+    their start tags are parsed.
+    """
+
+    def __init__(self, orders_by_key: dict):
+        self.orders_by_key = orders_by_key
+        self.merchants_with_checked: set[str] = set()
+        self._merchant_name = ""
+        self._merchant_prefix = _TRADE_KEY_SEP
+
+    def start(self, tag: str, attrib: dict):
+        if tag == "Order":
+            order = self.orders_by_key.get(self._merchant_prefix + attrib.get("name", ""))
+            if order is None:
+                return
+            order.checked = attrib.get("checked", "").lower() == "true"
+            try:
+                order.quantity = int(attrib.get("quantity", "0"))
+            except ValueError:
+                order.quantity = 0
+            if order.checked:
+                self.merchants_with_checked.add(self._merchant_name)
+        elif tag == "Merchant":
+            self._merchant_name = attrib.get("name", "")
+            self._merchant_prefix = self._merchant_name + _TRADE_KEY_SEP
+
+    def end(self, tag: str):
+        pass
+
+    def close(self):
+        return None
+
+
+class _SharedTooltip:
+    """A single hover tooltip window reused by every widget in the app."""
+
+    def __init__(self, master):
+        self.master = master
+        self._window: Optional[ctk.CTkToplevel] = None
+        self._label: Optional[ctk.CTkLabel] = None
+        self._owner = None
+        # Pending after() callbacks as (scheduling widget, after id); each must
+        # be cancelled on the widget that scheduled it
+        self._show_after = None
+        self._hide_after = None
+
+    def schedule_show(self, widget, text: str):
+        """Show text above widget after a short hover delay."""
+        # Hide any existing tooltip first
+        self.hide()
+        self._owner = widget
+        self._show_after = (widget, widget.after(200, lambda: self._show(widget, text)))
+
+    def _show(self, widget, text: str):
+        self._show_after = None
+        try:
+            if not widget.winfo_exists():
+                return
+
+            if self._window is None or not self._window.winfo_exists():
+                self._window = ctk.CTkToplevel(self.master)
+                self._window.withdraw()
+                self._window.wm_overrideredirect(True)
+                self._window.wm_attributes("-topmost", True)
+                self._label = ctk.CTkLabel(
+                    self._window, text="",
+                    font=FONTS["small"],
+                    fg_color=("gray90", "gray20"),
+                    corner_radius=4,
+                    padx=8, pady=4
+                )
+                self._label.pack()
+
+            # Position tooltip above the widget
+            self._label.configure(text=text)
+            self._window.wm_geometry(f"+{widget.winfo_rootx()}+{widget.winfo_rooty() - 30}")
+            self._window.deiconify()
+            self._window.lift()
+
+            # Auto-hide after 3 seconds as failsafe
+            self._hide_after = (self._window, self._window.after(3000, self.hide))
+        except (tk.TclError, RuntimeError):
+            pass  # Widget was destroyed
+
+    def hide(self, widget=None):
+        """Hide the tooltip; with widget given, only if that widget owns it."""
+        if widget is not None and widget is not self._owner:
+            return
+        self._owner = None
+
+        for pending in (self._show_after, self._hide_after):
+            if pending:
+                scheduler, after_id = pending
+                try:
+                    scheduler.after_cancel(after_id)
+                except (tk.TclError, RuntimeError):
+                    pass
+        self._show_after = None
+        self._hide_after = None
+
+        if self._window is not None:
+            try:
+                self._window.withdraw()
+            except (tk.TclError, RuntimeError):
+                pass  # Already destroyed
+
+
 class MainWindow(ctk.CTk):
     """Main application window with vertical tabs and split panes.
 
@@ -84,12 +568,23 @@ class MainWindow(ctk.CTk):
         # Data storage
         self.current_installation: Optional[Installation] = None
         self.current_view_type: str = "Worlds"  # "Worlds" or "Characters"
+        # Derived from current_view_type; updated in _on_view_type_changed
+        self._category_cache: str = "worlds"  # Backup index category
+        self._item_type_cache: str = "world"  # Singular noun for messages
         self.current_mode: str = "backup"  # "backup", "restore", or "mods"
         self.worlds_data: list[WorldWithVersions] = []
         self.characters_data: list[CharacterWithVersions] = []
         self.selected_item: Optional[WorldWithVersions | CharacterWithVersions] = None
         self.selected_version: Optional[SaveFileVersion] = None
         self.version_rows: dict[str, ctk.CTkFrame] = {}  # Track version rows for highlighting
+        self._selected_version_row: Optional[ctk.CTkFrame] = None  # Highlighted row in version_rows
+        # Highlighted installed-mod row (left pane; survives right-pane rebuilds)
+        self._selected_mod_row: Optional[ctk.CTkFrame] = None
+        self._pending_refresh: Optional[str] = None  # Debounced right-pane refresh (after id)
+        self._last_rendered_mode: Optional[str] = None  # Mode the pane headers were last laid out for
+        # Parsed backup indexes: (backup_root, category) -> (index mtime_ns, manager)
+        self._index_cache: dict[tuple[Path, str], tuple[Optional[int], BackupIndexManager]] = {}
+        self._restore_scan_generation = 0  # Bumped per restore list refresh; stale scans are dropped
 
         # Restore mode data
         self.restore_entries: list[BackupIndexEntry] = []
@@ -102,16 +597,49 @@ class MainWindow(ctk.CTk):
         self.selected_mod_item: Optional[Path] = None
         self.available_mods_items: list[Path] = []  # Files and directories in backup/mods
         self.selected_available_mod: Optional[Path] = None
-        self.available_mod_rows: dict[str, ctk.CTkFrame] = {}  # Track available mod rows for highlighting
-        # Internal game files to exclude from mods list
-        self._excluded_game_files = {
+        # Available mod rows (and whether each is a directory) for highlighting
+        self.available_mod_rows: dict[str, tuple[ctk.CTkFrame, bool]] = {}
+        # Action buttons built for a row the first time it is selected, then
+        # hidden/shown again on later selections (by row name)
+        self._available_mod_buttons: dict[str, list[tuple[ctk.CTkButton, int]]] = {}
+        self._selected_available_name: Optional[str] = None
+        # Normcased names in backup/mods, rebuilt by every _refresh_available_mods scan
+        self._mods_backup_names: set[str] = set()
+        # Paks directory mtime when mods_items was listed (None = list again)
+        self._paks_mtime_ns: Optional[int] = None
+        # Internal game files to exclude from mods list (lowercase; Windows names are case-insensitive)
+        self._excluded_game_files = frozenset(name.lower() for name in (
             "global.ucas", "global.utoc",
             "Moria-WindowsNoEditor.pak", "Moria-WindowsNoEditor.ucas", "Moria-WindowsNoEditor.utoc"
-        }
+        ))
 
         # Server list mode data
         self.server_password_visible = False
 
+        # Serial I/O: one worker, jobs run in submission order. Use it for work
+        # that must not overlap or reorder (mod imports, the import scan, the
+        # duplicate log). Queued jobs are cancelled on close.
+        self._serial_io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="moria-serial-io")
+        self._closing = threading.Event()
+        # Parallel I/O: independent file jobs (backup, restore, stale-entry scans, mod
+        # install, Import All) with no ordering between jobs; any index update
+        # happens in the done-callback on the Tk thread. Queued jobs still finish
+        # on close. Capped at 8 so Backup All doesn't thrash spinning disks.
+        self._parallel_io = ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="moria-parallel-io"
+        )
+        self._backup_in_progress = False
+        self._restore_in_progress = False
+        # Backup directories being removed by _rmtree_in_background (normcased)
+        self._deleting_backup_dirs: set[str] = set()
+        # Set while a mod install or any Available Mods task is running
+        self._install_in_progress = False
+
+        # Shared hover tooltip (created on first _create_tooltip call)
+        self._tooltip: Optional[_SharedTooltip] = None
+        # Closed modal dialogs kept for reuse, by layout (see _show_pooled_dialog)
+        self._dialog_pool: dict[str, list[dict]] = {}
+
         # Background image references
         self.bg_image_original: Optional[Image.Image] = None
         self.bg_image_tk: Optional[ImageTk.PhotoImage] = None
@@ -149,6 +677,9 @@ class MainWindow(ctk.CTk):
         # Select first tab if available
         self._select_first_tab()
 
+        # Warm the icon cache once the window has painted
+        self.after_idle(self._preload_icons)
+
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _set_app_icon(self):
@@ -829,27 +1360,44 @@ class MainWindow(ctk.CTk):
             "order": order
         }
 
-    def _on_quantity_change(self, merchant, order, qty_var, delta: int):
-        """Handle quantity up/down button click."""
+    @staticmethod
+    def _parse_quantity(text: str) -> int:
+        """Parse a quantity string, clamped to 0-9999 (invalid input is 0)."""
         try:
-            current = int(qty_var.get())
+            return max(0, min(9999, int(text)))
         except ValueError:
-            current = 0
+            return 0
+
+    def _on_quantity_change(self, merchant, order, qty_var, delta: int):
+        """Handle quantity up/down button click."""
+        text = qty_var.get()
+        new_val = max(0, min(9999, self._parse_quantity(text) + delta))
+
+        # Only write the variable (which fires Tk traces) if the text changes,
+        # e.g. not when clicking down at 0 or up at 9999
+        normalized = str(new_val)
+        if text != normalized:
+            qty_var.set(normalized)
+
+        if new_val == order.quantity:
+            return
 
-        new_val = max(0, min(9999, current + delta))
-        qty_var.set(str(new_val))
         order.quantity = new_val
         self._save_trade_config()
 
     def _on_quantity_entry(self, merchant, order, qty_var):
         """Handle quantity entry field change."""
-        try:
-            val = int(qty_var.get())
-            val = max(0, min(9999, val))
-        except ValueError:
-            val = 0
+        text = qty_var.get()
+        val = self._parse_quantity(text)
+
+        # Normalize the display only if the typed text differs (e.g. "007", "abc")
+        normalized = str(val)
+        if text != normalized:
+            qty_var.set(normalized)
+
+        if val == order.quantity:
+            return
 
-        qty_var.set(str(val))
         order.quantity = val
         self._save_trade_config()
 
@@ -913,10 +1461,6 @@ class MainWindow(ctk.CTk):
 
     def _save_trade_config(self):
         """Save trade manager checkbox state and quantity to XML file."""
-        import xml.etree.ElementTree as ET
-        from xml.dom import minidom
-        from ..config.paths import GamePaths
-
         GamePaths.ensure_config_dir()
 
         root = ET.Element("TradeManager", version="1.1")
@@ -934,56 +1478,37 @@ class MainWindow(ctk.CTk):
                     )
 
         # Write pretty-printed XML
-        xml_str = minidom.parseString(ET.tostring(root, encoding="unicode")).toprettyxml(indent="  ")
-        lines = [line for line in xml_str.split('\n') if line.strip()]
-        xml_str = '\n'.join(lines)
-
-        GamePaths.TRADE_CONFIG_FILE.write_text(xml_str, encoding="utf-8")
+        tree = ET.ElementTree(root)
+        ET.indent(tree, space="  ")
+        tree.write(GamePaths.TRADE_CONFIG_FILE, encoding="utf-8", xml_declaration=True)
 
     def _load_trade_config(self):
         """Load trade manager checkbox state and quantity from XML file."""
-        import xml.etree.ElementTree as ET
-        from ..config.paths import GamePaths
-
         if not GamePaths.TRADE_CONFIG_FILE.exists():
             return
 
-        try:
-            tree = ET.parse(GamePaths.TRADE_CONFIG_FILE)
-            root = tree.getroot()
-
-            # Build a dict of order data for fast lookup: (merchant, order) -> (checked, quantity)
-            order_data = {}
-            for merchant_elem in root.findall("Merchant"):
-                merchant_name = merchant_elem.get("name", "")
-                for order_elem in merchant_elem.findall("Order"):
-                    order_name = order_elem.get("name", "")
-                    checked = order_elem.get("checked", "").lower() == "true"
-                    try:
-                        quantity = int(order_elem.get("quantity", "0"))
-                    except ValueError:
-                        quantity = 0
-                    order_data[(merchant_name, order_name)] = (checked, quantity)
-
-            # Apply to current merchants
-            for merchant in self.trade_merchants:
-                has_checked = False
-                for order in merchant.orders:
-                    key = (merchant.raw_name, order.raw_name)
-                    if key in order_data:
-                        order.checked, order.quantity = order_data[key]
-                        if order.checked:
-                            has_checked = True
-                    else:
-                        order.checked = False
-                        order.quantity = 0
-                # Expand merchant only if it has at least one checked order
-                merchant.expanded = has_checked
+        # Index orders up front so saved state is applied straight from parser events
+        orders_by_key = {}
+        for merchant in self.trade_merchants:
+            merchant_prefix = merchant.raw_name + _TRADE_KEY_SEP
+            for order in merchant.orders:
+                order.checked = False
+                order.quantity = 0
+                orders_by_key[merchant_prefix + order.raw_name] = order
 
+        loader = _TradeConfigLoader(orders_by_key)
+        try:
+            parser = ET.XMLParser(target=loader)
+            parser.feed(GamePaths.TRADE_CONFIG_FILE.read_bytes())
+            parser.close()
         except (OSError, ET.ParseError, KeyError) as e:
             # If file is corrupted, just continue with defaults
             logger.debug("Could not load trade config: %s", e)
 
+        # Expand merchant only if it has at least one checked order
+        for merchant in self.trade_merchants:
+            merchant.expanded = merchant.raw_name in loader.merchants_with_checked
+
     def _create_world_list_pane(self):
         """Create the left pane showing world/character names and filenames."""
         self.world_pane = ctk.CTkFrame(self.content_frame, fg_color=("#3d3d3d", "#1a1a1a"))
@@ -1062,8 +1587,21 @@ class MainWindow(ctk.CTk):
         self._create_tooltip(self.backup_btn, "Backup")
 
         # Scrollable list
-        self.item_list_frame = ctk.CTkScrollableFrame(self.world_pane, fg_color=("#3d3d3d", "#1a1a1a"))
-        self.item_list_frame.pack(fill="both", expand=True, padx=PADDING["small"], pady=(0, PADDING["small"]))
+        self.item_list_frame = self._create_list_frame(self.world_pane)
+
+        # World/character rows currently shown, and hidden rows kept for reuse.
+        # The pool is keyed by has_main_file since those rows differ in border/tooltip.
+        self._item_rows: list[dict] = []
+        self._item_row_pool: dict[bool, list[dict]] = {True: [], False: []}
+        # Same for installed-mod rows, keyed by is_dir (icon and tooltip differ)
+        self._mod_rows: list[dict] = []
+        self._mod_row_pool: dict[bool, list[dict]] = {True: [], False: []}
+
+        # Restore-mode rows by Tk path name; each row and its labels share one
+        # click handler (no per-row closures) that looks the entry up here.
+        self._row_to_entry: dict[str, BackupIndexEntry] = {}
+        self._restore_entry_rows: dict[str, ctk.CTkFrame] = {}  # By entry filename
+        self._selected_row: Optional[ctk.CTkFrame] = None
 
         # Placeholder
         self.item_placeholder = ctk.CTkLabel(
@@ -1075,6 +1613,104 @@ class MainWindow(ctk.CTk):
         )
         self.item_placeholder.pack(pady=PADDING["large"])
 
+    @staticmethod
+    def _create_list_frame(parent) -> ctk.CTkScrollableFrame:
+        """Create and pack a pane's scrollable list (always the pane's last packed child)."""
+        list_frame = ctk.CTkScrollableFrame(parent, fg_color=("#3d3d3d", "#1a1a1a"))
+        list_frame.pack(fill="both", expand=True, padx=PADDING["small"], pady=(0, PADDING["small"]))
+        return list_frame
+
+    def _reset_item_list_frame(self):
+        """Replace the left list with an empty one.
+
+        Destroying the frame once is much cheaper than destroying every row
+        (each fires its own <Destroy> bindings and geometry pass).
+        """
+        self.item_list_frame.destroy()
+        self.item_list_frame = self._create_list_frame(self.world_pane)
+        # Pooled world/character rows went with the old frame
+        self._item_rows.clear()
+        for pool in self._item_row_pool.values():
+            pool.clear()
+        self._mod_rows.clear()
+        for pool in self._mod_row_pool.values():
+            pool.clear()
+        self._row_to_entry.clear()
+        self._restore_entry_rows.clear()
+        self._selected_row = None
+
+    def _render_rows_lazily(self, list_frame: ctk.CTkScrollableFrame, items: list, create_row):
+        """Create list rows a batch at a time as the list is scrolled.
+
+        Only the first batch is built up front; the scroll frame's canvas
+        reports its visible fraction through yscrollcommand, and each time
+        the view nears the end another batch is added. A first batch that
+        doesn't fill the pane triggers the next one the same way. Clearing
+        the rows (destroyed, or hidden back into a row pool) stops further
+        batches.
+
+        Args:
+            list_frame: Scrollable list the rows are created in
+            items: Items to show, in display order
+            create_row: Called with each item to create its row in list_frame;
+                may return the row (needed when rows come from a pool)
+        """
+        position = 0
+        last_row = None  # Newest row shown; gone or unpacked once the list is cleared
+
+        canvas = getattr(list_frame, "_parent_canvas", None)
+        scrollbar = getattr(list_frame, "_scrollbar", None)
+        if canvas is not None and scrollbar is not None:
+            # Drop the hook of an earlier list shown in this frame
+            canvas.configure(yscrollcommand=scrollbar.set)
+
+        def render_batch() -> bool:
+            nonlocal position, last_row
+            end = min(position + _LAZY_ROWS_BATCH, len(items))
+            for item in items[position:end]:
+                last_row = create_row(item)
+            position = end
+            if last_row is None:
+                last_row = list_frame.winfo_children()[-1]
+            return position < len(items)
+
+        if not render_batch():
+            return
+
+        if canvas is None or scrollbar is None:
+            # Unknown CTkScrollableFrame layout - just build everything
+            while render_batch():
+                pass
+            return
+
+        pending = False
+
+        def load_more():
+            nonlocal pending
+            pending = False
+            # The list may have been replaced or cleared by a refresh meanwhile
+            if not list_frame.winfo_exists():
+                return
+            if (not last_row.winfo_exists() or not last_row.winfo_manager()
+                    or not render_batch()):
+                canvas.configure(yscrollcommand=scrollbar.set)
+
+        def on_yscroll(first, last):
+            nonlocal pending
+            scrollbar.set(first, last)
+            if not pending and float(last) >= _LAZY_ROWS_THRESHOLD:
+                pending = True
+                list_frame.after_idle(load_more)
+
+        canvas.configure(yscrollcommand=on_yscroll)
+
+    def _reset_versions_list_frame(self):
+        """Replace the right list with an empty one (see _reset_item_list_frame)."""
+        self._selected_version_row = None
+        self.versions_list_frame.destroy()
+        self.versions_list_frame = self._create_list_frame(self.versions_pane)
+        self._register_versions_list_dnd()
+
     def _create_versions_pane(self):
         """Create the right pane showing file versions for selected world."""
         self.versions_pane = ctk.CTkFrame(self.content_frame, fg_color=("#3d3d3d", "#1a1a1a"))
@@ -1098,8 +1734,7 @@ class MainWindow(ctk.CTk):
         # Don't pack initially - only shown in mods mode
 
         # Scrollable list
-        self.versions_list_frame = ctk.CTkScrollableFrame(self.versions_pane, fg_color=("#3d3d3d", "#1a1a1a"))
-        self.versions_list_frame.pack(fill="both", expand=True, padx=PADDING["small"], pady=(0, PADDING["small"]))
+        self.versions_list_frame = self._create_list_frame(self.versions_pane)
 
         # Placeholder
         self.versions_placeholder = ctk.CTkLabel(
@@ -1122,8 +1757,14 @@ class MainWindow(ctk.CTk):
 
         # Data storage for server entries per installation
         # Key is installation id (e.g., "steam", "epic", "custom")
-        self.server_entries_by_install: dict[str, list[dict]] = {}
+        self.server_entries_by_install: dict[str, ServerEntries] = {}
         self.server_row_widgets: list[dict] = []
+        # Debounced saves per installation: install_id -> {"timer", "since", "rows"}
+        self._pending_server_saves: dict[str, dict] = {}
+        # Hash of the last saved/loaded entries per installation (skips redundant writes)
+        self._server_list_hash: dict[str, bytes] = {}
+        # File mtime (ns) when each list was last loaded/saved; None if the file was missing
+        self._server_list_mtime: dict[str, Optional[int]] = {}
 
         # Store references for the single server list content area
         self.server_list_frame: ctk.CTkScrollableFrame | None = None
@@ -1200,29 +1841,37 @@ class MainWindow(ctk.CTk):
 
         install_id = self.current_installation.id.value
 
-        # Load server data for this installation if not already loaded
-        if install_id not in self.server_entries_by_install:
-            self._load_server_list(install_id)
+        # Load server data for this installation (no-op if the file is unchanged)
+        self._load_server_list(install_id)
 
         # Rebuild the UI
         self._rebuild_server_list_current()
 
-    def _create_server_row(self, install_id: str, row_index: int, data: dict = None):
-        """Create a single server row with editable fields."""
-        if data is None:
-            data = {"name": "", "address": "", "password": "", "notes": ""}
+    def _create_server_row(self, install_id: str, row_index: int, data: tuple = ("", "", "", "")):
+        """Create a single server row with editable fields.
+
+        Args:
+            install_id: Installation the row belongs to
+            row_index: Index of the entry in the installation's ServerEntries
+            data: Tuple of (name, address, password, notes)
+        """
+        name, address, password, notes = data
 
         if not self.server_list_frame:
             return None
 
         row_frame = ctk.CTkFrame(self.server_list_frame, fg_color="transparent")
 
+        # Widget references - created up front so callbacks read the row's current
+        # install_id (rows are recycled across installations)
+        widgets = {"frame": row_frame, "install_id": install_id}
+
         # Name entry
         name_entry = ctk.CTkEntry(row_frame, font=FONTS["body"], height=28)
-        name_entry.insert(0, data.get("name", ""))
+        name_entry.insert(0, name)
         name_entry.grid(row=0, column=0, sticky="ew", padx=(PADDING["small"], 5), pady=2)
-        name_entry.bind("<FocusOut>", lambda e, iid=install_id, idx=row_index: self._on_server_field_change(iid, idx))
-        name_entry.bind("<KeyRelease>", lambda e, iid=install_id, idx=row_index: self._schedule_server_save(iid, idx))
+        name_entry.bind("<FocusOut>", lambda e, w=widgets, idx=row_index: self._on_server_field_change(w["install_id"], idx))
+        name_entry.bind("<KeyRelease>", lambda e, w=widgets, idx=row_index: self._schedule_server_save(w["install_id"], idx))
 
         # Address entry with copy button
         address_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
@@ -1230,10 +1879,10 @@ class MainWindow(ctk.CTk):
         address_frame.grid_columnconfigure(0, weight=1)
 
         address_entry = ctk.CTkEntry(address_frame, font=FONTS["body"], height=28)
-        address_entry.insert(0, data.get("address", ""))
+        address_entry.insert(0, address)
         address_entry.grid(row=0, column=0, sticky="ew")
-        address_entry.bind("<FocusOut>", lambda e, iid=install_id, idx=row_index: self._on_server_field_change(iid, idx))
-        address_entry.bind("<KeyRelease>", lambda e, iid=install_id, idx=row_index: self._schedule_server_save(iid, idx))
+        address_entry.bind("<FocusOut>", lambda e, w=widgets, idx=row_index: self._on_server_field_change(w["install_id"], idx))
+        address_entry.bind("<KeyRelease>", lambda e, w=widgets, idx=row_index: self._schedule_server_save(w["install_id"], idx))
 
         address_copy_btn = ctk.CTkButton(
             address_frame, text="\U0001F4CB", width=24, height=24,
@@ -1249,23 +1898,26 @@ class MainWindow(ctk.CTk):
         password_frame.grid_columnconfigure(0, weight=1)
 
         password_entry = ctk.CTkEntry(password_frame, font=FONTS["body"], height=28, show="*")
-        password_entry.insert(0, data.get("password", ""))
+        password_entry.insert(0, password)
         password_entry.grid(row=0, column=0, sticky="ew")
-        password_entry.bind("<FocusOut>", lambda e, iid=install_id, idx=row_index: self._on_server_field_change(iid, idx))
-        password_entry.bind("<KeyRelease>", lambda e, iid=install_id, idx=row_index: self._schedule_server_save(iid, idx))
+        password_entry.bind("<FocusOut>", lambda e, w=widgets, idx=row_index: self._on_server_field_change(w["install_id"], idx))
+        password_entry.bind("<KeyRelease>", lambda e, w=widgets, idx=row_index: self._schedule_server_save(w["install_id"], idx))
 
         # Store password visibility state per row
         password_visible = {"visible": False}
 
-        def toggle_password():
-            password_visible["visible"] = not password_visible["visible"]
-            if password_visible["visible"]:
+        def set_password_visible(visible: bool):
+            password_visible["visible"] = visible
+            if visible:
                 password_entry.configure(show="")
                 eye_btn.configure(text="\U0001F576")
             else:
                 password_entry.configure(show="*")
                 eye_btn.configure(text="\U0001F441")
 
+        def toggle_password():
+            set_password_visible(not password_visible["visible"])
+
         eye_btn = ctk.CTkButton(
             password_frame, text="\U0001F441", width=24, height=24,
             font=("Segoe UI", 10),
@@ -1284,17 +1936,17 @@ class MainWindow(ctk.CTk):
 
         # Notes entry
         notes_entry = ctk.CTkEntry(row_frame, font=FONTS["body"], height=28)
-        notes_entry.insert(0, data.get("notes", ""))
+        notes_entry.insert(0, notes)
         notes_entry.grid(row=0, column=3, sticky="ew", padx=5, pady=2)
-        notes_entry.bind("<FocusOut>", lambda e, iid=install_id, idx=row_index: self._on_server_field_change(iid, idx))
-        notes_entry.bind("<KeyRelease>", lambda e, iid=install_id, idx=row_index: self._schedule_server_save(iid, idx))
+        notes_entry.bind("<FocusOut>", lambda e, w=widgets, idx=row_index: self._on_server_field_change(w["install_id"], idx))
+        notes_entry.bind("<KeyRelease>", lambda e, w=widgets, idx=row_index: self._schedule_server_save(w["install_id"], idx))
 
         # Delete button
         delete_btn = ctk.CTkButton(
             row_frame, text="\u2717", width=28, height=24,
             font=("Segoe UI", 12),
             fg_color=COLORS["danger"], hover_color=COLORS["danger_hover"],
-            command=lambda iid=install_id, idx=row_index: self._delete_server_entry(iid, idx)
+            command=lambda w=widgets, idx=row_index: self._delete_server_entry(w["install_id"], idx)
         )
         delete_btn.grid(row=0, column=4, padx=5, pady=2)
         self._create_tooltip(delete_btn, "Delete server")
@@ -1309,26 +1961,35 @@ class MainWindow(ctk.CTk):
         row_frame.pack(fill="x", pady=1)
 
         # Store widget references
-        widgets = {
-            "frame": row_frame,
+        widgets.update({
             "name": name_entry,
             "address": address_entry,
             "password": password_entry,
             "notes": notes_entry,
-            "install_id": install_id,
-        }
+            "set_password_visible": set_password_visible,
+        })
 
         return widgets
 
+    def _update_server_row(self, widgets: dict, install_id: str, data: tuple):
+        """Overwrite an existing server row's fields with new data (row recycling)."""
+        widgets["install_id"] = install_id
+        for field, value in zip(("name", "address", "password", "notes"), data):
+            entry = widgets[field]
+            if entry.get() != value:
+                entry.delete(0, "end")
+                entry.insert(0, value)
+        # Never carry a revealed password over to a different entry
+        widgets["set_password_visible"](False)
+
     def _add_server_entry(self, install_id: str):
         """Add a new empty server entry row for a specific installation."""
         if install_id not in self.server_entries_by_install:
-            self.server_entries_by_install[install_id] = []
+            self.server_entries_by_install[install_id] = ServerEntries()
 
-        new_data = {"name": "", "address": "", "password": "", "notes": ""}
-        self.server_entries_by_install[install_id].append(new_data)
-        row_index = len(self.server_entries_by_install[install_id]) - 1
-        widgets = self._create_server_row(install_id, row_index, new_data)
+        entries = self.server_entries_by_install[install_id]
+        entries.append()
+        widgets = self._create_server_row(install_id, len(entries) - 1)
         if widgets:
             self.server_row_widgets.append(widgets)
         self._save_server_list(install_id)
@@ -1336,6 +1997,8 @@ class MainWindow(ctk.CTk):
     def _delete_server_entry(self, install_id: str, row_index: int):
         """Delete a server entry from a specific installation."""
         if install_id in self.server_entries_by_install:
+            # Capture unsaved edits before row indices shift
+            self._sync_pending_server_rows(install_id)
             entries = self.server_entries_by_install[install_id]
             if row_index < len(entries):
                 # Remove from data
@@ -1358,113 +2021,210 @@ class MainWindow(ctk.CTk):
         self._rebuild_server_list_for_install(self.current_installation.id.value)
 
     def _rebuild_server_list_for_install(self, install_id: str):
-        """Rebuild the server list UI for a specific installation."""
-        # Clear ALL existing widgets (single list frame now)
-        for widgets in self.server_row_widgets:
-            widgets["frame"].destroy()
-        self.server_row_widgets.clear()
-
-        # Recreate all rows for this installation
-        entries = self.server_entries_by_install.get(install_id, [])
-        for idx, data in enumerate(entries):
-            widgets = self._create_server_row(install_id, idx, data)
+        """Rebuild the server list UI for a specific installation.
+
+        Existing row widgets are reused in place; only the difference in row
+        count is created or destroyed.
+        """
+        # Capture unsaved edits before the rows are overwritten
+        for pending_id in list(self._pending_server_saves):
+            self._sync_pending_server_rows(pending_id)
+
+        entries = self.server_entries_by_install.get(install_id)
+        if entries is None:
+            entries = ServerEntries()
+        rows = self.server_row_widgets
+
+        # Destroy surplus trailing rows
+        while len(rows) > len(entries):
+            rows.pop()["frame"].destroy()
+
+        # Overwrite the rows we are keeping
+        for idx, widgets in enumerate(rows):
+            self._update_server_row(widgets, install_id, entries.row(idx))
+
+        # Create any rows still missing
+        for idx in range(len(rows), len(entries)):
+            widgets = self._create_server_row(install_id, idx, entries.row(idx))
             if widgets:
-                self.server_row_widgets.append(widgets)
+                rows.append(widgets)
+
+    def _sync_server_row(self, install_id: str, row_index: int):
+        """Copy a server row's widget values back into the entry data."""
+        entries = self.server_entries_by_install.get(install_id)
+        if entries is None or row_index >= len(entries):
+            return
+
+        # Find the widgets for this row by counting rows for this install_id
+        count = 0
+        for w in self.server_row_widgets:
+            if w.get("install_id") == install_id:
+                if count == row_index:
+                    entries.set_row(
+                        row_index,
+                        w["name"].get(),
+                        w["address"].get(),
+                        w["password"].get(),
+                        w["notes"].get(),
+                    )
+                    return
+                count += 1
 
     def _on_server_field_change(self, install_id: str, row_index: int):
         """Handle field change - update data and save."""
-        # Find the widgets for this install_id and row_index
-        for widgets in self.server_row_widgets:
-            if widgets.get("install_id") == install_id:
-                # Find the correct row by counting
-                entries = self.server_entries_by_install.get(install_id, [])
-                if row_index < len(entries):
-                    # Update the data from the widgets
-                    # We need to find the correct widget for this row
-                    count = 0
-                    for w in self.server_row_widgets:
-                        if w.get("install_id") == install_id:
-                            if count == row_index:
-                                entries[row_index] = {
-                                    "name": w["name"].get(),
-                                    "address": w["address"].get(),
-                                    "password": w["password"].get(),
-                                    "notes": w["notes"].get(),
-                                }
-                                break
-                            count += 1
-                break
-
-        self._save_server_list(install_id)
+        self._sync_server_row(install_id, row_index)
+        self._flush_server_save(install_id)
 
     def _schedule_server_save(self, install_id: str, row_index: int):
-        """Schedule a save after typing (debounced)."""
-        # Cancel any existing scheduled save
-        if hasattr(self, "_server_save_timer") and self._server_save_timer:
-            self.after_cancel(self._server_save_timer)
+        """Schedule a save after typing (debounced per installation).
 
-        # Schedule save after 1 second of no typing
-        self._server_save_timer = self.after(1000, lambda: self._on_server_field_change(install_id, row_index))
+        Each installation has its own timer, so edits to one list never cancel
+        another's pending save. Continuous typing still saves at least every
+        _SERVER_SAVE_MAX_WAIT_MS.
+        """
+        now = time.monotonic()
+        pending = self._pending_server_saves.get(install_id)
+        if pending is None:
+            pending = {"timer": None, "since": now, "rows": set()}
+            self._pending_server_saves[install_id] = pending
+        else:
+            self.after_cancel(pending["timer"])
+
+        pending["rows"].add(row_index)
+
+        waited_ms = (now - pending["since"]) * 1000
+        delay = max(0, min(_SERVER_SAVE_DELAY_MS, _SERVER_SAVE_MAX_WAIT_MS - waited_ms))
+        pending["timer"] = self.after(int(delay), lambda iid=install_id: self._flush_server_save(iid))
+
+    def _sync_pending_server_rows(self, install_id: str):
+        """Copy rows with pending edits into the entry data, leaving the save scheduled."""
+        pending = self._pending_server_saves.get(install_id)
+        if pending:
+            for row_index in pending["rows"]:
+                self._sync_server_row(install_id, row_index)
+            pending["rows"].clear()
+
+    def _flush_server_save(self, install_id: str):
+        """Sync pending edits for an installation and save its server list now."""
+        self._sync_pending_server_rows(install_id)
+        pending = self._pending_server_saves.pop(install_id, None)
+        if pending:
+            self.after_cancel(pending["timer"])
+        self._save_server_list(install_id)
 
-    def _get_server_list_path(self, install_id: str) -> Path:
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _get_server_list_path(install_id: str) -> Path:
         """Get the path to the serverinfo.xml file for a specific installation.
 
         Server info files are stored in %APPDATA%/MoriaManager/servers/
+        (created once when the server pane is built).
         """
-        server_dir = GamePaths.SERVER_INFO_DIR
-        server_dir.mkdir(parents=True, exist_ok=True)
         # Use installation-specific filename: serverinfo_steam.xml, serverinfo_epic.xml, etc.
-        return server_dir / f"serverinfo_{install_id}.xml"
+        return GamePaths.SERVER_INFO_DIR / f"serverinfo_{install_id}.xml"
+
+    @staticmethod
+    def _hash_server_entries(entries: ServerEntries) -> bytes:
+        """Hash server entries (plaintext passwords) to detect unchanged lists."""
+        payload = (entries.names, entries.addresses, entries.passwords, entries.notes)
+        return hashlib.blake2b(repr(payload).encode(), digest_size=8).digest()
 
     def _save_server_list(self, install_id: str):
-        """Save server list to XML file for a specific installation."""
-        import xml.etree.ElementTree as ET
-        from xml.dom import minidom
+        """Save server list to XML file for a specific installation.
 
-        root = ET.Element("ServerList", version="1.0", installation=install_id)
+        Skipped when the entries are unchanged since the last save or load.
+        """
+        entries = self.server_entries_by_install.get(install_id)
+        if entries is None:
+            entries = ServerEntries()
+        entries_hash = self._hash_server_entries(entries)
+        if self._server_list_hash.get(install_id) == entries_hash:
+            return
 
-        entries = self.server_entries_by_install.get(install_id, [])
-        for entry in entries:
+        # Encrypt all passwords in one pass so the key is derived once per save
+        passwords = encrypt_password_many(entries.passwords)
+
+        root = ET.Element("ServerList", version="1.0", installation=install_id)
+        for i in range(len(entries)):
             server_elem = ET.SubElement(root, "Server")
-            ET.SubElement(server_elem, "Name").text = entry.get("name", "")
-            ET.SubElement(server_elem, "Address").text = entry.get("address", "")
-            ET.SubElement(server_elem, "Password").text = encrypt_password(entry.get("password", ""))
-            ET.SubElement(server_elem, "Notes").text = entry.get("notes", "")
+            ET.SubElement(server_elem, "Name").text = entries.names[i]
+            ET.SubElement(server_elem, "Address").text = entries.addresses[i]
+            ET.SubElement(server_elem, "Password").text = passwords[i]
+            ET.SubElement(server_elem, "Notes").text = entries.notes[i]
 
         # Write pretty-printed XML
-        xml_str = minidom.parseString(ET.tostring(root, encoding="unicode")).toprettyxml(indent="  ")
-        lines = [line for line in xml_str.split('\n') if line.strip()]
-        xml_str = '\n'.join(lines)
+        tree = ET.ElementTree(root)
+        ET.indent(tree, space="  ")
 
+        # Write to a temp file and swap it in so a crash never leaves a partial list
         server_file = self._get_server_list_path(install_id)
-        server_file.write_text(xml_str, encoding="utf-8")
+        tmp_file = server_file.with_suffix(".xml.tmp")
+        try:
+            try:
+                f = open(tmp_file, "wb")
+            except FileNotFoundError:
+                # First save: create the server info directory only when needed
+                server_file.parent.mkdir(parents=True, exist_ok=True)
+                f = open(tmp_file, "wb")
+            with f:
+                tree.write(f, encoding="utf-8", xml_declaration=True)
+            os.replace(tmp_file, server_file)
+        except OSError as e:
+            logger.error("Failed to save server list (%s): %s", install_id, e)
+            self._set_status(f"Error saving server list ({install_id}): {e}")
+            return
+        self._server_list_hash[install_id] = entries_hash
+        self._server_list_mtime[install_id] = self._get_file_mtime_ns(server_file)
         self._set_status(f"Server list saved ({install_id})")
 
+    @staticmethod
+    def _get_file_mtime_ns(path: Path) -> Optional[int]:
+        """Get a file's modification time in nanoseconds, or None if it is missing."""
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
     def _load_server_list(self, install_id: str):
-        """Load server list from XML file for a specific installation."""
-        import xml.etree.ElementTree as ET
+        """Load server list from XML file for a specific installation.
+
+        Skipped when the list is already loaded and the file's mtime is
+        unchanged, or when the list has edits waiting to be saved.
+        """
+        server_file = self._get_server_list_path(install_id)
+        mtime = self._get_file_mtime_ns(server_file)
+        if install_id in self.server_entries_by_install:
+            if install_id in self._pending_server_saves:
+                return
+            if install_id in self._server_list_mtime and self._server_list_mtime[install_id] == mtime:
+                return
 
         if install_id not in self.server_entries_by_install:
-            self.server_entries_by_install[install_id] = []
+            self.server_entries_by_install[install_id] = ServerEntries()
         else:
             self.server_entries_by_install[install_id].clear()
+        entries = self.server_entries_by_install[install_id]
 
-        server_file = self._get_server_list_path(install_id)
-        if not server_file.exists():
+        self._server_list_hash.pop(install_id, None)
+        self._server_list_mtime[install_id] = mtime
+
+        if mtime is None:
             return
 
         try:
-            tree = ET.parse(server_file)
-            root = tree.getroot()
-
-            for server_elem in root.findall("Server"):
-                entry = {
-                    "name": self._get_elem_text(server_elem, "Name"),
-                    "address": self._get_elem_text(server_elem, "Address"),
-                    "password": decrypt_password(self._get_elem_text(server_elem, "Password")),
-                    "notes": self._get_elem_text(server_elem, "Notes"),
-                }
-                self.server_entries_by_install[install_id].append(entry)
+            # Stream <Server> elements and clear each once read
+            for _, server_elem in ET.iterparse(server_file, events=("end",)):
+                if server_elem.tag != "Server":
+                    continue
+                entries.append(
+                    self._get_elem_text(server_elem, "Name"),
+                    self._get_elem_text(server_elem, "Address"),
+                    decrypt_password(self._get_elem_text(server_elem, "Password")),
+                    self._get_elem_text(server_elem, "Notes"),
+                )
+                server_elem.clear()
+
+            self._server_list_hash[install_id] = self._hash_server_entries(entries)
 
         except (OSError, ET.ParseError, KeyError) as e:
             self._set_status(f"Error loading server list ({install_id}): {e}")
@@ -1497,16 +2257,23 @@ class MainWindow(ctk.CTk):
             self.versions_pane.dnd_bind('<<DragLeave>>', self._on_available_mods_drag_leave)
 
             # Also register the scrollable frame
-            self.versions_list_frame.drop_target_register(tkinterdnd2.DND_FILES)
-            self.versions_list_frame.dnd_bind('<<Drop>>', self._on_available_mods_drop)
-            self.versions_list_frame.dnd_bind('<<DragEnter>>', self._on_available_mods_drag_enter)
-            self.versions_list_frame.dnd_bind('<<DragLeave>>', self._on_available_mods_drag_leave)
+            self._register_versions_list_dnd()
 
         except (RuntimeError, tk.TclError, AttributeError) as e:
             # DnD setup failed, continue without it
             logger.warning("Drag-and-drop setup failed: %s", e)
             self._dnd_enabled = False
 
+    def _register_versions_list_dnd(self):
+        """Register the versions list frame as a drop target (redone when the frame is recreated)."""
+        if not self._dnd_enabled:
+            return
+
+        self.versions_list_frame.drop_target_register(tkinterdnd2.DND_FILES)
+        self.versions_list_frame.dnd_bind('<<Drop>>', self._on_available_mods_drop)
+        self.versions_list_frame.dnd_bind('<<DragEnter>>', self._on_available_mods_drag_enter)
+        self.versions_list_frame.dnd_bind('<<DragLeave>>', self._on_available_mods_drag_leave)
+
     def _on_available_mods_drag_enter(self, event):
         """Handle drag enter on Available Mods pane."""
         if self.current_mode == "mods":
@@ -1532,8 +2299,17 @@ class MainWindow(ctk.CTk):
         # The data comes as a Tcl list string
         try:
             files_str = event.data
-            # Parse the Tcl list format (handles spaces in paths with braces)
-            files = self.tk.splitlist(files_str)
+            if files_str and not _TCL_LIST_SPECIAL_CHARS.intersection(files_str):
+                # Single plain path - nothing for Tcl to split or unescape
+                files = [files_str]
+            elif (files_str[:1] == "{" and files_str[-1:] == "}" and files_str[-2:-1] != "\\"
+                    and not _TCL_BRACED_SPECIAL_CHARS.intersection(files_str[1:-1])):
+                # Single braced path - how Tcl quotes one with backslashes or
+                # spaces (every Windows path); braced text is taken literally
+                files = [files_str[1:-1]]
+            else:
+                # Parse the Tcl list format (handles spaces in paths with braces)
+                files = self.tk.splitlist(files_str)
         except (tk.TclError, ValueError) as e:
             logger.debug("Could not parse Tcl list, using raw data: %s", e)
             files = [event.data] if event.data else []
@@ -1544,18 +2320,88 @@ class MainWindow(ctk.CTk):
         self._import_dropped_mod_files(files)
         return event.action
 
+    @staticmethod
+    def _scan_existing_entries(directory: Path) -> dict[str, os.DirEntry]:
+        """Get the entries in a directory from a single scan, keyed by name.
+
+        Names are normcased so lookups match the filesystem's case
+        sensitivity. The DirEntry objects cache their file type, so callers
+        can branch on is_dir() without another stat.
+        """
+        with os.scandir(directory) as it:
+            return {os.path.normcase(entry.name): entry for entry in it}
+
     def _import_dropped_mod_files(self, files: list):
-        """Import dropped files/folders to the Available Mods directory."""
-        import shutil
-        import zipfile
-        from ..config.path_validator import is_safe_path, is_path_under_root, sanitize_filename
+        """Import dropped files/folders to the Available Mods directory.
+
+        The copying runs on the I/O worker so the window keeps repainting;
+        status updates and overwrite prompts are marshalled back to Tk.
+        """
+        self._set_status(f"Importing {len(files)} item(s)...")
+        future = self._serial_io.submit(self._do_import_mod_files, list(files))
+        future.add_done_callback(self._log_worker_error)
+
+    @staticmethod
+    def _log_worker_error(future):
+        """Log an exception that escaped an I/O worker job."""
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Background file operation failed: %s", future.exception())
+
+    def _post_to_main(self, func, *args):
+        """Queue func to run on the Tk thread (for worker threads and done-callbacks).
+
+        Dropped once the window is closing: a worker finishing after
+        _on_close must not touch the destroyed Tcl interpreter.
+        """
+        if self._closing.is_set():
+            return
+        try:
+            self.after(0, func, *args)
+        except (tk.TclError, RuntimeError):
+            # The window was destroyed between the check and the call
+            pass
+
+    def _post_status(self, message: str):
+        """Set the status bar text from a worker thread."""
+        self._post_to_main(self._set_status, message)
 
+    def _call_on_main_thread(self, func, *args):
+        """Run func on the Tk thread and wait for its result (for worker threads).
+
+        Raises:
+            RuntimeError: If the window closes before func runs
+        """
+        done = threading.Event()
+        result = {}
+
+        def run():
+            try:
+                result["value"] = func(*args)
+            except Exception as e:
+                result["error"] = e
+            finally:
+                done.set()
+
+        if self._closing.is_set():
+            raise RuntimeError("Window closed while waiting for the UI thread")
+        self._post_to_main(run)
+        while not done.wait(0.1):
+            if self._closing.is_set():
+                raise RuntimeError("Window closed while waiting for the UI thread")
+        if "error" in result:
+            raise result["error"]
+        return result["value"]
+
+    def _do_import_mod_files(self, files: list):
+        """Copy dropped files/folders into Available Mods (runs on the I/O worker)."""
         backup_root = (
             self.config_manager.config.settings.backup_location
             or GamePaths.BACKUP_DEFAULT
         )
         mods_backup_path = backup_root / "mods"
         mods_backup_path.mkdir(parents=True, exist_ok=True)
+        # Resolve the root once; each destination then needs a single resolve
+        backup_root_resolved = backup_root.resolve()
 
         imported_count = 0
         skipped_count = 0
@@ -1570,9 +2416,13 @@ class MainWindow(ctk.CTk):
             safe_name = sanitize_filename(source_path.name)
             dest_path = mods_backup_path / safe_name
 
-            # Validate destination path is safe and under backup root
-            if not is_safe_path(dest_path, allowed_roots=[backup_root]) or not is_path_under_root(dest_path, backup_root):
-                self._set_status(f"Skipped: Invalid destination path for '{source_path.name}'")
+            # Validate destination path is under backup root
+            try:
+                dest_ok = dest_path.resolve().is_relative_to(backup_root_resolved)
+            except (OSError, ValueError):
+                dest_ok = False
+            if not dest_ok:
+                self._post_status(f"Skipped: Invalid destination path for '{source_path.name}'")
                 skipped_count += 1
                 continue
 
@@ -1581,7 +2431,8 @@ class MainWindow(ctk.CTk):
                     # Copy directory
                     if dest_path.exists():
                         # Ask to overwrite
-                        choice = self._show_overwrite_skip_dialog(
+                        choice = self._call_on_main_thread(
+                            self._show_overwrite_skip_dialog,
                             "Folder Exists",
                             f"The folder '{source_path.name}' already exists in Available Mods.\n\nOverwrite?"
                         )
@@ -1590,7 +2441,7 @@ class MainWindow(ctk.CTk):
                             continue
                         shutil.rmtree(str(dest_path))
 
-                    shutil.copytree(str(source_path), str(dest_path))
+                    shutil.copytree(str(source_path), str(dest_path), copy_function=_fastcopy)
                     imported_count += 1
 
                 elif source_path.is_file() and source_path.suffix.lower() == ".zip":
@@ -1607,18 +2458,19 @@ class MainWindow(ctk.CTk):
                                 if top_item:
                                     top_level_items.add(top_item)
 
-                            # Check for existing files/folders
-                            existing_items = []
-                            for item in top_level_items:
-                                check_path = mods_backup_path / item
-                                if check_path.exists():
-                                    existing_items.append(item)
+                            # Check for existing files/folders (one directory scan, not a stat per item)
+                            existing_entries = self._scan_existing_entries(mods_backup_path)
+                            existing_items = [
+                                item for item in top_level_items
+                                if os.path.normcase(item) in existing_entries
+                            ]
 
                             if existing_items:
                                 items_str = ", ".join(existing_items[:3])
                                 if len(existing_items) > 3:
                                     items_str += f" (+{len(existing_items) - 3} more)"
-                                choice = self._show_overwrite_skip_dialog(
+                                choice = self._call_on_main_thread(
+                                    self._show_overwrite_skip_dialog,
                                     "Items Exist",
                                     f"Some items from '{source_path.name}' already exist:\n{items_str}\n\nOverwrite?"
                                 )
@@ -1628,31 +2480,34 @@ class MainWindow(ctk.CTk):
 
                                 # Remove existing items
                                 for item in existing_items:
-                                    item_path = mods_backup_path / item
-                                    if item_path.is_dir():
-                                        shutil.rmtree(str(item_path))
-                                    elif item_path.is_file():
-                                        item_path.unlink()
+                                    entry = existing_entries[os.path.normcase(item)]
+                                    if entry.is_dir(follow_symlinks=False):
+                                        shutil.rmtree(entry.path)
+                                    else:
+                                        os.unlink(entry.path)
 
                             # Extract zip contents
-                            zip_ref.extractall(str(mods_backup_path))
+                            _extract_zip(zip_ref, mods_backup_path)
                             imported_count += 1
-                            self._set_status(f"Extracted '{source_path.name}' to Available Mods")
+                            self._post_status(f"Extracted '{source_path.name}' to Available Mods")
 
                     except zipfile.BadZipFile:
-                        self._set_status(f"Error: '{source_path.name}' is not a valid zip file")
+                        self._post_status(f"Error: '{source_path.name}' is not a valid zip file")
                         continue
 
                 elif source_path.is_file() and source_path.suffix.lower() == ".pak":
                     # For .pak files, copy all 3 related files
                     mod_name = source_path.stem
                     source_dir = source_path.parent
-                    extensions = [".pak", ".ucas", ".utoc"]
 
                     # Check if any exist
-                    any_exist = any((mods_backup_path / f"{mod_name}{ext}").exists() for ext in extensions)
+                    existing_entries = self._scan_existing_entries(mods_backup_path)
+                    any_exist = any(
+                        os.path.normcase(f"{mod_name}{ext}") in existing_entries for ext in _MOD_FILE_EXTENSIONS
+                    )
                     if any_exist:
-                        choice = self._show_overwrite_skip_dialog(
+                        choice = self._call_on_main_thread(
+                            self._show_overwrite_skip_dialog,
                             "Mod Exists",
                             f"The mod '{mod_name}' already exists in Available Mods.\n\nOverwrite?"
                         )
@@ -1660,13 +2515,12 @@ class MainWindow(ctk.CTk):
                             skipped_count += 1
                             continue
 
+                    # One buffer for the whole triple; mod files don't need metadata preserved
+                    copy_buf = bytearray(_COPY_BUFSIZE)
                     copied = 0
-                    for ext in extensions:
-                        src_file = source_dir / f"{mod_name}{ext}"
-                        if src_file.exists():
-                            dest_file = mods_backup_path / src_file.name
-                            shutil.copy2(str(src_file), str(dest_file))
-                            copied += 1
+                    for src_file in _find_mod_files(source_dir, mod_name):
+                        _copy_file_data(src_file.path, mods_backup_path / src_file.name, copy_buf)
+                        copied += 1
 
                     if copied > 0:
                         imported_count += 1
@@ -1674,7 +2528,8 @@ class MainWindow(ctk.CTk):
                 elif source_path.is_file():
                     # Copy single file
                     if dest_path.exists():
-                        choice = self._show_overwrite_skip_dialog(
+                        choice = self._call_on_main_thread(
+                            self._show_overwrite_skip_dialog,
                             "File Exists",
                             f"The file '{source_path.name}' already exists in Available Mods.\n\nOverwrite?"
                         )
@@ -1682,23 +2537,23 @@ class MainWindow(ctk.CTk):
                             skipped_count += 1
                             continue
 
-                    shutil.copy2(str(source_path), str(dest_path))
+                    _fastcopy(source_path, dest_path)
                     imported_count += 1
 
             except (OSError, IOError, shutil.Error, zipfile.BadZipFile) as e:
-                self._set_status(f"Error importing {source_path.name}: {e}")
+                self._post_status(f"Error importing {source_path.name}: {e}")
 
         # Refresh and report
-        self._refresh_available_mods()
+        self._post_to_main(self._refresh_available_mods)
 
         if imported_count > 0 and skipped_count > 0:
-            self._set_status(f"Imported {imported_count} mod(s), skipped {skipped_count}")
+            self._post_status(f"Imported {imported_count} mod(s), skipped {skipped_count}")
         elif imported_count > 0:
-            self._set_status(f"Imported {imported_count} mod(s) to Available Mods")
+            self._post_status(f"Imported {imported_count} mod(s) to Available Mods")
         elif skipped_count > 0:
-            self._set_status(f"Skipped {skipped_count} mod(s) (already exist)")
+            self._post_status(f"Skipped {skipped_count} mod(s) (already exist)")
         else:
-            self._set_status("No mods imported")
+            self._post_status("No mods imported")
 
     def _create_status_bar(self):
         """Create the bottom status bar with semi-transparent dark appearance."""
@@ -1762,6 +2617,8 @@ class MainWindow(ctk.CTk):
     def _on_view_type_changed(self, choice: str):
         """Handle dropdown change between Worlds and Characters."""
         self.current_view_type = choice
+        self._category_cache = "worlds" if choice == "Worlds" else "characters"
+        self._item_type_cache = "world" if choice == "Worlds" else "character"
         self.selected_item = None
         self.selected_restore_entry = None
 
@@ -1779,13 +2636,13 @@ class MainWindow(ctk.CTk):
         elif self.current_mode == "restore":
             self._refresh_restore_list()
         elif self.current_mode == "mods":
+            self._paks_mtime_ns = None
             self._refresh_mods_list()
 
     def _refresh_item_list(self):
         """Refresh the world/character list for the current installation."""
-        # Clear existing items
-        for widget in self.item_list_frame.winfo_children():
-            widget.destroy()
+        # Clear existing items (rows are kept hidden for reuse)
+        self._recycle_item_rows()
 
         if not self.current_installation or not self.current_installation.save_path:
             self.item_placeholder = ctk.CTkLabel(
@@ -1834,83 +2691,141 @@ class MainWindow(ctk.CTk):
             self._update_backup_button_states()
             return
 
-        # Create row for each item
+        # Create row for each item (trash icon looked up once for all rows)
+        trash_image = self._get_row_trash_icon()
         for item in items:
-            self._create_item_row(item)
+            self._create_item_row(item, trash_image)
 
         # Update button states after loading items
         self._update_backup_button_states()
 
-    def _create_item_row(self, item: WorldWithVersions | CharacterWithVersions):
-        """Create a clickable row for a world or character."""
-        # Check if this world/character has a main .sav file
-        has_main_file = item.main_file is not None
+    def _recycle_item_rows(self):
+        """Hide the shown world/character rows in the pool and destroy other children.
+
+        Other modes share item_list_frame and destroy all of its children, so
+        pooled rows that no longer exist are dropped here.
+        """
+        for row in self._item_rows:
+            self._item_row_pool[row["has_main_file"]].append(row)
+        self._item_rows.clear()
+
+        pooled_frames = set()
+        for pool in self._item_row_pool.values():
+            pool[:] = [row for row in pool if row["frame"].winfo_exists()]
+            for row in pool:
+                row["frame"].pack_forget()
+                pooled_frames.add(row["frame"])
+
+        for widget in self.item_list_frame.winfo_children():
+            if widget not in pooled_frames:
+                widget.destroy()
 
+    def _build_item_row(self, has_main_file: bool) -> dict:
+        """Create the widgets for a world/character row (not yet packed).
+
+        Callbacks read row["item"], so the row can be reused for other items.
+        """
         # Yellow border for items without a .sav file
         if not has_main_file:
-            row = ctk.CTkFrame(
+            frame = ctk.CTkFrame(
                 self.item_list_frame,
                 cursor="hand2",
                 border_width=2,
                 border_color=COLORS["warning"]
             )
         else:
-            row = ctk.CTkFrame(self.item_list_frame, cursor="hand2")
-        row.pack(fill="x", pady=2)
+            frame = ctk.CTkFrame(self.item_list_frame, cursor="hand2")
+
+        row = {
+            "frame": frame,
+            "has_main_file": has_main_file,
+            "fg_color": frame.cget("fg_color"),
+            "item": None,
+            "trash": None,
+        }
 
         # Add tooltip for items without main SAV file
         if not has_main_file:
-            self._create_tooltip(row, "This file has no main SAV file")
+            self._create_tooltip(frame, "This file has no main SAV file")
 
         # Make the whole row clickable
-        row.bind("<Button-1>", lambda e, i=item: self._on_item_selected(i))
+        frame.bind("<Button-1>", lambda e, r=row: self._on_item_selected(r["item"]))
 
         # Display name (world_name for worlds, display_name for characters)
-        if isinstance(item, WorldWithVersions):
-            display_name = item.world_name
-        else:
-            display_name = item.display_name
-
-        name_label = ctk.CTkLabel(row, text=display_name, font=FONTS["body"], anchor="w")
+        name_label = ctk.CTkLabel(frame, text="", font=FONTS["body"], anchor="w")
         name_label.pack(fill="x", padx=PADDING["small"], pady=(PADDING["small"], 0))
-        name_label.bind("<Button-1>", lambda e, i=item: self._on_item_selected(i))
+        name_label.bind("<Button-1>", lambda e, r=row: self._on_item_selected(r["item"]))
 
         # Filename (smaller, gray)
         filename_label = ctk.CTkLabel(
-            row, text=item.base_name,
+            frame, text="",
             font=FONTS["small"], text_color="gray", anchor="w"
         )
         filename_label.pack(fill="x", padx=PADDING["small"], pady=(0, PADDING["small"]))
-        filename_label.bind("<Button-1>", lambda e, i=item: self._on_item_selected(i))
+        filename_label.bind("<Button-1>", lambda e, r=row: self._on_item_selected(r["item"]))
 
-        # Version count badge - position depends on whether trash icon is shown
-        version_count = len(item.versions)
-        badge_x_offset = -PADDING["small"]
+        # Version count badge
+        badge = ctk.CTkLabel(frame, text="", font=FONTS["small"], text_color="gray")
+        badge.bind("<Button-1>", lambda e, r=row: self._on_item_selected(r["item"]))
 
-        # Add trash icon if deletion is enabled
-        if self.config_manager.config.settings.enable_deletion:
-            trash_image = self._load_icon("icons/trash.png", size=(18, 18))
-            if trash_image:
-                trash_btn = ctk.CTkButton(
-                    row,
-                    image=trash_image,
-                    text="",
-                    width=24,
-                    height=24,
+        row.update({"name": name_label, "filename": filename_label, "badge": badge})
+        return row
+
+    def _create_item_row(
+        self,
+        item: WorldWithVersions | CharacterWithVersions,
+        trash_image: Optional[ctk.CTkImage] = None,
+    ):
+        """Show a clickable row for a world or character, reusing a pooled row if possible.
+
+        Args:
+            item: World or character to show
+            trash_image: Delete icon from _get_row_trash_icon, or None for no delete button
+        """
+        # Check if this world/character has a main .sav file
+        has_main_file = item.main_file is not None
+
+        pool = self._item_row_pool[has_main_file]
+        row = pool.pop() if pool else self._build_item_row(has_main_file)
+        row["item"] = item
+        row["frame"].configure(fg_color=row["fg_color"])
+
+        # Display name (world_name for worlds, display_name for characters)
+        if isinstance(item, WorldWithVersions):
+            display_name = item.world_name
+        else:
+            display_name = item.display_name
+
+        row["name"].configure(text=display_name)
+        row["filename"].configure(text=item.base_name)
+
+        # Version count badge - position depends on whether trash icon is shown
+        badge_x_offset = -PADDING["small"]
+
+        # Add trash icon if deletion is enabled
+        if trash_image:
+            if row["trash"] is None:
+                row["trash"] = ctk.CTkButton(
+                    row["frame"],
+                    image=trash_image,
+                    text="",
+                    width=24,
+                    height=24,
                     fg_color="transparent",
                     hover_color=("#ffcccc", "#4a1a1a"),
-                    command=lambda i=item: self._prompt_delete_world(i)
+                    command=lambda r=row: self._prompt_delete_world(r["item"])
                 )
-                trash_btn.place(relx=1.0, rely=0.5, anchor="e", x=-PADDING["small"])
-                self._create_tooltip(trash_btn, "Delete All")
-                badge_x_offset = -PADDING["small"] - 28  # Move badge left to make room for trash icon
+                self._create_tooltip(row["trash"], "Delete All")
+            row["trash"].place(relx=1.0, rely=0.5, anchor="e", x=-PADDING["small"])
+            badge_x_offset = -PADDING["small"] - 28  # Move badge left to make room for trash icon
+        elif row["trash"] is not None:
+            row["trash"].place_forget()
 
-        badge = ctk.CTkLabel(
-            row, text=f"{version_count} files",
-            font=FONTS["small"], text_color="gray"
-        )
-        badge.place(relx=1.0, rely=0.5, anchor="e", x=badge_x_offset)
-        badge.bind("<Button-1>", lambda e, i=item: self._on_item_selected(i))
+        row["badge"].configure(text=f"{len(item.versions)} files")
+        row["badge"].place(relx=1.0, rely=0.5, anchor="e", x=badge_x_offset)
+
+        row["frame"].pack(fill="x", pady=2)
+        self._item_rows.append(row)
 
     def _on_item_selected(self, item: WorldWithVersions | CharacterWithVersions):
         """Handle world/character selection."""
@@ -1923,12 +2838,9 @@ class MainWindow(ctk.CTk):
             display_name = item.display_name
 
         # Highlight selected item (update background colors)
-        for widget in self.item_list_frame.winfo_children():
-            if isinstance(widget, ctk.CTkFrame):
-                is_selected = (widget.winfo_children() and
-                               widget.winfo_children()[0].cget("text") == display_name)
-                widget.configure(fg_color=("gray85", "gray25") if is_selected
-                               else ("gray95", "gray17"))
+        for row in self._item_rows:
+            row["frame"].configure(fg_color=("gray85", "gray25") if row["item"] is item
+                                   else ("gray95", "gray17"))
 
         # Update button states
         self._update_backup_button_states()
@@ -1956,15 +2868,32 @@ class MainWindow(ctk.CTk):
         self.selected_item = None
         self._refresh_versions_list()
 
+    def _schedule_versions_pane_refresh(self, refresh):
+        """Run a right-pane refresh shortly, replacing any refresh already pending."""
+        if self._pending_refresh:
+            self.after_cancel(self._pending_refresh)
+        self._pending_refresh = self.after(_VERSIONS_REFRESH_DELAY_MS, lambda: self._run_versions_pane_refresh(refresh))
+
+    def _run_versions_pane_refresh(self, refresh):
+        self._pending_refresh = None
+        refresh()
+
     def _refresh_versions_list(self):
-        """Refresh the file versions list for the selected world/character."""
+        """Refresh the file versions list for the selected world/character (debounced)."""
+        self._schedule_versions_pane_refresh(self._do_refresh_versions_list)
+
+    def _do_refresh_versions_list(self):
+        """Rebuild the file versions list for the selected world/character."""
+        # The pane may have switched to another mode while this was pending
+        if self.current_mode != "backup":
+            return
+
         # Clear existing items and tracking
-        for widget in self.versions_list_frame.winfo_children():
-            widget.destroy()
+        self._reset_versions_list_frame()
         self.version_rows.clear()
         self.selected_version = None
 
-        item_type = "world" if self.current_view_type == "Worlds" else "character"
+        item_type = self._item_type_cache
 
         if not self.selected_item:
             self.versions_placeholder = ctk.CTkLabel(
@@ -1998,17 +2927,19 @@ class MainWindow(ctk.CTk):
         sorted_versions.extend(self.selected_item.backup_files)
 
         # Add any "bad" or other files that aren't already included
+        # (tracked by identity - the versions above are the same objects)
+        seen = {id(version) for version in sorted_versions}
         for version in self.selected_item.versions:
-            if version not in sorted_versions:
+            if id(version) not in seen:
                 sorted_versions.append(version)
+                seen.add(id(version))
 
         # Create row for each version
-        for version in sorted_versions:
-            self._create_version_row(version)
+        self._render_rows_lazily(self.versions_list_frame, sorted_versions, self._create_version_row)
 
     def _create_version_row(self, version: SaveFileVersion):
         """Create a clickable row for a file version with restore button."""
-        row = ctk.CTkFrame(self.versions_list_frame, cursor="hand2")
+        row = ctk.CTkFrame(self.versions_list_frame, cursor="hand2", fg_color=("gray95", "gray17"))
         row.pack(fill="x", pady=1)
 
         # Store reference for highlighting
@@ -2025,6 +2956,32 @@ class MainWindow(ctk.CTk):
         name_label.pack(side="left", fill="x", expand=True, padx=PADDING["small"], pady=PADDING["small"])
         name_label.bind("<Button-1>", lambda e, v=version: self._on_version_selected(v))
 
+    def _select_version_row(self, key: str) -> Optional[ctk.CTkFrame]:
+        """Highlight the right-pane row for key and clear the previous one.
+
+        Args:
+            key: version_rows key (version filename or timestamp dir name)
+
+        Returns:
+            The newly selected row, or None if it hasn't been created
+        """
+        self._unselect_row(self._selected_version_row)
+
+        row = self.version_rows.get(key)
+        if row is not None:
+            row.configure(fg_color=("gray85", "gray25"))
+        self._selected_version_row = row
+        return row
+
+    @staticmethod
+    def _unselect_row(row: Optional[ctk.CTkFrame]):
+        """Remove a selected row's highlight and its action buttons."""
+        if row is not None and row.winfo_exists():
+            for child in row.winfo_children():
+                if isinstance(child, ctk.CTkButton):
+                    child.destroy()
+            row.configure(fg_color=("gray95", "gray17"))
+
     def _on_version_selected(self, version: SaveFileVersion):
         """Handle version selection - highlight and show restore/mark bad/delete buttons."""
         self.selected_version = version
@@ -2032,98 +2989,88 @@ class MainWindow(ctk.CTk):
         # Check if there's a main .sav file for this item
         has_main_file = self.selected_item and self.selected_item.main_file is not None
 
-        # Update highlighting on all rows
-        for filename, row in self.version_rows.items():
-            # Remove old buttons if present
-            for child in row.winfo_children():
-                if isinstance(child, ctk.CTkButton):
-                    child.destroy()
-
-            is_selected = (filename == version.filename)
-            row.configure(fg_color=("gray85", "gray25") if is_selected else ("gray95", "gray17"))
-
-            if is_selected:
-                # Add delete button if deletion is enabled (for any file type)
-                if self.config_manager.config.settings.enable_deletion:
-                    trash_image = self._load_icon("icons/trash.png", size=(16, 16))
-                    if trash_image:
-                        delete_btn = ctk.CTkButton(
-                            row, image=trash_image, text="", width=24, height=24,
-                            fg_color="transparent", hover_color=("#ffcccc", "#4a1a1a"),
-                            command=lambda v=version: self._prompt_delete_single_file(v)
-                        )
-                    else:
-                        delete_btn = ctk.CTkButton(
-                            row, text="🗑", width=24, height=24,
-                            font=FONTS["small"], text_color="red",
-                            fg_color="transparent", hover_color=("#ffcccc", "#4a1a1a"),
-                            command=lambda v=version: self._prompt_delete_single_file(v)
-                        )
-                    delete_btn.pack(side="right", padx=(0, PADDING["small"]))
-                    self._create_tooltip(delete_btn, "Delete File")
-
-                if version.version_type == "main":
-                    # Add "Mark Bad" button for main save file
-                    mark_bad_image = self._load_icon("icons/mark_bad.png", size=(16, 16))
-                    if mark_bad_image:
-                        mark_bad_btn = ctk.CTkButton(
-                            row, image=mark_bad_image, text="", width=24, height=24,
-                            fg_color="transparent", hover_color=("gray80", "gray30"),
-                            command=lambda v=version: self._mark_version_bad(v)
-                        )
-                    else:
-                        # Fallback: red circle with slash (🚫)
-                        mark_bad_btn = ctk.CTkButton(
-                            row, text="🚫", width=24, height=24,
-                            font=FONTS["small"], text_color="red",
-                            fg_color="transparent", hover_color=("gray80", "gray30"),
-                            command=lambda v=version: self._mark_version_bad(v)
-                        )
-                    mark_bad_btn.pack(side="right", padx=PADDING["small"])
-                    self._create_tooltip(mark_bad_btn, "Mark Bad")
-                elif not has_main_file:
-                    # No main file exists - show green restore button to rename this file as .sav
-                    restore_image = self._load_icon("icons/restore_green.png", size=(16, 16))
-                    if restore_image:
-                        restore_btn = ctk.CTkButton(
-                            row, image=restore_image, text="", width=24, height=24,
-                            fg_color="transparent", hover_color=("gray80", "gray30"),
-                            command=lambda v=version: self._restore_as_main(v)
-                        )
-                    else:
-                        # Fallback: green recycle symbol (♻)
-                        restore_btn = ctk.CTkButton(
-                            row, text="♻", width=24, height=24,
-                            font=FONTS["small"], text_color="green",
-                            fg_color="transparent", hover_color=("gray80", "gray30"),
-                            command=lambda v=version: self._restore_as_main(v)
-                        )
-                    restore_btn.pack(side="right", padx=PADDING["small"])
-                    self._create_tooltip(restore_btn, "Restore")
+        # Move the highlight (and action buttons) from the previous row
+        row = self._select_version_row(version.filename)
+        if row is not None:
+            # Add delete button if deletion is enabled (for any file type)
+            if self.config_manager.config.settings.enable_deletion:
+                trash_image = self._load_icon("icons/trash.png", size=(16, 16))
+                if trash_image:
+                    delete_btn = ctk.CTkButton(
+                        row, image=trash_image, text="", width=24, height=24,
+                        fg_color="transparent", hover_color=("#ffcccc", "#4a1a1a"),
+                        command=lambda v=version: self._prompt_delete_single_file(v)
+                    )
                 else:
-                    # Main file exists - show normal restore button (copy over main)
-                    restore_image = self._load_icon("icons/restore.png", size=(16, 16))
-                    if restore_image:
-                        restore_btn = ctk.CTkButton(
-                            row, image=restore_image, text="", width=24, height=24,
-                            fg_color="transparent", hover_color=("gray80", "gray30"),
-                            command=lambda v=version: self._restore_version(v)
-                        )
-                    else:
-                        restore_btn = ctk.CTkButton(
-                            row, text="↩", width=24, height=24,
-                            font=FONTS["small"],
-                            command=lambda v=version: self._restore_version(v)
-                        )
-                    restore_btn.pack(side="right", padx=PADDING["small"])
-                    self._create_tooltip(restore_btn, "Make this file the current save")
+                    delete_btn = ctk.CTkButton(
+                        row, text="🗑", width=24, height=24,
+                        font=FONTS["small"], text_color="red",
+                        fg_color="transparent", hover_color=("#ffcccc", "#4a1a1a"),
+                        command=lambda v=version: self._prompt_delete_single_file(v)
+                    )
+                delete_btn.pack(side="right", padx=(0, PADDING["small"]))
+                self._create_tooltip(delete_btn, "Delete File")
+
+            if version.version_type == "main":
+                # Add "Mark Bad" button for main save file
+                mark_bad_image = self._load_icon("icons/mark_bad.png", size=(16, 16))
+                if mark_bad_image:
+                    mark_bad_btn = ctk.CTkButton(
+                        row, image=mark_bad_image, text="", width=24, height=24,
+                        fg_color="transparent", hover_color=("gray80", "gray30"),
+                        command=lambda v=version: self._mark_version_bad(v)
+                    )
+                else:
+                    # Fallback: red circle with slash (🚫)
+                    mark_bad_btn = ctk.CTkButton(
+                        row, text="🚫", width=24, height=24,
+                        font=FONTS["small"], text_color="red",
+                        fg_color="transparent", hover_color=("gray80", "gray30"),
+                        command=lambda v=version: self._mark_version_bad(v)
+                    )
+                mark_bad_btn.pack(side="right", padx=PADDING["small"])
+                self._create_tooltip(mark_bad_btn, "Mark Bad")
+            elif not has_main_file:
+                # No main file exists - show green restore button to rename this file as .sav
+                restore_image = self._load_icon("icons/restore_green.png", size=(16, 16))
+                if restore_image:
+                    restore_btn = ctk.CTkButton(
+                        row, image=restore_image, text="", width=24, height=24,
+                        fg_color="transparent", hover_color=("gray80", "gray30"),
+                        command=lambda v=version: self._restore_as_main(v)
+                    )
+                else:
+                    # Fallback: green recycle symbol (♻)
+                    restore_btn = ctk.CTkButton(
+                        row, text="♻", width=24, height=24,
+                        font=FONTS["small"], text_color="green",
+                        fg_color="transparent", hover_color=("gray80", "gray30"),
+                        command=lambda v=version: self._restore_as_main(v)
+                    )
+                restore_btn.pack(side="right", padx=PADDING["small"])
+                self._create_tooltip(restore_btn, "Restore")
+            else:
+                # Main file exists - show normal restore button (copy over main)
+                restore_image = self._load_icon("icons/restore.png", size=(16, 16))
+                if restore_image:
+                    restore_btn = ctk.CTkButton(
+                        row, image=restore_image, text="", width=24, height=24,
+                        fg_color="transparent", hover_color=("gray80", "gray30"),
+                        command=lambda v=version: self._restore_version(v)
+                    )
+                else:
+                    restore_btn = ctk.CTkButton(
+                        row, text="↩", width=24, height=24,
+                        font=FONTS["small"],
+                        command=lambda v=version: self._restore_version(v)
+                    )
+                restore_btn.pack(side="right", padx=PADDING["small"])
+                self._create_tooltip(restore_btn, "Make this file the current save")
 
         self._set_status(f"Selected version: {version.display_name}")
 
     def _restore_version(self, version: SaveFileVersion):
         """Restore the selected version as the current save (copies over existing main file)."""
-        from ..config.path_validator import is_safe_path, is_path_under_root
-
         if not self.current_installation or not self.selected_item:
             self._set_status("No item selected")
             return
@@ -2145,18 +3092,44 @@ class MainWindow(ctk.CTk):
                 self._set_status("Cannot operate on protected path")
                 return
 
-            import shutil
-            # Backup current save first
-            backup_path = main_file.file_path.with_suffix(".sav.backup")
-            shutil.copy2(main_file.file_path, backup_path)
+            if self._restore_in_progress:
+                self._set_status("A restore is already in progress")
+                return
+
+            # Copy on a worker thread; completion is handled back on the Tk thread
+            self._restore_in_progress = True
+            self._set_status(f"Restoring {version.display_name}...")
+            future = self._parallel_io.submit(self._restore_save_file, main_file.file_path, version.file_path)
+            future.add_done_callback(lambda f, v=version: self._post_to_main(self._on_restore_done, f, v))
+        except (OSError, IOError, shutil.Error) as e:
+            self._set_status(f"Restore failed: {e}")
 
-            # Copy selected version to main save
-            shutil.copy2(version.file_path, main_file.file_path)
+    @staticmethod
+    def _restore_save_file(main_path: Path, version_path: Path):
+        """Replace the main save with a copy of a version (worker thread).
 
-            self._set_status(f"Restored {version.display_name} as current save")
-            self._refresh_versions_list()
+        The replaced save is kept as .sav.backup.
+
+        Args:
+            main_path: The main .sav file
+            version_path: The version to restore
+        """
+        # Copy the version next to the main save and swap it in; a failed copy
+        # leaves the current save untouched. The replaced save is kept by
+        # renaming it (no data copied).
+        _replace_with_copy(version_path, main_path, main_path.with_suffix(".sav.backup"))
+
+    def _on_restore_done(self, future, version: SaveFileVersion):
+        """Report the result of a background restore."""
+        self._restore_in_progress = False
+        try:
+            future.result()
         except (OSError, IOError, shutil.Error) as e:
             self._set_status(f"Restore failed: {e}")
+            return
+
+        self._set_status(f"Restored {version.display_name} as current save")
+        self._refresh_versions_list()
 
     def _restore_as_main(self, version: SaveFileVersion):
         """Restore a file as the main save by renaming it to .sav.
@@ -2174,7 +3147,7 @@ class MainWindow(ctk.CTk):
         try:
             # Get base name by taking everything before the first '.'
             filename = version.file_path.name
-            base_name = filename.split('.')[0]  # e.g., "MW_12345678"
+            base_name = filename.partition('.')[0]  # e.g., "MW_12345678"
 
             # Create the new .sav path
             new_path = version.file_path.parent / f"{base_name}.sav"
@@ -2184,9 +3157,26 @@ class MainWindow(ctk.CTk):
                 self._set_status(f"Cannot restore: {new_path.name} already exists")
                 return
 
-            # Rename the file
-            version.file_path.rename(new_path)
-            self._set_status(f"Restored: {new_path.name}")
+            # Rename the file; fall back to copy + delete if the rename is refused
+            # (e.g. Windows sharing violations while the game or a scanner holds it)
+            status = f"Restored: {new_path.name}"
+            try:
+                os.replace(version.file_path, new_path)
+            except OSError:
+                try:
+                    _fastcopy(version.file_path, new_path)
+                except (OSError, IOError):
+                    new_path.unlink(missing_ok=True)
+                    raise
+                try:
+                    version.file_path.unlink()
+                except OSError as e:
+                    # Whatever refused the rename may refuse this too; the save
+                    # is already in place, so only the old copy is left behind
+                    logger.warning("Restored %s but could not remove %s: %s",
+                                   new_path.name, version.file_path.name, e)
+                    status += f" ({version.file_path.name} was left in place)"
+            self._set_status(status)
 
             # Refresh the lists to reflect the change
             self._refresh_item_list()
@@ -2213,10 +3203,12 @@ class MainWindow(ctk.CTk):
             return
 
         try:
-            # Find an unused .XX.bad suffix
+            # Find an unused .XX.bad suffix (one directory scan instead of a stat per suffix)
+            with os.scandir(version.file_path.parent) as it:
+                existing_names = {os.path.normcase(entry.name) for entry in it}
             for i in range(100):
                 bad_path = version.file_path.parent / f"{version.file_path.name}.{i:02d}.bad"
-                if not bad_path.exists():
+                if os.path.normcase(bad_path.name) not in existing_names:
                     # Rename the file
                     version.file_path.rename(bad_path)
                     self._set_status(f"Marked as bad: {bad_path.name}")
@@ -2239,6 +3231,12 @@ class MainWindow(ctk.CTk):
         )
         has_selection = self.selected_item is not None
 
+        # Both buttons stay disabled while a backup is running
+        if self._backup_in_progress:
+            self.backup_btn.configure(state="disabled")
+            self.backup_all_btn.configure(state="disabled")
+            return
+
         # Backup button: only enabled if an item is selected
         if has_selection:
             self.backup_btn.configure(state="normal")
@@ -2274,15 +3272,32 @@ class MainWindow(ctk.CTk):
                 self._set_status(f"No main save file found for {item_name}")
                 return
 
-            # Create backup of just this one item
-            backup_path = self._create_single_item_backup(main_file, item_name)
-            if backup_path:
-                self._set_status(f"Backup created: {backup_path.name}")
-            else:
-                self._set_status(f"Backup failed for {item_name}")
+            # Create backup of just this one item (copy runs on a worker thread)
+            backup_path = self._get_item_backup_path(self._get_backup_index_manager(), main_file, item_name)
+            self._set_backup_in_progress(True)
+            future = self._parallel_io.submit(
+                self._create_single_item_backup, main_file.file_path, backup_path,
+                self.config_manager.config.settings.prefer_hardlinks,
+            )
+            future.add_done_callback(lambda f, name=item_name: self._post_to_main(self._on_single_backup_done, f, name))
         except (OSError, IOError, shutil.Error) as e:
             self._set_status(f"Backup failed: {e}")
 
+    def _on_single_backup_done(self, future, item_name: str):
+        """Report the result of a background single-item backup."""
+        self._set_backup_in_progress(False)
+        try:
+            backup_path, created = future.result()
+        except (OSError, IOError, shutil.Error) as e:
+            logger.error("Backup error for %s: %s", item_name, e)
+            self._set_status(f"Backup failed for {item_name}")
+            return
+
+        if created:
+            self._set_status(f"Backup created: {backup_path.name}")
+        else:
+            self._set_status(f"Backup already exists for {item_name} at {backup_path.parent.name}")
+
     def _backup_all_items(self):
         """Backup all worlds or characters for current installation."""
         if not self.current_installation:
@@ -2302,8 +3317,9 @@ class MainWindow(ctk.CTk):
                 self._set_status(f"No {item_type} to backup")
                 return
 
-            # Backup each item
-            backed_up = 0
+            # Resolve every backup path up front (updates the index once, on this thread)
+            index_manager = self._get_backup_index_manager()
+            jobs = []
             for item in items:
                 if isinstance(item, WorldWithVersions):
                     item_name = item.world_name
@@ -2312,16 +3328,81 @@ class MainWindow(ctk.CTk):
 
                 main_file = item.main_file
                 if main_file:
-                    backup_path = self._create_single_item_backup(main_file, item_name)
-                    if backup_path:
-                        backed_up += 1
+                    try:
+                        backup_path = self._get_item_backup_path(index_manager, main_file, item_name)
+                    except (OSError, IOError) as e:
+                        logger.error("Backup error for %s: %s", item_name, e)
+                        continue
+                    jobs.append((main_file.file_path, backup_path, item_name))
 
-            self._set_status(f"Backed up {backed_up} of {len(items)} {item_type}")
+            if not jobs:
+                self._set_status(f"Backed up 0 of {len(items)} {item_type}")
+                return
+
+            # Copy every item in parallel; results are tallied back on the Tk thread
+            self._set_backup_in_progress(True)
+            self._set_status(f"Backing up {len(jobs)} {item_type}...")
+            progress = {"pending": len(jobs), "backed_up": 0, "total": len(items), "item_type": item_type}
+            use_hardlink = self.config_manager.config.settings.prefer_hardlinks
+            for source, backup_path, item_name in jobs:
+                future = self._parallel_io.submit(self._create_single_item_backup, source, backup_path, use_hardlink)
+                future.add_done_callback(
+                    lambda f, name=item_name, p=progress: self._post_to_main(self._on_backup_all_item_done, f, name, p)
+                )
         except (OSError, IOError, shutil.Error) as e:
             self._set_status(f"Backup failed: {e}")
 
-    def _create_single_item_backup(self, main_file, item_name: str):
-        """Create a backup of a single save file using the index-based structure.
+    def _on_backup_all_item_done(self, future, item_name: str, progress: dict):
+        """Tally one finished Backup All copy and report when all are done."""
+        try:
+            future.result()
+            progress["backed_up"] += 1
+        except (OSError, IOError, shutil.Error) as e:
+            logger.error("Backup error for %s: %s", item_name, e)
+        finally:
+            # Counted even if the copy raised something unexpected, so Backup
+            # All always reports and re-enables the backup buttons
+            progress["pending"] -= 1
+            if not progress["pending"]:
+                self._finish_backup_all(progress)
+
+    def _finish_backup_all(self, progress: dict):
+        """Report a finished Backup All and re-enable the backup buttons."""
+        self._set_backup_in_progress(False)
+        self._set_status(f"Backed up {progress['backed_up']} of {progress['total']} {progress['item_type']}")
+
+    def _set_backup_in_progress(self, in_progress: bool):
+        """Mark a background backup as running (disables the backup buttons)."""
+        self._backup_in_progress = in_progress
+        self._update_backup_button_states()
+
+    def _get_backup_index_manager(self) -> BackupIndexManager:
+        """Get the backup index manager for the current view's category."""
+        # Get backup root from config, or use default
+        backup_root = (
+            self.config_manager.config.settings.backup_location
+            or GamePaths.BACKUP_DEFAULT
+        )
+
+        # Determine category based on view type
+        category = self._category_cache
+        return self._get_cached_index_manager(backup_root, category)
+
+    def _get_cached_index_manager(self, backup_root: Path, category: str) -> BackupIndexManager:
+        """Get a backup index manager, reusing the parsed index while its file is unchanged."""
+        key = (backup_root, category)
+        cached = self._index_cache.get(key)
+        if cached is not None:
+            mtime, index_manager = cached
+            if self._get_file_mtime_ns(index_manager.index_file) == mtime:
+                return index_manager
+
+        index_manager = BackupIndexManager(backup_root, category)
+        self._index_cache[key] = (self._get_file_mtime_ns(index_manager.index_file), index_manager)
+        return index_manager
+
+    def _get_item_backup_path(self, index_manager: BackupIndexManager, main_file, item_name: str) -> Path:
+        """Get the backup file path for a save file using the index-based structure.
 
         Backups are stored in the user's configured backup location with structure:
             backup_location/
@@ -2337,136 +3418,127 @@ class MainWindow(ctk.CTk):
                             MC_12345678.sav
 
         The timestamp subdirectory is based on the source file's modification time,
-        not the current time.
+        not the current time. This updates the index, so call it on the Tk thread.
 
         Args:
+            index_manager: Index manager for the backup category
             main_file: The SaveFileVersion for the main save file
             item_name: Display name (world name or character name)
 
         Returns:
-            Path to backup file if successful, None otherwise
+            Path the backup file should be copied to
         """
-        import shutil
-        from datetime import datetime
+        # Get or create the backup directory using the index manager
+        base_filename = main_file.file_path.stem  # e.g., "MW_12345678"
+        item_backup_dir = index_manager.get_backup_directory(base_filename, item_name)
 
-        if not self.current_installation:
-            return None
+        # Get the file's modification timestamp (not current time)
+        file_mtime = main_file.file_path.stat().st_mtime
+        timestamp_dir_name = _backup_ts_name(datetime.fromtimestamp(file_mtime))
 
-        try:
-            # Get backup root from config, or use default
-            backup_root = (
-                self.config_manager.config.settings.backup_location
-                or GamePaths.BACKUP_DEFAULT
-            )
+        # Backup filename is just the original filename
+        return item_backup_dir / timestamp_dir_name / main_file.file_path.name
 
-            # Determine category based on view type
-            category = "worlds" if self.current_view_type == "Worlds" else "characters"
+    @staticmethod
+    def _create_single_item_backup(source: Path, backup_path: Path, use_hardlink: bool = False) -> tuple[Path, bool]:
+        """Copy a save file to its backup path. Safe to run on a worker thread.
 
-            # Get or create the backup directory using the index manager
-            index_manager = BackupIndexManager(backup_root, category)
-            base_filename = main_file.file_path.stem  # e.g., "MW_12345678"
-            item_backup_dir = index_manager.get_backup_directory(base_filename, item_name)
+        Args:
+            source: The save file to back up
+            backup_path: Destination from _get_item_backup_path
+            use_hardlink: Hardlink instead of copying when both are on the same
+                volume (Settings.prefer_hardlinks); falls back to a copy
 
-            # Get the file's modification timestamp (not current time)
-            file_mtime = main_file.file_path.stat().st_mtime
-            file_datetime = datetime.fromtimestamp(file_mtime)
-            timestamp_dir_name = file_datetime.strftime("%Y-%m-%d_%H%M%S")
+        Returns:
+            Tuple of (backup_path, created) - created is False if this exact
+            backup already existed, or if the newest backup has identical
+            contents (the existing backup's path is returned instead)
 
-            # Create timestamp subdirectory
-            timestamp_dir = item_backup_dir / timestamp_dir_name
-            timestamp_dir.mkdir(parents=True, exist_ok=True)
+        Raises:
+            OSError: If the copy fails
+        """
+        # Check if this exact backup already exists
+        if backup_path.exists():
+            return backup_path, False
 
-            # Backup filename is just the original filename
-            backup_path = timestamp_dir / main_file.file_path.name
+        # Skip the copy if the newest backup is byte-identical (e.g. save only touched)
+        latest = MainWindow._find_latest_backup(backup_path)
+        if latest is not None and _same_file_content(source, latest):
+            return latest, False
 
-            # Check if this exact backup already exists
-            if backup_path.exists():
-                self._set_status(f"Backup already exists for {item_name} at {timestamp_dir_name}")
-                return backup_path
+        # Create timestamp subdirectory
+        backup_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Copy the file
-            shutil.copy2(main_file.file_path, backup_path)
-            return backup_path
-        except (OSError, IOError, shutil.Error) as e:
-            logger.error("Backup error for %s: %s", item_name, e)
+        # Hardlink when possible (no data copied), otherwise copy the file
+        if use_hardlink and source.stat().st_dev == backup_path.parent.stat().st_dev:
+            try:
+                os.link(source, backup_path)
+                return backup_path, True
+            except OSError as e:
+                logger.debug("Hardlink failed for %s, copying instead: %s", source, e)
+        _fastcopy(source, backup_path)
+        return backup_path, True
+
+    @staticmethod
+    def _find_latest_backup(backup_path: Path) -> Optional[Path]:
+        """Find the newest existing backup of the same file as backup_path.
+
+        Args:
+            backup_path: item_dir/<timestamp>/<filename> for a new backup
+
+        Returns:
+            Path to the same filename in the newest timestamp directory, or None
+        """
+        item_dir = backup_path.parent.parent
+        try:
+            with os.scandir(item_dir) as it:
+                timestamp_names = sorted((e.name for e in it if e.is_dir()), reverse=True)
+        except OSError:
             return None
 
-    def _create_tooltip(self, widget, text: str):
-        """Create a hover tooltip for a widget (displays above cursor)."""
-        tooltip = None
-        after_id = None
-
-        def show_tooltip(event):
-            nonlocal tooltip, after_id
-            # Cancel any pending show
-            if after_id:
-                widget.after_cancel(after_id)
-                after_id = None
-            # Hide any existing tooltip first
-            hide_tooltip(None)
-
-            # Small delay before showing tooltip
-            def create_tooltip():
-                nonlocal tooltip
-                try:
-                    if not widget.winfo_exists():
-                        return
-                    # Position tooltip above the widget
-                    x = widget.winfo_rootx()
-                    y = widget.winfo_rooty() - 30  # Above the widget
+        # Timestamp directory names (YYYY-MM-DD_HHMMSS) sort chronologically
+        for name in timestamp_names:
+            candidate = item_dir / name / backup_path.name
+            if candidate.is_file():
+                return candidate
+        return None
 
-                    tooltip = ctk.CTkToplevel(widget)
-                    tooltip.wm_overrideredirect(True)
-                    tooltip.wm_geometry(f"+{x}+{y}")
-                    tooltip.wm_attributes("-topmost", True)
+    def _create_tooltip(self, widget, text: str):
+        """Create a hover tooltip for a widget (displays above cursor).
 
-                    label = ctk.CTkLabel(
-                        tooltip, text=text,
-                        font=FONTS["small"],
-                        fg_color=("gray90", "gray20"),
-                        corner_radius=4,
-                        padx=8, pady=4
-                    )
-                    label.pack()
+        All widgets share one tooltip window, which is created on first use and
+        then only re-texted, moved and shown/hidden.
+        """
+        if self._tooltip is None:
+            self._tooltip = _SharedTooltip(self)
+        tooltip = self._tooltip
 
-                    # Auto-hide after 3 seconds as failsafe
-                    tooltip.after(3000, lambda: hide_tooltip(None))
-                except (tk.TclError, RuntimeError):
-                    pass  # Widget was destroyed
+        widget.bind("<Enter>", lambda e, w=widget, t=text: tooltip.schedule_show(w, t))
+        widget.bind("<Leave>", lambda e, w=widget: tooltip.hide(w))
+        widget.bind("<Button-1>", lambda e, w=widget: tooltip.hide(w))  # Hide on click
+        widget.bind("<Destroy>", lambda e, w=widget: tooltip.hide(w))  # Cleanup when widget destroyed
 
-            after_id = widget.after(200, create_tooltip)
+    @staticmethod
+    def _load_icon(relative_path: str, size: tuple[int, int] = (24, 24)) -> Optional[ctk.CTkImage]:
+        """Load an icon as a CTkImage, cached per (path, size).
 
-        def hide_tooltip(event):
-            nonlocal tooltip, after_id
-            # Cancel any pending show
-            if after_id:
-                try:
-                    widget.after_cancel(after_id)
-                except (tk.TclError, RuntimeError):
-                    pass
-                after_id = None
-            # Destroy tooltip if it exists
-            if tooltip:
-                try:
-                    tooltip.destroy()
-                except (tk.TclError, RuntimeError):
-                    pass  # Already destroyed
-                tooltip = None
+        CTkImage renders its Tk images lazily per widget, so one instance can
+        safely be shared by every button that shows the same icon.
+        """
+        # The cache is keyed positionally, so size= and a positional size hit
+        # the same entry
+        return _load_icon_image(relative_path, tuple(size))
 
-        widget.bind("<Enter>", show_tooltip)
-        widget.bind("<Leave>", hide_tooltip)
-        widget.bind("<Button-1>", hide_tooltip)  # Hide on click
-        widget.bind("<Destroy>", hide_tooltip)  # Cleanup when widget destroyed
+    def _preload_icons(self):
+        """Load the row action icons into _load_icon's cache ahead of first use."""
+        for relative_path, size in _ROW_ACTION_ICONS:
+            self._load_icon(relative_path, size=size)
 
-    def _load_icon(self, relative_path: str, size: tuple[int, int] = (24, 24)) -> Optional[ctk.CTkImage]:
-        try:
-            icon_path = get_asset_path(relative_path)
-            if icon_path.exists():
-                image = Image.open(icon_path)
-                return ctk.CTkImage(light_image=image, dark_image=image, size=size)
-        except (OSError, IOError, ValueError) as e:
-            logger.debug("Could not load icon %s: %s", relative_path, e)
-        return None
+    def _get_row_trash_icon(self) -> Optional[ctk.CTkImage]:
+        """Get the list-row delete icon, or None when deletion is disabled."""
+        if not self.config_manager.config.settings.enable_deletion:
+            return None
+        return self._load_icon("icons/trash.png", size=(18, 18))
 
     def _open_settings(self):
         """Open the settings dialog."""
@@ -2562,7 +3634,16 @@ class MainWindow(ctk.CTk):
             self.toolbar_trade_btn.configure(fg_color=("gray75", "gray35"))
 
     def _update_pane_headers_for_mode(self):
-        """Update pane headers and buttons based on current mode."""
+        """Update pane headers and buttons based on current mode.
+
+        Skipped when the headers already show this mode (server/trade modes
+        leave them untouched, so returning from those needs no re-layout).
+        """
+        if self.current_mode == self._last_rendered_mode:
+            return
+        if self.current_mode in ("backup", "restore", "mods"):
+            self._last_rendered_mode = self.current_mode
+
         # Hide/show backup buttons based on mode
         if self.current_mode == "backup":
             self.backup_btn.pack(side="right", padx=2)
@@ -2610,9 +3691,9 @@ class MainWindow(ctk.CTk):
 
     def _refresh_restore_list(self):
         """Refresh the world/character list from backup index for restore mode."""
-        # Clear existing items
-        for widget in self.item_list_frame.winfo_children():
-            widget.destroy()
+        # Clear existing items (and drop any scan still in flight)
+        self._reset_item_list_frame()
+        self._restore_scan_generation += 1
 
         # Get backup root from config
         backup_root = (
@@ -2632,23 +3713,63 @@ class MainWindow(ctk.CTk):
             return
 
         # Determine category based on view type
-        category = "worlds" if self.current_view_type == "Worlds" else "characters"
+        category = self._category_cache
 
-        # Get index entries
+        # Get index entries (parsed index reused while index.xml is unchanged)
+        try:
+            index_manager = self._get_cached_index_manager(backup_root, category)
+        except (OSError, ET.ParseError, ValueError) as e:
+            self._show_restore_list_error(e)
+            return
+
+        # Finding stale entries stats every backup directory, so it runs on a
+        # worker; the rows are built once it reports back
+        self.item_placeholder = ctk.CTkLabel(
+            self.item_list_frame,
+            text="Loading backups...",
+            font=FONTS["body"],
+            text_color="gray"
+        )
+        self.item_placeholder.pack(pady=PADDING["large"])
+        future = self._parallel_io.submit(index_manager.find_stale_entries)
+        future.add_done_callback(
+            lambda f, g=self._restore_scan_generation, im=index_manager, c=category:
+                self._post_to_main(self._render_restore_entries, f, g, im, c)
+        )
+
+    def _show_restore_list_error(self, error: Exception):
+        """Show a backup index read error in the restore list."""
+        self.item_placeholder = ctk.CTkLabel(
+            self.item_list_frame,
+            text=f"Error reading backups: {error}",
+            font=FONTS["body"],
+            text_color="red"
+        )
+        self.item_placeholder.pack(pady=PADDING["large"])
+        self.item_count_label.configure(text="(0)")
+
+    def _render_restore_entries(self, future, generation: int, index_manager: BackupIndexManager, category: str):
+        """Build the restore list once the background stale-entry scan finishes.
+
+        Args:
+            future: Future of index_manager.find_stale_entries
+            generation: _restore_scan_generation when the scan was started
+            index_manager: Index the scan ran against
+            category: "worlds" or "characters"
+        """
+        # A newer refresh (or a mode switch) superseded this scan. Backups only
+        # run in backup mode, so a scan that is still current can't race an
+        # index update.
+        if generation != self._restore_scan_generation or self.current_mode != "restore":
+            return
+
+        self._reset_item_list_frame()
         try:
-            index_manager = BackupIndexManager(backup_root, category)
             # Clean up stale entries (missing or empty directories) before listing
-            index_manager.cleanup_stale_entries()
+            index_manager.remove_entries(future.result())
             self.restore_entries = index_manager.list_entries()
         except (OSError, ET.ParseError, ValueError) as e:
-            self.item_placeholder = ctk.CTkLabel(
-                self.item_list_frame,
-                text=f"Error reading backups: {e}",
-                font=FONTS["body"],
-                text_color="red"
-            )
-            self.item_placeholder.pack(pady=PADDING["large"])
-            self.item_count_label.configure(text="(0)")
+            self._show_restore_list_error(e)
             return
 
         self.item_count_label.configure(text=f"({len(self.restore_entries)})")
@@ -2664,12 +3785,27 @@ class MainWindow(ctk.CTk):
             self.item_placeholder.pack(pady=PADDING["large"])
             return
 
-        # Create row for each entry
-        for entry in sorted(self.restore_entries, key=lambda e: e.display_name.lower()):
-            self._create_restore_entry_row(entry, index_manager)
+        # Create row for each entry (trash icon looked up once for all rows)
+        trash_image = self._get_row_trash_icon()
+        self._render_rows_lazily(
+            self.item_list_frame,
+            sorted(self.restore_entries, key=lambda e: e.display_name.lower()),
+            lambda entry: self._create_restore_entry_row(entry, index_manager, trash_image),
+        )
+
+    def _create_restore_entry_row(
+        self,
+        entry: BackupIndexEntry,
+        index_manager: 'BackupIndexManager' = None,
+        trash_image: Optional[ctk.CTkImage] = None,
+    ):
+        """Create a clickable row for a backup index entry in restore mode.
 
-    def _create_restore_entry_row(self, entry: BackupIndexEntry, index_manager: 'BackupIndexManager' = None):
-        """Create a clickable row for a backup index entry in restore mode."""
+        Args:
+            entry: Backup index entry to show
+            index_manager: Index used to check whether the entry has backups
+            trash_image: Delete icon from _get_row_trash_icon, or None for no delete button
+        """
         # Check if entry has any backups
         has_backups = True
         if index_manager:
@@ -2678,19 +3814,28 @@ class MainWindow(ctk.CTk):
 
         # Create row with yellow border if no backups
         if has_backups:
-            row = ctk.CTkFrame(self.item_list_frame, cursor="hand2")
+            row = ctk.CTkFrame(self.item_list_frame, cursor="hand2", fg_color=("gray95", "gray17"))
         else:
-            row = ctk.CTkFrame(self.item_list_frame, cursor="hand2",
+            row = ctk.CTkFrame(self.item_list_frame, cursor="hand2", fg_color=("gray95", "gray17"),
                               border_width=2, border_color="#ffc107")
         row.pack(fill="x", pady=2)
 
-        # Make the whole row clickable
-        row.bind("<Button-1>", lambda e, ent=entry: self._on_restore_entry_selected(ent))
+        # Make the whole row clickable (the labels are bound below)
+        self._row_to_entry[str(row)] = entry
+        row.bind("<Button-1>", self._on_restore_row_click)
+        self._restore_entry_rows[entry.filename] = row
+
+        # Rows are built after the background index scan, so re-apply a
+        # selection made while it was running
+        selected = self.selected_restore_entry
+        if selected and selected.filename == entry.filename:
+            row.configure(fg_color=("gray85", "gray25"))
+            self._selected_row = row
 
         # Display name
         name_label = ctk.CTkLabel(row, text=entry.display_name, font=FONTS["body"], anchor="w")
         name_label.pack(fill="x", padx=PADDING["small"], pady=(PADDING["small"], 0))
-        name_label.bind("<Button-1>", lambda e, ent=entry: self._on_restore_entry_selected(ent))
+        name_label.bind("<Button-1>", self._on_restore_row_click)
 
         # Filename (smaller, gray)
         filename_label = ctk.CTkLabel(
@@ -2698,40 +3843,50 @@ class MainWindow(ctk.CTk):
             font=FONTS["small"], text_color="gray", anchor="w"
         )
         filename_label.pack(fill="x", padx=PADDING["small"], pady=(0, PADDING["small"]))
-        filename_label.bind("<Button-1>", lambda e, ent=entry: self._on_restore_entry_selected(ent))
+        filename_label.bind("<Button-1>", self._on_restore_row_click)
 
         # Add tooltip for entries with no backups
         if not has_backups:
             self._create_tooltip(row, "No backups remaining")
 
         # Add trash icon if deletion is enabled
-        if self.config_manager.config.settings.enable_deletion:
-            trash_image = self._load_icon("icons/trash.png", size=(18, 18))
-            if trash_image:
-                trash_btn = ctk.CTkButton(
-                    row,
-                    image=trash_image,
-                    text="",
-                    width=24,
-                    height=24,
-                    fg_color="transparent",
-                    hover_color=("#ffcccc", "#4a1a1a"),
-                    command=lambda ent=entry: self._prompt_delete_restore_entry(ent)
-                )
-                trash_btn.place(relx=1.0, rely=0.5, anchor="e", x=-PADDING["small"])
-                self._create_tooltip(trash_btn, "Delete All Backups")
+        if trash_image:
+            trash_btn = ctk.CTkButton(
+                row,
+                image=trash_image,
+                text="",
+                width=24,
+                height=24,
+                fg_color="transparent",
+                hover_color=("#ffcccc", "#4a1a1a"),
+                command=lambda ent=entry: self._prompt_delete_restore_entry(ent)
+            )
+            trash_btn.place(relx=1.0, rely=0.5, anchor="e", x=-PADDING["small"])
+            self._create_tooltip(trash_btn, "Delete All Backups")
+
+    def _on_restore_row_click(self, event):
+        """Select the restore entry whose row (or label inside it) was clicked."""
+        widget = event.widget
+        # Bound only on rows and their labels; the clicked Tk widget is the
+        # row's or label's inner canvas/label, a level or two below the row.
+        # event.widget is a plain path string for some internal widgets.
+        while isinstance(widget, tk.Misc):
+            entry = self._row_to_entry.get(str(widget))
+            if entry is not None:
+                self._on_restore_entry_selected(entry)
+                return
+            widget = widget.master
 
     def _on_restore_entry_selected(self, entry: BackupIndexEntry):
         """Handle backup entry selection in restore mode."""
         self.selected_restore_entry = entry
 
-        # Highlight selected item
-        for widget in self.item_list_frame.winfo_children():
-            if isinstance(widget, ctk.CTkFrame):
-                is_selected = (widget.winfo_children() and
-                               widget.winfo_children()[0].cget("text") == entry.display_name)
-                widget.configure(fg_color=("gray85", "gray25") if is_selected
-                               else ("gray95", "gray17"))
+        # Highlight selected item (only the previous and new rows change)
+        if self._selected_row is not None and self._selected_row.winfo_exists():
+            self._selected_row.configure(fg_color=("gray95", "gray17"))
+        self._selected_row = self._restore_entry_rows.get(entry.filename)
+        if self._selected_row is not None:
+            self._selected_row.configure(fg_color=("gray85", "gray25"))
 
         # Refresh timestamps pane
         self._refresh_restore_timestamps()
@@ -2739,14 +3894,21 @@ class MainWindow(ctk.CTk):
         self._set_status(f"Selected backup: {entry.display_name}")
 
     def _refresh_restore_timestamps(self):
-        """Refresh the timestamp list for the selected backup entry."""
+        """Refresh the timestamp list for the selected backup entry (debounced)."""
+        self._schedule_versions_pane_refresh(self._do_refresh_restore_timestamps)
+
+    def _do_refresh_restore_timestamps(self):
+        """Rebuild the timestamp list for the selected backup entry."""
+        # The pane may have switched to another mode while this was pending
+        if self.current_mode != "restore":
+            return
+
         # Clear existing items
-        for widget in self.versions_list_frame.winfo_children():
-            widget.destroy()
+        self._reset_versions_list_frame()
         self.version_rows.clear()
         self.selected_restore_timestamp = None
 
-        item_type = "world" if self.current_view_type == "Worlds" else "character"
+        item_type = self._item_type_cache
 
         if not self.selected_restore_entry:
             self.versions_placeholder = ctk.CTkLabel(
@@ -2767,7 +3929,7 @@ class MainWindow(ctk.CTk):
             or GamePaths.BACKUP_DEFAULT
         )
 
-        category = "worlds" if self.current_view_type == "Worlds" else "characters"
+        category = self._category_cache
 
         try:
             index_manager = BackupIndexManager(backup_root, category)
@@ -2797,26 +3959,24 @@ class MainWindow(ctk.CTk):
             return
 
         # Create row for each timestamp
-        for timestamp_dir in self.restore_timestamps:
-            self._create_restore_timestamp_row(timestamp_dir)
+        self._render_rows_lazily(
+            self.versions_list_frame, self.restore_timestamps, self._create_restore_timestamp_row
+        )
 
     def _create_restore_timestamp_row(self, timestamp_dir: Path):
         """Create a clickable row for a backup timestamp directory."""
-        row = ctk.CTkFrame(self.versions_list_frame, cursor="hand2")
+        row = ctk.CTkFrame(self.versions_list_frame, cursor="hand2", fg_color=("gray95", "gray17"))
         row.pack(fill="x", pady=1)
 
         # Store reference for highlighting
         self.version_rows[timestamp_dir.name] = row
 
-        # Make row clickable
-        row.bind("<Button-1>", lambda e, ts=timestamp_dir: self._on_restore_timestamp_selected(ts))
+        # Make row clickable (one callback shared by the row and its label)
+        on_click = lambda e, select=functools.partial(self._on_restore_timestamp_selected, timestamp_dir): select()
+        row.bind("<Button-1>", on_click)
 
         # Parse timestamp from directory name (format: YYYY-MM-DD_HHMMSS)
-        try:
-            dt = datetime.strptime(timestamp_dir.name, "%Y-%m-%d_%H%M%S")
-            display_text = dt.strftime("%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            display_text = timestamp_dir.name
+        display_text = _format_backup_ts(timestamp_dir.name)
 
         # Timestamp label
         name_label = ctk.CTkLabel(
@@ -2824,72 +3984,50 @@ class MainWindow(ctk.CTk):
             font=FONTS["body"], anchor="w"
         )
         name_label.pack(side="left", fill="x", expand=True, padx=PADDING["small"], pady=PADDING["small"])
-        name_label.bind("<Button-1>", lambda e, ts=timestamp_dir: self._on_restore_timestamp_selected(ts))
+        name_label.bind("<Button-1>", on_click)
 
     def _on_restore_timestamp_selected(self, timestamp_dir: Path):
         """Handle timestamp selection in restore mode - show restore button."""
         self.selected_restore_timestamp = timestamp_dir
 
-        # Update highlighting on all rows
-        for dirname, row in self.version_rows.items():
-            # Remove old buttons if present
-            for child in row.winfo_children():
-                if isinstance(child, ctk.CTkButton):
-                    child.destroy()
-
-            is_selected = (dirname == timestamp_dir.name)
-            row.configure(fg_color=("gray85", "gray25") if is_selected else ("gray95", "gray17"))
-
-            if is_selected:
-                # Add delete button if deletion is enabled
-                if self.config_manager.config.settings.enable_deletion:
-                    trash_image = self._load_icon("icons/trash.png", size=(16, 16))
-                    if trash_image:
-                        delete_btn = ctk.CTkButton(
-                            row, image=trash_image, text="", width=24, height=24,
-                            fg_color="transparent", hover_color=("#ffcccc", "#4a1a1a"),
-                            command=lambda ts=timestamp_dir: self._prompt_delete_backup_timestamp(ts)
-                        )
-                    else:
-                        delete_btn = ctk.CTkButton(
-                            row, text="🗑", width=24, height=24,
-                            font=FONTS["small"], text_color="red",
-                            fg_color="transparent", hover_color=("#ffcccc", "#4a1a1a"),
-                            command=lambda ts=timestamp_dir: self._prompt_delete_backup_timestamp(ts)
-                        )
-                    delete_btn.pack(side="right", padx=(0, PADDING["small"]))
-                    self._create_tooltip(delete_btn, "Delete Backup")
-
-                # Add restore button
-                restore_image = self._load_icon("icons/restore_green.png", size=(16, 16))
-                if restore_image:
-                    restore_btn = ctk.CTkButton(
-                        row, image=restore_image, text="", width=24, height=24,
-                        fg_color="transparent", hover_color=("gray80", "gray30"),
-                        command=lambda ts=timestamp_dir: self._restore_from_backup(ts)
+        # Move the highlight (and action buttons) from the previous row
+        row = self._select_version_row(timestamp_dir.name)
+        if row is not None:
+            # (icon, fallback text, fallback color, hover color, action, tooltip, padx), packed right to left
+            specs = []
+            if self.config_manager.config.settings.enable_deletion:
+                specs.append(("icons/trash.png", "🗑", "red", ("#ffcccc", "#4a1a1a"),
+                              self._prompt_delete_backup_timestamp, "Delete Backup", (0, PADDING["small"])))
+            specs.append(("icons/restore_green.png", "♻", "green", ("gray80", "gray30"),
+                          self._restore_from_backup, "Restore this backup", PADDING["small"]))
+
+            for icon_path, fallback_text, fallback_color, hover_color, action, tooltip, padx in specs:
+                image = self._load_icon(icon_path, size=(16, 16))
+                if image:
+                    button = ctk.CTkButton(
+                        row, image=image, text="", width=24, height=24,
+                        fg_color="transparent", hover_color=hover_color,
+                        command=functools.partial(action, timestamp_dir)
                     )
                 else:
-                    restore_btn = ctk.CTkButton(
-                        row, text="♻", width=24, height=24,
-                        font=FONTS["small"], text_color="green",
-                        fg_color="transparent", hover_color=("gray80", "gray30"),
-                        command=lambda ts=timestamp_dir: self._restore_from_backup(ts)
+                    button = ctk.CTkButton(
+                        row, text=fallback_text, width=24, height=24,
+                        font=FONTS["small"], text_color=fallback_color,
+                        fg_color="transparent", hover_color=hover_color,
+                        command=functools.partial(action, timestamp_dir)
                     )
-                restore_btn.pack(side="right", padx=PADDING["small"])
-                self._create_tooltip(restore_btn, "Restore this backup")
+                button.pack(side="right", padx=padx)
+                self._create_tooltip(button, tooltip)
 
         # Parse timestamp for status
-        try:
-            dt = datetime.strptime(timestamp_dir.name, "%Y-%m-%d_%H%M%S")
-            display_text = dt.strftime("%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            display_text = timestamp_dir.name
+        display_text = _format_backup_ts(timestamp_dir.name)
 
         self._set_status(f"Selected backup from {display_text}")
 
     def _restore_from_backup(self, timestamp_dir: Path):
         """Restore a backup from the backup location to the game save directory."""
-        from ..config.path_validator import is_safe_path, is_path_under_root, validate_save_path
+        if self._backup_delete_pending(timestamp_dir):
+            return
 
         if not self.current_installation or not self.current_installation.save_path:
             self._set_status("No installation selected")
@@ -2907,8 +4045,6 @@ class MainWindow(ctk.CTk):
             return
 
         try:
-            import shutil
-
             # Get backup root
             backup_root = (
                 self.config_manager.config.settings.backup_location
@@ -2920,8 +4056,8 @@ class MainWindow(ctk.CTk):
                 self._set_status("Invalid backup directory")
                 return
 
-            category = "worlds" if self.current_view_type == "Worlds" else "characters"
-            index_manager = BackupIndexManager(backup_root, category)
+            category = self._category_cache
+            index_manager = self._get_cached_index_manager(backup_root, category)
 
             # Get the backup files
             backup_files = index_manager.get_backup_files(timestamp_dir)
@@ -2930,12 +4066,12 @@ class MainWindow(ctk.CTk):
                 self._set_status("No backup files found in this directory")
                 return
 
-            # Check if any files already exist
-            existing_files = []
-            for backup_file in backup_files:
-                dest_path = self.current_installation.save_path / backup_file.name
-                if dest_path.exists():
-                    existing_files.append(backup_file.name)
+            # Check if any files already exist (one directory scan, not a stat per file)
+            existing_entries = self._scan_existing_entries(save_path)
+            existing_files = [
+                backup_file.name for backup_file in backup_files
+                if os.path.normcase(backup_file.name) in existing_entries
+            ]
 
             # If files exist, ask for confirmation
             if existing_files:
@@ -2951,36 +4087,106 @@ class MainWindow(ctk.CTk):
                     self._set_status("Restore cancelled")
                     return
 
-            # Restore each file
-            restored_count = 0
-            for backup_file in backup_files:
-                # Destination is the game's save directory
-                dest_path = self.current_installation.save_path / backup_file.name
+            if self._restore_in_progress:
+                self._set_status("A restore is already in progress")
+                return
 
-                # If destination exists, back it up first
-                if dest_path.exists():
-                    backup_dest = dest_path.with_suffix(".sav.pre_restore")
-                    shutil.copy2(dest_path, backup_dest)
+            # Copy every file in parallel; results are tallied back on the Tk thread
+            self._restore_in_progress = True
+            self._set_status(f"Restoring {len(backup_files)} file(s)...")
+            progress = {"pending": len(backup_files), "restored": 0, "total": len(backup_files)}
+            save_dir = os.fspath(save_path)
+            for backup_file in backup_files:
+                # Destination is the game's save directory (plain string joins;
+                # shutil/os take str paths and this skips Path parsing per file)
+                dest_path = os.path.join(save_dir, backup_file.name)
+
+                # If destination exists, keep it as .pre_restore; each file is
+                # swapped in whole (see _replace_with_copy), so a failed file
+                # keeps its current version instead of going missing
+                pre_restore_path = None
+                if os.path.normcase(backup_file.name) in existing_entries:
+                    pre_restore_path = os.path.splitext(dest_path)[0] + ".sav.pre_restore"
+
+                future = self._parallel_io.submit(
+                    self._restore_backup_file, backup_file, dest_path, pre_restore_path
+                )
+                future.add_done_callback(
+                    lambda f, name=backup_file.name, p=progress: self._post_to_main(self._on_restore_file_done, f, name, p)
+                )
 
-                # Copy the backup file to the save directory
-                shutil.copy2(backup_file, dest_path)
-                restored_count += 1
+        except (OSError, IOError, shutil.Error) as e:
+            self._set_status(f"Restore failed: {e}")
 
-            self._set_status(f"Restored {restored_count} file(s) from backup")
+    @staticmethod
+    def _restore_backup_file(backup_file: Path, dest_path: str, pre_restore_path: Optional[str]):
+        """Copy one backup file into the save directory (worker thread).
 
-            # Refresh to show the restored files
-            self._refresh_restore_timestamps()
+        Args:
+            backup_file: File in the backup timestamp directory
+            dest_path: Destination in the game's save directory
+            pre_restore_path: Where to keep the file being replaced, or None
+                if dest_path doesn't exist
+        """
+        # Copy next to the destination and swap it in, so a failed copy leaves
+        # the existing file in place; the replaced file is kept by renaming it
+        _replace_with_copy(backup_file, dest_path, pre_restore_path)
 
+    def _on_restore_file_done(self, future, filename: str, progress: dict):
+        """Tally one restored file and report when the whole backup is done."""
+        try:
+            future.result()
+            progress["restored"] += 1
         except (OSError, IOError, shutil.Error) as e:
-            self._set_status(f"Restore failed: {e}")
+            logger.error("Restore error for %s: %s", filename, e)
+        finally:
+            # Counted even if the worker raised something unexpected, so the
+            # restore always finishes and _restore_in_progress is cleared
+            progress["pending"] -= 1
+            if not progress["pending"]:
+                self._finish_restore_from_backup(progress)
+
+    def _finish_restore_from_backup(self, progress: dict):
+        """Report a finished backup restore and refresh the timestamps."""
+        self._restore_in_progress = False
+        if progress["restored"] == progress["total"]:
+            self._set_status(f"Restored {progress['restored']} file(s) from backup")
+        else:
+            self._set_status(
+                f"Restore failed: restored {progress['restored']} of {progress['total']} file(s); "
+                "the others were left unchanged"
+            )
+
+        # Refresh to show the restored files
+        self._refresh_restore_timestamps()
 
     def _refresh_mods_list(self):
         """Refresh the mods list showing Paks folder contents."""
-        # Clear existing items in both panes
-        for widget in self.item_list_frame.winfo_children():
-            widget.destroy()
-        for widget in self.versions_list_frame.winfo_children():
-            widget.destroy()
+        paks_path = None
+        paks_mtime_ns = None
+        if self.current_installation and self.current_installation.game_path:
+            paks_path = self.current_installation.game_path / "Moria" / "Content" / "Paks"
+            try:
+                paks_mtime_ns = paks_path.stat().st_mtime_ns
+            except OSError:
+                pass
+
+        # Adding, removing or renaming a Paks entry changes the directory mtime,
+        # so an unchanged mtime means the installed rows still shown are current
+        # (an explicit refresh clears _paks_mtime_ns to catch in-place overwrites).
+        # The Available Mods pane lives in another folder and is always rescanned.
+        first_row = self._mod_rows[0]["frame"] if self._mod_rows else None
+        if (paks_mtime_ns is not None and paks_mtime_ns == self._paks_mtime_ns
+                and self.mods_items and self.mods_items[0].parent == paks_path
+                and first_row is not None and first_row.winfo_exists()
+                and first_row.winfo_manager()):
+            self._refresh_available_mods()
+            return
+        self._paks_mtime_ns = paks_mtime_ns
+
+        # Clear existing items (installed-mod rows are kept for reuse); the
+        # right pane is replaced by _refresh_available_mods below
+        self._recycle_mod_rows()
         self.version_rows.clear()
 
         self.mods_items = []
@@ -3009,10 +4215,7 @@ class MainWindow(ctk.CTk):
             self._refresh_available_mods()
             return
 
-        # Build Paks folder path
-        paks_path = self.current_installation.game_path / "Moria" / "Content" / "Paks"
-
-        if not paks_path.exists():
+        if paks_mtime_ns is None:
             placeholder = ctk.CTkLabel(
                 self.item_list_frame,
                 text=f"Paks folder not found:\n{paks_path}",
@@ -3026,22 +4229,22 @@ class MainWindow(ctk.CTk):
 
         # Get all files and directories, excluding internal game files
         # For files, only show .pak (hide .ucas and .utoc as they work together with .pak)
+        # (scandir entries carry their file type, so no stat per item)
         try:
-            items = []
-            for item in paks_path.iterdir():
-                if item.name in self._excluded_game_files:
-                    continue
-                if item.is_file():
-                    # Only show .pak files
-                    if item.suffix.lower() == ".pak":
-                        items.append(item)
-                else:
-                    # Show all directories
-                    items.append(item)
+            entries = []
+            with os.scandir(paks_path) as it:
+                for entry in it:
+                    name_lower = entry.name.lower()
+                    if name_lower in self._excluded_game_files:
+                        continue
+                    is_dir = entry.is_dir()
+                    # Show all directories, but only .pak files
+                    if is_dir or (entry.is_file() and name_lower.endswith(".pak")):
+                        entries.append((not is_dir, name_lower, entry))
 
             # Sort: directories first, then files, alphabetically
-            items.sort(key=lambda x: (not x.is_dir(), x.name.lower()))
-            self.mods_items = items
+            entries.sort(key=lambda e: e[:2])
+            self.mods_items = [Path(entry.path) for _, _, entry in entries]
         except (OSError, IOError) as e:
             placeholder = ctk.CTkLabel(
                 self.item_list_frame,
@@ -3068,23 +4271,54 @@ class MainWindow(ctk.CTk):
             self._refresh_available_mods()
             return
 
-        # Create row for each item
-        for item in self.mods_items:
-            self._create_mod_item_row(item)
+        # Create row for each item (batched as the list is scrolled)
+        self._render_rows_lazily(
+            self.item_list_frame,
+            [(item, not is_file) for (is_file, _, _), item in zip(entries, self.mods_items)],
+            lambda row_item: self._create_mod_item_row(*row_item),
+        )
 
         # Clear right pane
         self._refresh_available_mods()
 
-    def _create_mod_item_row(self, item_path: Path):
-        """Create a clickable row for a mod file or directory."""
-        row = ctk.CTkFrame(self.item_list_frame, cursor="hand2")
-        row.pack(fill="x", pady=1)
+    def _recycle_mod_rows(self):
+        """Hide the shown installed-mod rows in the pool and destroy other children.
 
-        # Make row clickable
-        row.bind("<Button-1>", lambda e, p=item_path: self._on_mod_item_selected(p))
+        Like _recycle_item_rows; the selected row also loses its highlight
+        and action buttons, so no pooled row keeps buttons bound to the
+        previous mod's path.
+        """
+        self._unselect_row(self._selected_mod_row)
+        self._selected_mod_row = None
+        for row in self._mod_rows:
+            self._mod_row_pool[row["is_dir"]].append(row)
+        self._mod_rows.clear()
+
+        pooled_frames = set()
+        for pool in self._mod_row_pool.values():
+            pool[:] = [row for row in pool if row["frame"].winfo_exists()]
+            for row in pool:
+                row["frame"].pack_forget()
+                pooled_frames.add(row["frame"])
+
+        for widget in self.item_list_frame.winfo_children():
+            if widget not in pooled_frames:
+                widget.destroy()
+
+    def _build_mod_item_row(self, is_dir: bool) -> dict:
+        """Create the widgets for an installed-mod row (not yet packed).
+
+        Callbacks read row["path"], so the row can be reused for other items.
+        """
+        frame = ctk.CTkFrame(self.item_list_frame, cursor="hand2", fg_color=("gray95", "gray17"))
+        row = {"frame": frame, "is_dir": is_dir, "path": None}
+
+        # Make row clickable (one callback shared by the row and its labels)
+        on_click = lambda e, r=row: self._on_mod_item_selected(r["path"])
+        frame.bind("<Button-1>", on_click)
 
         # Icon indicator - use unicode symbols with colors
-        if item_path.is_dir():
+        if is_dir:
             icon_text = "\U0001F4C1"  # Folder icon
             icon_color = ("#FFD700", "#FFD700")  # Yellow/gold
             tooltip_text = "Directory"
@@ -3094,126 +4328,138 @@ class MainWindow(ctk.CTk):
             tooltip_text = "File"
 
         icon_label = ctk.CTkLabel(
-            row, text=icon_text,
+            frame, text=icon_text,
             font=("Segoe UI Emoji", 14),
             text_color=icon_color,
             width=30
         )
         icon_label.pack(side="left", padx=(PADDING["small"], 5))
-        icon_label.bind("<Button-1>", lambda e, p=item_path: self._on_mod_item_selected(p))
+        icon_label.bind("<Button-1>", on_click)
         self._create_tooltip(icon_label, tooltip_text)
 
-        # Name label (show .pak name without extension for cleaner look)
-        display_name = item_path.stem if item_path.is_file() else item_path.name
-        name_label = ctk.CTkLabel(
-            row, text=display_name,
-            font=FONTS["body"], anchor="w"
-        )
+        name_label = ctk.CTkLabel(frame, text="", font=FONTS["body"], anchor="w")
         name_label.pack(side="left", fill="x", expand=True, padx=(0, PADDING["small"]), pady=PADDING["small"])
-        name_label.bind("<Button-1>", lambda e, p=item_path: self._on_mod_item_selected(p))
+        name_label.bind("<Button-1>", on_click)
+
+        row["name"] = name_label
+        return row
+
+    def _create_mod_item_row(self, item_path: Path, is_dir: Optional[bool] = None) -> ctk.CTkFrame:
+        """Show a clickable row for a mod file or directory, reusing a pooled row if possible.
+
+        Args:
+            item_path: Mod file or directory in Paks
+            is_dir: Whether item_path is a directory, if already known from a scan
+
+        Returns:
+            The row frame
+        """
+        if is_dir is None:
+            is_dir = item_path.is_dir()
+
+        pool = self._mod_row_pool[is_dir]
+        row = pool.pop() if pool else self._build_mod_item_row(is_dir)
+        row["path"] = item_path
+
+        # Name label (show .pak name without extension for cleaner look)
+        row["name"].configure(text=item_path.name if is_dir else item_path.stem)
+        row["frame"].pack(fill="x", pady=1)
+        self._mod_rows.append(row)
 
         # Store reference for highlighting
-        self.version_rows[item_path.name] = row
+        self.version_rows[item_path.name] = row["frame"]
+        return row["frame"]
 
     def _on_mod_item_selected(self, item_path: Path):
         """Handle mod item selection."""
         self.selected_mod_item = item_path
 
-        # Update highlighting on all rows and add/remove action buttons
-        for name, row in self.version_rows.items():
-            # Remove old action buttons if present
-            for child in row.winfo_children():
-                if isinstance(child, ctk.CTkButton):
-                    child.destroy()
-
-            is_selected = (name == item_path.name)
-            row.configure(fg_color=("gray85", "gray25") if is_selected else ("gray95", "gray17"))
+        # Move the highlight (and action buttons) from the previous row. Tracked
+        # apart from _selected_version_row, which the right-pane rebuild in
+        # _refresh_available_mods below resets.
+        self._unselect_row(self._selected_mod_row)
+        row = self.version_rows.get(item_path.name)
+        if row is not None:
+            row.configure(fg_color=("gray85", "gray25"))
+        self._selected_mod_row = row
+
+        # Add action buttons for selected item
+        if row is not None:
+            if item_path.is_dir():
+                # Directory selected - show move/remove button
+                if os.path.normcase(item_path.name) in self._mods_backup_names:
+                    # Mod already in backup - show remove from Installed option
+                    action_btn = ctk.CTkButton(
+                        row, text="\u2717", width=28, height=24,  # X mark
+                        font=("Segoe UI", 14, "bold"),
+                        text_color="red",
+                        fg_color="transparent", hover_color=("gray80", "gray30"),
+                        command=lambda p=item_path: self._prompt_remove_installed_mod_dir(p)
+                    )
+                    action_btn.pack(side="right", padx=PADDING["small"])
+                    self._create_tooltip(action_btn, "Remove from Installed Mods")
+                else:
+                    # Mod not in backup - show move option
+                    action_btn = ctk.CTkButton(
+                        row, text="\u27A4", width=28, height=24,  # Bold right arrow
+                        font=("Segoe UI", 14, "bold"),
+                        text_color=("gray10", "gray90"),
+                        fg_color="transparent", hover_color=("gray80", "gray30"),
+                        command=lambda p=item_path: self._move_mod_to_available(p)
+                    )
+                    action_btn.pack(side="right", padx=PADDING["small"])
+                    self._create_tooltip(action_btn, "Move to Available Mods")
+            else:
+                # File selected (.pak) - show folder button and optionally arrow/X button
+                mod_name = item_path.stem  # Filename without extension
 
-            # Add action buttons for selected item
-            if is_selected:
-                backup_root = (
-                    self.config_manager.config.settings.backup_location
-                    or GamePaths.BACKUP_DEFAULT
+                # Check if files already exist in backup/mods (names from the last scan)
+                files_exist_in_backup = (
+                    os.path.normcase(f"{mod_name}.pak") in self._mods_backup_names or
+                    os.path.normcase(mod_name) in self._mods_backup_names
                 )
 
-                if item_path.is_dir():
-                    # Directory selected - show move/remove button
-                    mods_backup_path = backup_root / "mods" / item_path.name
-
-                    if mods_backup_path.exists():
-                        # Mod already in backup - show remove from Installed option
-                        action_btn = ctk.CTkButton(
-                            row, text="\u2717", width=28, height=24,  # X mark
-                            font=("Segoe UI", 14, "bold"),
-                            text_color="red",
-                            fg_color="transparent", hover_color=("gray80", "gray30"),
-                            command=lambda p=item_path: self._prompt_remove_installed_mod_dir(p)
-                        )
-                        action_btn.pack(side="right", padx=PADDING["small"])
-                        self._create_tooltip(action_btn, "Remove from Installed Mods")
-                    else:
-                        # Mod not in backup - show move option
-                        action_btn = ctk.CTkButton(
-                            row, text="\u27A4", width=28, height=24,  # Bold right arrow
-                            font=("Segoe UI", 14, "bold"),
-                            text_color=("gray10", "gray90"),
-                            fg_color="transparent", hover_color=("gray80", "gray30"),
-                            command=lambda p=item_path: self._move_mod_to_available(p)
-                        )
-                        action_btn.pack(side="right", padx=PADDING["small"])
-                        self._create_tooltip(action_btn, "Move to Available Mods")
-                else:
-                    # File selected (.pak) - show folder button and optionally arrow/X button
-                    mod_name = item_path.stem  # Filename without extension
-                    mods_backup_path = backup_root / "mods"
-
-                    # Check if files already exist in backup/mods
-                    files_exist_in_backup = (
-                        (mods_backup_path / f"{mod_name}.pak").exists() or
-                        (mods_backup_path / mod_name).exists()
+                if files_exist_in_backup:
+                    # Files already exist in backup - show remove from Installed option
+                    action_btn = ctk.CTkButton(
+                        row, text="\u2717", width=28, height=24,  # X mark
+                        font=("Segoe UI", 14, "bold"),
+                        text_color="red",
+                        fg_color="transparent", hover_color=("gray80", "gray30"),
+                        command=lambda p=item_path: self._prompt_remove_installed_mod_files(p)
                     )
-
-                    if files_exist_in_backup:
-                        # Files already exist in backup - show remove from Installed option
-                        action_btn = ctk.CTkButton(
-                            row, text="\u2717", width=28, height=24,  # X mark
-                            font=("Segoe UI", 14, "bold"),
-                            text_color="red",
-                            fg_color="transparent", hover_color=("gray80", "gray30"),
-                            command=lambda p=item_path: self._prompt_remove_installed_mod_files(p)
-                        )
-                        action_btn.pack(side="right", padx=2)
-                        self._create_tooltip(action_btn, "Remove from Installed Mods")
-                    else:
-                        # Arrow button - move files to Available Mods
-                        arrow_btn = ctk.CTkButton(
-                            row, text="\u27A4", width=28, height=24,  # Bold right arrow
-                            font=("Segoe UI", 14, "bold"),
-                            text_color=("gray10", "gray90"),
-                            fg_color="transparent", hover_color=("gray80", "gray30"),
-                            command=lambda p=item_path: self._move_mod_files_to_available(p)
-                        )
-                        arrow_btn.pack(side="right", padx=2)
-                        self._create_tooltip(arrow_btn, "Move files to Available Mods")
-
-                    # Folder button - ALWAYS show for files so user can organize into folder
-                    folder_btn = ctk.CTkButton(
-                        row, text="\U0001F4C1", width=28, height=24,  # Folder icon
-                        font=("Segoe UI Emoji", 12),
-                        text_color=("#FFD700", "#FFD700"),
+                    action_btn.pack(side="right", padx=2)
+                    self._create_tooltip(action_btn, "Remove from Installed Mods")
+                else:
+                    # Arrow button - move files to Available Mods
+                    arrow_btn = ctk.CTkButton(
+                        row, text="\u27A4", width=28, height=24,  # Bold right arrow
+                        font=("Segoe UI", 14, "bold"),
+                        text_color=("gray10", "gray90"),
                         fg_color="transparent", hover_color=("gray80", "gray30"),
-                        command=lambda p=item_path: self._create_folder_for_mod_files(p)
+                        command=lambda p=item_path: self._move_mod_files_to_available(p)
                     )
-                    folder_btn.pack(side="right", padx=2)
-                    self._create_tooltip(folder_btn, "Create folder and organize files")
+                    arrow_btn.pack(side="right", padx=2)
+                    self._create_tooltip(arrow_btn, "Move files to Available Mods")
+
+                # Folder button - ALWAYS show for files so user can organize into folder
+                folder_btn = ctk.CTkButton(
+                    row, text="\U0001F4C1", width=28, height=24,  # Folder icon
+                    font=("Segoe UI Emoji", 12),
+                    text_color=("#FFD700", "#FFD700"),
+                    fg_color="transparent", hover_color=("gray80", "gray30"),
+                    command=lambda p=item_path: self._create_folder_for_mod_files(p)
+                )
+                folder_btn.pack(side="right", padx=2)
+                self._create_tooltip(folder_btn, "Create folder and organize files")
 
         self._refresh_available_mods()
         self._set_status(f"Selected: {item_path.name}")
 
     def _move_mod_to_available(self, item_path: Path):
         """Move a mod directory to the backup/mods directory."""
-        import shutil
-        from ..config.path_validator import is_safe_path, is_path_under_root, sanitize_filename
+        if self._mod_operation_busy():
+            return
 
         backup_root = (
             self.config_manager.config.settings.backup_location
@@ -3237,16 +4483,15 @@ class MainWindow(ctk.CTk):
             shutil.move(str(item_path), str(dest_path))
             self._set_status(f"Moved '{item_path.name}' to Available Mods")
             # Refresh both panes
+            self._paks_mtime_ns = None
             self._refresh_mods_list()
         except (OSError, IOError, shutil.Error) as e:
             self._set_status(f"Failed to move mod: {e}")
 
     def _prompt_remove_installed_mod_dir(self, item_path: Path):
         """Prompt to remove a mod directory from Installed Mods (game's Paks folder)."""
-        import time
-        import os
-        import stat
-        from ..config.path_validator import is_safe_path, is_path_under_root
+        if self._mod_operation_busy():
+            return
 
         # Check if deletion is enabled
         if not self.config_manager.config.settings.enable_deletion:
@@ -3274,27 +4519,14 @@ class MainWindow(ctk.CTk):
             os.chmod(path, stat.S_IWRITE)
             func(path)
 
-        def clear_readonly_recursive(path: Path):
-            """Clear read-only attribute from directory and all contents."""
-            try:
-                os.chmod(str(path), stat.S_IWRITE | stat.S_IREAD | stat.S_IEXEC)
-                if path.is_dir():
-                    for item in path.iterdir():
-                        clear_readonly_recursive(item)
-            except OSError as e:
-                logger.debug("Could not clear read-only on %s: %s", path, e)
-
         if self._show_confirm_dialog("Remove from Installed?", message):
-            import shutil
             errors_log = []
             try:
                 if item_path.is_dir():
-                    # First, clear read-only attributes from all files/folders
-                    try:
-                        clear_readonly_recursive(item_path)
-                        errors_log.append("Cleared read-only attributes")
-                    except OSError as e:
-                        errors_log.append(f"Could not clear read-only: {e}")
+                    # First, clear read-only attributes from all files/folders (once;
+                    # the retries below rely on remove_readonly for stragglers)
+                    _clear_readonly_tree(item_path)
+                    errors_log.append("Cleared read-only attributes")
 
                     # First attempt with onerror handler
                     try:
@@ -3320,12 +4552,6 @@ class MainWindow(ctk.CTk):
                         # Small delay before retry (Windows file handles may need time to release)
                         time.sleep(0.2)
 
-                        # Clear read-only again before retry
-                        try:
-                            clear_readonly_recursive(item_path)
-                        except OSError as e:
-                            logger.debug("Retry clear read-only failed: %s", e)
-
                         try:
                             if item_path.is_dir():
                                 # Try removing with os.rmdir if empty
@@ -3357,17 +4583,13 @@ class MainWindow(ctk.CTk):
                         self._set_status(f"Removed folder '{item_path.name}' from Installed Mods")
                 elif item_path.is_file():
                     # If somehow a file was passed, delete the file and related files
-                    mod_name = item_path.stem
-                    containing_dir = item_path.parent
-                    extensions = [".pak", ".ucas", ".utoc"]
-                    for ext in extensions:
-                        file_path = containing_dir / f"{mod_name}{ext}"
-                        if file_path.exists():
-                            file_path.unlink()
+                    for mod_file in _find_mod_files(item_path.parent, item_path.stem):
+                        os.unlink(mod_file.path)
                     self._set_status(f"Removed '{item_path.name}' from Installed Mods")
                 else:
                     self._set_status(f"Path does not exist: {item_path}")
                 # Refresh to update the mods list
+                self._paks_mtime_ns = None
                 self._refresh_mods_list()
             except (OSError, IOError, shutil.Error) as e:
                 self._show_info_dialog("Removal Error", f"Failed to remove mod: {e}\n\nLog:\n" + "\n".join(errors_log))
@@ -3379,39 +4601,38 @@ class MainWindow(ctk.CTk):
         Takes a .pak file, creates a directory with the mod name (no extension),
         and moves the .pak, .ucas, and .utoc files into that directory.
         """
-        import shutil
+        if self._mod_operation_busy():
+            return
 
-        mod_name = item_path.stem  # Filename without extension
-        paks_dir = item_path.parent  # The Paks directory
+        paks_dir, file_name = os.path.split(item_path)  # The Paks directory
+        mod_name = os.path.splitext(file_name)[0]  # Filename without extension
 
         # Create the new folder in the Paks directory
-        folder_path = paks_dir / mod_name
+        folder_path = os.path.join(paks_dir, mod_name)
 
         try:
-            folder_path.mkdir(exist_ok=True)
+            os.makedirs(folder_path, exist_ok=True)
 
             # Find and move all 3 files
-            extensions = [".pak", ".ucas", ".utoc"]
             moved_count = 0
-            for ext in extensions:
-                source_file = paks_dir / f"{mod_name}{ext}"
-                if source_file.exists():
-                    dest_file = folder_path / source_file.name
-                    shutil.move(str(source_file), str(dest_file))
-                    moved_count += 1
+            for mod_file in _find_mod_files(paks_dir, mod_name):
+                _move_file(mod_file.path, os.path.join(folder_path, mod_file.name))
+                moved_count += 1
 
             self._set_status(f"Created folder '{mod_name}' with {moved_count} files")
             # Refresh the mods list
+            self._paks_mtime_ns = None
             self._refresh_mods_list()
         except (OSError, IOError, shutil.Error) as e:
             self._set_status(f"Failed to create folder: {e}")
 
     def _move_mod_files_to_available(self, item_path: Path):
         """Move all 3 mod files (.pak, .ucas, .utoc) to backup/mods directory."""
-        import shutil
+        if self._mod_operation_busy():
+            return
 
-        mod_name = item_path.stem  # Filename without extension
-        paks_dir = item_path.parent  # The Paks directory
+        paks_dir, file_name = os.path.split(item_path)  # The Paks directory
+        mod_name = os.path.splitext(file_name)[0]  # Filename without extension
 
         backup_root = (
             self.config_manager.config.settings.backup_location
@@ -3421,26 +4642,28 @@ class MainWindow(ctk.CTk):
 
         # Ensure mods directory exists
         mods_backup_path.mkdir(parents=True, exist_ok=True)
+        mods_backup_dir = os.fspath(mods_backup_path)
 
         try:
             # Find and move all 3 files
-            extensions = [".pak", ".ucas", ".utoc"]
             moved_count = 0
-            for ext in extensions:
-                source_file = paks_dir / f"{mod_name}{ext}"
-                if source_file.exists():
-                    dest_file = mods_backup_path / source_file.name
-                    shutil.move(str(source_file), str(dest_file))
-                    moved_count += 1
+            for mod_file in _find_mod_files(paks_dir, mod_name):
+                # Plain rename when Paks and the backup share a volume
+                _move_file(mod_file.path, os.path.join(mods_backup_dir, mod_file.name))
+                moved_count += 1
 
             self._set_status(f"Moved {moved_count} files for '{mod_name}' to Available Mods")
             # Refresh the mods list
+            self._paks_mtime_ns = None
             self._refresh_mods_list()
         except (OSError, IOError, shutil.Error) as e:
             self._set_status(f"Failed to move mod files: {e}")
 
     def _prompt_remove_installed_mod_files(self, item_path: Path):
         """Prompt to remove mod files from Installed Mods (game's Paks folder)."""
+        if self._mod_operation_busy():
+            return
+
         # Check if deletion is enabled
         if not self.config_manager.config.settings.enable_deletion:
             self._set_status("Deletion is disabled. Enable it in Settings.")
@@ -3454,21 +4677,20 @@ class MainWindow(ctk.CTk):
         if self._show_confirm_dialog("Remove from Installed?", message):
             try:
                 # Delete all 3 files if they exist
-                extensions = [".pak", ".ucas", ".utoc"]
                 deleted_count = 0
-                for ext in extensions:
-                    file_path = containing_dir / f"{mod_name}{ext}"
-                    if file_path.exists():
-                        file_path.unlink()
-                        deleted_count += 1
+                for mod_file in _find_mod_files(containing_dir, mod_name):
+                    os.unlink(mod_file.path)
+                    deleted_count += 1
 
                 # If the containing directory is now empty and it's a mod subdirectory
                 # (not the main Paks folder), remove it too
-                if containing_dir.exists() and containing_dir.name != "Paks":
+                if containing_dir.name != "Paks":
                     try:
-                        # Check if directory is empty
-                        remaining_files = list(containing_dir.iterdir())
-                        if not remaining_files:
+                        # Check if directory is empty (first entry only; a
+                        # missing directory raises and is reported as before)
+                        with os.scandir(containing_dir) as it:
+                            is_empty = next(it, None) is None
+                        if is_empty:
                             containing_dir.rmdir()
                             self._set_status(f"Removed '{mod_name}' and empty folder from Installed Mods")
                         else:
@@ -3479,6 +4701,7 @@ class MainWindow(ctk.CTk):
                     self._set_status(f"Removed '{mod_name}' from Installed Mods ({deleted_count} files)")
 
                 # Refresh the mods list
+                self._paks_mtime_ns = None
                 self._refresh_mods_list()
             except OSError as e:
                 self._set_status(f"Failed to remove mod files: {e}")
@@ -3486,10 +4709,11 @@ class MainWindow(ctk.CTk):
     def _refresh_available_mods(self):
         """Refresh the right pane with available mods from backup/mods directory."""
         # Clear existing items
-        for widget in self.versions_list_frame.winfo_children():
-            widget.destroy()
+        self._reset_versions_list_frame()
 
         self.available_mod_rows.clear()
+        self._available_mod_buttons.clear()
+        self._selected_available_name = None
         self.selected_available_mod = None
         self.versions_count_label.configure(text="")
 
@@ -3499,37 +4723,25 @@ class MainWindow(ctk.CTk):
             or GamePaths.BACKUP_DEFAULT
         )
         mods_path = backup_root / "mods"
+        self._mods_backup_names = set()
 
-        if not mods_path.exists():
-            # Create the mods directory if it doesn't exist
+        # Get all mod files and directories (only .pak files for files), tagged
+        # with a precomputed sort key; scandir entries carry their file type
+        tagged = []
+        try:
+            with os.scandir(mods_path) as it:
+                for entry in it:
+                    self._mods_backup_names.add(os.path.normcase(entry.name))
+                    is_file = entry.is_file()
+                    name_lower = entry.name.lower()
+                    if not is_file or name_lower.endswith(".pak"):
+                        tagged.append((is_file, name_lower, Path(entry.path)))
+        except FileNotFoundError:
+            # Create the mods directory if it doesn't exist (shown as empty below)
             try:
                 mods_path.mkdir(parents=True, exist_ok=True)
             except OSError as e:
                 logger.warning("Could not create mods directory %s: %s", mods_path, e)
-
-            placeholder = ctk.CTkLabel(
-                self.versions_list_frame,
-                text="No available mods\n\nAdd mod files to:\n" + str(mods_path),
-                font=FONTS["body"],
-                text_color="gray",
-                justify="center"
-            )
-            placeholder.pack(pady=PADDING["large"])
-            return
-
-        # Get all mod files and directories (only .pak files for files)
-        try:
-            items = []
-            for item in mods_path.iterdir():
-                if item.is_file():
-                    if item.suffix.lower() == ".pak":
-                        items.append(item)
-                else:
-                    items.append(item)
-
-            # Sort: directories first, then files, alphabetically
-            items.sort(key=lambda x: (not x.is_dir(), x.name.lower()))
-            self.available_mods_items = items
         except OSError as e:
             placeholder = ctk.CTkLabel(
                 self.versions_list_frame,
@@ -3541,6 +4753,12 @@ class MainWindow(ctk.CTk):
             placeholder.pack(pady=PADDING["large"])
             return
 
+        # Sort: directories first, then files, alphabetically
+        # (plain tuple compare; names are unique, so Paths only break case-only ties)
+        tagged.sort()
+        items = [item for _, _, item in tagged]
+        self.available_mods_items = items
+
         self.versions_count_label.configure(text=f"({len(items)})")
 
         if not items:
@@ -3554,23 +4772,33 @@ class MainWindow(ctk.CTk):
             placeholder.pack(pady=PADDING["large"])
             return
 
-        # Create row for each available mod
-        for item in items:
-            self._create_available_mod_row(item)
+        # Create row for each available mod (batched as the list is scrolled)
+        self._render_rows_lazily(
+            self.versions_list_frame,
+            [(item, not is_file) for is_file, _, item in tagged],
+            lambda row_item: self._create_available_mod_row(*row_item),
+        )
 
-    def _create_available_mod_row(self, item_path: Path):
-        """Create a row for an available mod in the right pane."""
-        row = ctk.CTkFrame(self.versions_list_frame, cursor="hand2")
+    def _create_available_mod_row(self, item_path: Path, is_dir: Optional[bool] = None):
+        """Create a row for an available mod in the right pane.
+
+        Args:
+            item_path: Mod file or directory in backup/mods
+            is_dir: Whether item_path is a directory, if already known from a scan
+        """
+        if is_dir is None:
+            is_dir = item_path.is_dir()
+        row = ctk.CTkFrame(self.versions_list_frame, cursor="hand2", fg_color=("gray95", "gray17"))
         row.pack(fill="x", pady=1)
 
         # Make row clickable
-        row.bind("<Button-1>", lambda e, p=item_path: self._on_available_mod_selected(p))
+        row.bind("<Button-1>", lambda e, p=item_path, d=is_dir: self._on_available_mod_selected(p, d))
 
         # Store reference for highlighting
-        self.available_mod_rows[item_path.name] = row
+        self.available_mod_rows[item_path.name] = (row, is_dir)
 
         # Icon indicator
-        if item_path.is_dir():
+        if is_dir:
             icon_text = "\U0001F4C1"  # Folder icon
             icon_color = ("#FFD700", "#FFD700")  # Yellow/gold
             tooltip_text = "Directory"
@@ -3586,85 +4814,115 @@ class MainWindow(ctk.CTk):
             width=30
         )
         icon_label.pack(side="left", padx=(PADDING["small"], 5))
-        icon_label.bind("<Button-1>", lambda e, p=item_path: self._on_available_mod_selected(p))
+        icon_label.bind("<Button-1>", lambda e, p=item_path, d=is_dir: self._on_available_mod_selected(p, d))
         self._create_tooltip(icon_label, tooltip_text)
 
         # Name label
-        display_name = item_path.stem if item_path.is_file() else item_path.name
+        display_name = item_path.name if is_dir else item_path.stem
         name_label = ctk.CTkLabel(
             row, text=display_name,
             font=FONTS["body"], anchor="w"
         )
         name_label.pack(side="left", fill="x", expand=True, padx=(0, PADDING["small"]), pady=PADDING["small"])
-        name_label.bind("<Button-1>", lambda e, p=item_path: self._on_available_mod_selected(p))
+        name_label.bind("<Button-1>", lambda e, p=item_path, d=is_dir: self._on_available_mod_selected(p, d))
+
+    def _on_available_mod_selected(self, item_path: Path, is_dir: bool):
+        """Handle available mod item selection.
 
-    def _on_available_mod_selected(self, item_path: Path):
-        """Handle available mod item selection."""
+        Args:
+            item_path: Selected mod file or directory in backup/mods
+            is_dir: Whether item_path is a directory (from the listing scan)
+        """
         self.selected_available_mod = item_path
 
-        # Update highlighting on all rows and add/remove action buttons
-        for name, row in self.available_mod_rows.items():
-            # Remove old action buttons if present
-            for child in row.winfo_children():
-                if isinstance(child, ctk.CTkButton):
-                    child.destroy()
+        # Unhighlight the previous row and hide its buttons (kept for reuse)
+        previous = self.available_mod_rows.get(self._selected_available_name)
+        if previous is not None and previous[0].winfo_exists():
+            for button, _ in self._available_mod_buttons.get(self._selected_available_name, ()):
+                button.pack_forget()
+            previous[0].configure(fg_color=("gray95", "gray17"))
+
+        self._selected_available_name = item_path.name
+        current = self.available_mod_rows.get(item_path.name)
+        if current is not None:
+            row = current[0]
+            row.configure(fg_color=("gray85", "gray25"))
+            buttons = self._available_mod_buttons.get(item_path.name)
+            if buttons is None:
+                buttons = self._build_available_mod_buttons(row, item_path, is_dir)
+                self._available_mod_buttons[item_path.name] = buttons
+            for button, padx in buttons:
+                button.pack(side="right", padx=padx)
 
-            is_selected = (name == item_path.name)
-            row.configure(fg_color=("gray85", "gray25") if is_selected else ("gray95", "gray17"))
+        self._set_status(f"Selected available mod: {item_path.name}")
 
-            # Add action buttons for selected item
-            if is_selected:
-                # Red trash can button to delete (always visible)
-                trash_image = self._load_icon("icons/trash.png", size=(16, 16))
-                if trash_image:
-                    trash_btn = ctk.CTkButton(
-                        row, image=trash_image, text="", width=24, height=24,
-                        fg_color="transparent", hover_color=("#ffcccc", "#4a1a1a"),
-                        command=lambda p=item_path: self._prompt_delete_available_mod(p)
-                    )
-                else:
-                    trash_btn = ctk.CTkButton(
-                        row, text="🗑", width=24, height=24,
-                        font=FONTS["small"], text_color="red",
-                        fg_color="transparent", hover_color=("#ffcccc", "#4a1a1a"),
-                        command=lambda p=item_path: self._prompt_delete_available_mod(p)
-                    )
-                trash_btn.pack(side="right", padx=2)
-                self._create_tooltip(trash_btn, "Delete mod")
-
-                # Left arrow button to install
-                action_btn = ctk.CTkButton(
-                    row, text="\u276E", width=28, height=24,  # Bold left arrow
-                    font=("Segoe UI", 14, "bold"),
-                    text_color=("gray10", "gray90"),
-                    fg_color="transparent", hover_color=("gray80", "gray30"),
-                    command=lambda p=item_path: self._install_mod_from_available(p)
-                )
-                action_btn.pack(side="right", padx=PADDING["small"])
-                self._create_tooltip(action_btn, "Install to Game")
-
-                # For files, add folder button to organize into directory
-                if item_path.is_file():
-                    folder_btn = ctk.CTkButton(
-                        row, text="\U0001F4C1", width=28, height=24,  # Folder icon
-                        font=("Segoe UI", 12),
-                        text_color=("#D4A017", "#FFD700"),  # Yellow/gold color
-                        fg_color="transparent", hover_color=("gray80", "gray30"),
-                        command=lambda p=item_path: self._organize_available_mod_files(p)
-                    )
-                    folder_btn.pack(side="right", padx=2)
-                    self._create_tooltip(folder_btn, "Organize into folder")
+    def _build_available_mod_buttons(
+        self, row: ctk.CTkFrame, item_path: Path, is_dir: bool
+    ) -> list[tuple[ctk.CTkButton, int]]:
+        """Create an available mod row's action buttons (not yet packed).
 
-        self._set_status(f"Selected available mod: {item_path.name}")
+        Returns:
+            (button, padx) pairs in packing order
+        """
+        buttons = []
+
+        # Red trash can button to delete (always visible)
+        trash_image = self._load_icon("icons/trash.png", size=(16, 16))
+        if trash_image:
+            trash_btn = ctk.CTkButton(
+                row, image=trash_image, text="", width=24, height=24,
+                fg_color="transparent", hover_color=("#ffcccc", "#4a1a1a"),
+                command=lambda p=item_path: self._prompt_delete_available_mod(p)
+            )
+        else:
+            trash_btn = ctk.CTkButton(
+                row, text="🗑", width=24, height=24,
+                font=FONTS["small"], text_color="red",
+                fg_color="transparent", hover_color=("#ffcccc", "#4a1a1a"),
+                command=lambda p=item_path: self._prompt_delete_available_mod(p)
+            )
+        self._create_tooltip(trash_btn, "Delete mod")
+        buttons.append((trash_btn, 2))
+
+        # Left arrow button to install
+        action_btn = ctk.CTkButton(
+            row, text="\u276E", width=28, height=24,  # Bold left arrow
+            font=("Segoe UI", 14, "bold"),
+            text_color=("gray10", "gray90"),
+            fg_color="transparent", hover_color=("gray80", "gray30"),
+            command=lambda p=item_path: self._install_mod_from_available(p)
+        )
+        self._create_tooltip(action_btn, "Install to Game")
+        buttons.append((action_btn, PADDING["small"]))
+
+        # For files, add folder button to organize into directory
+        if not is_dir:
+            folder_btn = ctk.CTkButton(
+                row, text="\U0001F4C1", width=28, height=24,  # Folder icon
+                font=("Segoe UI", 12),
+                text_color=("#D4A017", "#FFD700"),  # Yellow/gold color
+                fg_color="transparent", hover_color=("gray80", "gray30"),
+                command=lambda p=item_path: self._organize_available_mod_files(p)
+            )
+            self._create_tooltip(folder_btn, "Organize into folder")
+            buttons.append((folder_btn, 2))
+
+        return buttons
 
     def _install_mod_from_available(self, item_path: Path):
-        """Copy a mod from Available Mods to Installed Mods (game's Paks folder)."""
-        import shutil
+        """Copy a mod from Available Mods to Installed Mods (game's Paks folder).
 
+        Overwrite prompts run here; the copies run on the I/O workers (a
+        packaged mod's three files in parallel) and the Installed list is
+        refreshed once they have all finished.
+        """
         if not self.current_installation or not self.current_installation.game_path:
             self._set_status("No game installation selected")
             return
 
+        if self._mod_operation_busy():
+            return
+
         paks_dir = self.current_installation.game_path / "Moria" / "Content" / "Paks"
 
         if not paks_dir.exists():
@@ -3677,27 +4935,21 @@ class MainWindow(ctk.CTk):
             if item_path.is_dir():
                 # Check if directory already exists
                 dest_path = paks_dir / item_path.name
-                if dest_path.exists():
+                replace = dest_path.exists()
+                if replace:
                     choice = self._show_overwrite_skip_dialog(
                         "Already Installed",
                         f"The mod '{item_path.name}' is already installed.\n\nWould you like to overwrite it?"
                     )
                     if choice == "skip":
                         return
-                    # Overwrite: remove existing directory first
-                    shutil.rmtree(str(dest_path))
 
-                # Copy directory
-                shutil.copytree(str(item_path), str(dest_path))
-                self._set_status(f"Installed '{item_path.name}' to game")
+                # Copy directory (replacing the existing one on overwrite)
+                tasks = [functools.partial(self._copy_mod_dir, item_path, dest_path, replace)]
+                done_message = f"Installed '{item_path.name}' to game"
             else:
                 # File (.pak) - check if any of the 3 files already exist
-                extensions = [".pak", ".ucas", ".utoc"]
-                existing_files = []
-                for ext in extensions:
-                    dest_file = paks_dir / f"{mod_name}{ext}"
-                    if dest_file.exists():
-                        existing_files.append(dest_file.name)
+                existing_files = _find_mod_files(paks_dir, mod_name)
 
                 if existing_files:
                     choice = self._show_overwrite_skip_dialog(
@@ -3707,10 +4959,8 @@ class MainWindow(ctk.CTk):
                     if choice == "skip":
                         return
                     # Overwrite: remove existing files first
-                    for ext in extensions:
-                        dest_file = paks_dir / f"{mod_name}{ext}"
-                        if dest_file.exists():
-                            dest_file.unlink()
+                    for dest_file in existing_files:
+                        os.unlink(dest_file.path)
 
                 # Copy all 3 files
                 backup_root = (
@@ -3719,21 +4969,113 @@ class MainWindow(ctk.CTk):
                 )
                 mods_backup_path = backup_root / "mods"
 
-                copied_count = 0
-                for ext in extensions:
-                    source_file = mods_backup_path / f"{mod_name}{ext}"
-                    if source_file.exists():
-                        dest_file = paks_dir / source_file.name
-                        shutil.copy2(str(source_file), str(dest_file))
-                        copied_count += 1
+                paks_dir_str = os.fspath(paks_dir)
+                tasks = [
+                    functools.partial(_fastcopy, source_file.path, os.path.join(paks_dir_str, source_file.name))
+                    for source_file in _find_mod_files(mods_backup_path, mod_name)
+                ]
+                done_message = f"Installed '{mod_name}' ({len(tasks)} files) to game"
 
-                self._set_status(f"Installed '{mod_name}' ({copied_count} files) to game")
+        except (OSError, IOError, shutil.Error) as e:
+            self._set_status(f"Failed to install mod: {e}")
+            return
+
+        progress = {"pending": len(tasks), "installed": 0, "total": len(tasks), "error": None}
+        if not tasks:
+            self._finish_mod_install(progress, done_message)
+            return
+
+        self._install_in_progress = True
+        self._set_status(f"Installing '{mod_name}'...")
+        for task in tasks:
+            future = self._parallel_io.submit(task)
+            future.add_done_callback(
+                lambda f, p=progress, m=done_message: self._post_to_main(self._on_install_copy_done, f, p, m)
+            )
+
+    @staticmethod
+    def _copy_mod_dir(source: Path, dest: Path, replace: bool):
+        """Copy a mod directory into Paks (worker thread).
+
+        Args:
+            source: Mod directory in Available Mods
+            dest: Destination directory in Paks
+            replace: Remove an existing dest first
+        """
+        if replace:
+            shutil.rmtree(dest)
+        shutil.copytree(source, dest, copy_function=_fastcopy)
+
+    def _on_install_copy_done(self, future, progress: dict, done_message: str):
+        """Tally one finished mod copy and finish the install after the last one."""
+        try:
+            future.result()
+            progress["installed"] += 1
+        except (OSError, IOError, shutil.Error) as e:
+            logger.error("Mod install copy failed: %s", e)
+            progress["error"] = e
+        finally:
+            # Counted even if the copy raised something unexpected, so the
+            # guard is always released and later installs aren't blocked
+            progress["pending"] -= 1
+            if not progress["pending"]:
+                self._install_in_progress = False
+                self._finish_mod_install(progress, done_message)
+
+    def _finish_mod_install(self, progress: dict, done_message: str):
+        """Report a finished mod install and refresh the Installed list."""
+        if progress["installed"] == progress["total"]:
+            self._set_status(done_message)
+        else:
+            self._set_status(f"Failed to install mod: {progress['error'] or 'see the log for details'}")
 
-            # Refresh the installed mods list
+        # Refresh the installed mods list
+        self._paks_mtime_ns = None
+        if self.current_mode == "mods":
             self._refresh_mods_list()
 
+    def _mod_operation_busy(self) -> bool:
+        """Return True (and say so in the status bar) while a mod task is running.
+
+        Installs and Available Mods tasks share one guard. Every action on
+        either mods pane checks it, so a mod can't be moved, deleted or
+        reorganized while it is being copied into Paks.
+        """
+        if self._install_in_progress:
+            self._set_status("Another mod operation is already in progress")
+            return True
+        return False
+
+    def _run_available_mod_task(self, task, error_prefix: str):
+        """Run a file operation on Available Mods on the I/O workers.
+
+        The Tk thread returns at once; when the task finishes its status
+        message is shown and the Available Mods list refreshed. Callers
+        check _mod_operation_busy first.
+
+        Args:
+            task: Called on a worker thread; returns the status message
+            error_prefix: Status text before the error if task raises
+        """
+        self._install_in_progress = True
+        future = self._parallel_io.submit(task)
+        future.add_done_callback(
+            lambda f: self._post_to_main(self._on_available_mod_task_done, f, error_prefix)
+        )
+
+    def _on_available_mod_task_done(self, future, error_prefix: str):
+        """Report a finished Available Mods operation (see _run_available_mod_task)."""
+        self._install_in_progress = False
+        try:
+            self._set_status(future.result())
         except (OSError, IOError, shutil.Error) as e:
-            self._set_status(f"Failed to install mod: {e}")
+            logger.error("%s: %s", error_prefix, e)
+            self._set_status(f"{error_prefix}: {e}")
+            return
+
+        # Refresh the available mods list
+        if self.current_mode == "mods":
+            self._refresh_available_mods()
 
     def _organize_available_mod_files(self, item_path: Path):
         """Organize mod files into a folder in Available Mods, or delete if folder exists.
@@ -3745,51 +5087,40 @@ class MainWindow(ctk.CTk):
         If a directory with the mod name already exists:
             - Delete the 3 files (since they're duplicates of what's in the folder)
         """
-        import shutil
+        if self._mod_operation_busy():
+            return
 
-        mod_name = item_path.stem  # Filename without extension
-        mods_dir = item_path.parent  # The mods backup directory
+        mods_dir, file_name = os.path.split(item_path)  # The mods backup directory
+        mod_name = os.path.splitext(file_name)[0]  # Filename without extension
 
-        folder_path = mods_dir / mod_name
+        folder_path = os.path.join(mods_dir, mod_name)
 
-        try:
-            if folder_path.exists() and folder_path.is_dir():
-                # Directory already exists - delete the loose files
-                extensions = [".pak", ".ucas", ".utoc"]
-                deleted_count = 0
-                for ext in extensions:
-                    file_path = mods_dir / f"{mod_name}{ext}"
-                    if file_path.exists():
-                        file_path.unlink()
-                        deleted_count += 1
+        def organize() -> str:
+            if os.path.isdir(folder_path):
+                # Directory already exists - delete the loose files (the scan
+                # already found them, so no existence checks)
+                duplicates = _find_mod_files(mods_dir, mod_name)
+                for mod_file in duplicates:
+                    os.unlink(mod_file.path)
 
-                self._set_status(f"Deleted {deleted_count} duplicate files (folder already exists)")
-            else:
-                # Create folder and move files into it
-                folder_path.mkdir(exist_ok=True)
+                return f"Deleted {len(duplicates)} duplicate files (folder already exists)"
 
-                extensions = [".pak", ".ucas", ".utoc"]
-                moved_count = 0
-                for ext in extensions:
-                    source_file = mods_dir / f"{mod_name}{ext}"
-                    if source_file.exists():
-                        dest_file = folder_path / source_file.name
-                        shutil.move(str(source_file), str(dest_file))
-                        moved_count += 1
+            # Create folder and move files into it
+            os.makedirs(folder_path, exist_ok=True)
 
-                self._set_status(f"Created folder '{mod_name}' with {moved_count} files")
+            moved_count = 0
+            for source_file in _find_mod_files(mods_dir, mod_name):
+                _move_file(source_file.path, os.path.join(folder_path, source_file.name))
+                moved_count += 1
 
-            # Refresh the available mods list
-            self._refresh_available_mods()
+            return f"Created folder '{mod_name}' with {moved_count} files"
 
-        except (OSError, IOError, shutil.Error) as e:
-            self._set_status(f"Failed to organize mod files: {e}")
+        self._run_available_mod_task(organize, "Failed to organize mod files")
 
     def _prompt_delete_available_mod(self, item_path: Path):
         """Prompt to delete a mod from the Available Mods directory."""
-        import os
-        import shutil
-        import stat
+        if self._mod_operation_busy():
+            return
 
         mod_name = item_path.name
 
@@ -3799,166 +5130,198 @@ class MainWindow(ctk.CTk):
 
         def remove_readonly(func, path, excinfo):
             """Error handler for shutil.rmtree to handle read-only files."""
-            os.chmod(path, stat.S_IWRITE)
-            func(path)
-
-        def clear_readonly_recursive(path: Path):
-            """Clear read-only attribute from all files in a directory."""
+            if _IS_WINDOWS:
+                os.chmod(path, stat.S_IWRITE)
+                func(path)
+                return
+            # Deleting needs a writable parent directory, not a writable file.
+            # Grant it only for the retry so a failed delete leaves the
+            # parent's permissions as they were.
+            parent = os.path.dirname(path)
+            mode = stat.S_IMODE(os.stat(parent).st_mode)
+            os.chmod(parent, mode | stat.S_IRWXU)
             try:
-                for root, dirs, files in os.walk(str(path)):
-                    for name in files:
-                        file_path = os.path.join(root, name)
-                        os.chmod(file_path, stat.S_IWRITE | stat.S_IREAD)
-                    for name in dirs:
-                        dir_path = os.path.join(root, name)
-                        os.chmod(dir_path, stat.S_IWRITE | stat.S_IREAD | stat.S_IEXEC)
-                # Also clear on the root path itself
-                os.chmod(str(path), stat.S_IWRITE | stat.S_IREAD | stat.S_IEXEC)
-            except OSError as e:
-                logger.warning("Could not clear read-only attributes: %s", e)
+                func(path)
+            finally:
+                os.chmod(parent, mode)
 
-        try:
-            if item_path.exists():
-                if item_path.is_dir():
-                    # Clear read-only attributes first, then delete with error handler
-                    clear_readonly_recursive(item_path)
-                    shutil.rmtree(item_path, onerror=remove_readonly)
-                else:
-                    # Clear read-only on single file before deletion
-                    os.chmod(str(item_path), stat.S_IWRITE | stat.S_IREAD)
-                    item_path.unlink()
-                logger.info("Deleted mod: %s", item_path)
-                self._set_status(f"Deleted mod '{mod_name}'")
-            else:
-                self._set_status(f"Mod not found: '{mod_name}'")
-
-            # Clear selection and refresh the available mods list
-            self.selected_available_mod = None
-            self._refresh_available_mods()
+        def delete() -> str:
+            if not item_path.exists():
+                return f"Mod not found: '{mod_name}'"
 
-        except (OSError, IOError) as e:
-            logger.error("Error deleting mod %s: %s", mod_name, e)
-            self._set_status(f"Error deleting mod: {e}")
-
-    def _show_info_dialog(self, title: str, message: str):
-        """Show a themed information dialog with OK button only.
+            if item_path.is_dir():
+                # One pass over the tree: read-only entries are made writable
+                # by the error handler as rmtree reaches them
+                shutil.rmtree(item_path, onerror=remove_readonly)
+            else:
+                # Clear read-only on single file before deletion
+                if _IS_WINDOWS:
+                    os.chmod(item_path, stat.S_IWRITE | stat.S_IREAD)
+                os.unlink(item_path)
+            logger.info("Deleted mod: %s", item_path)
+            return f"Deleted mod '{mod_name}'"
+
+        # Deleting a large mod folder runs on a worker; the list (and its
+        # selection) is rebuilt when it is done
+        self._set_status(f"Deleting mod '{mod_name}'...")
+        self._run_available_mod_task(delete, "Error deleting mod")
+
+    def _show_pooled_dialog(
+        self, key: str, title: str, size: tuple[int, int], build, default: str, **texts
+    ) -> str:
+        """Show a modal dialog that is built once and reused, and wait for a choice.
+
+        A closed dialog is withdrawn and kept by key instead of destroyed, so
+        showing it again only updates its text. A dialog opened while another
+        with the same key is still showing gets an instance of its own.
 
         Args:
-            title: Dialog title
-            message: Message to display
+            key: Pool key; every dialog with this key has the same layout
+            title: Window title
+            size: (width, height) in pixels
+            build: Called as build(dialog, close) on first use to create the
+                widgets; returns the widgets to update by name (a "focus"
+                entry gets the focus on each show). close(choice) ends the dialog.
+            default: Choice when the dialog is closed from its title bar
+            **texts: New text for the widgets returned by build, by name
+
+        Returns:
+            The choice passed to close, or default
         """
-        dialog = ctk.CTkToplevel(self)
+        pool = self._dialog_pool.setdefault(key, [])
+        while pool and not pool[-1]["dialog"].winfo_exists():
+            pool.pop()
+        if pool:
+            entry = pool.pop()
+        else:
+            dialog = ctk.CTkToplevel(self)
+            dialog.withdraw()
+            dialog.resizable(False, False)
+            dialog.transient(self)
+            choice = tk.StringVar(dialog)
+            entry = {"dialog": dialog, "choice": choice, "widgets": build(dialog, choice.set)}
+            dialog.protocol("WM_DELETE_WINDOW", lambda: choice.set(default))
+            # The app closing with the dialog open also ends the wait below
+            dialog.bind("<Destroy>", lambda e: choice.set(default) if e.widget is dialog else None)
+
+        dialog, choice, widgets = entry["dialog"], entry["choice"], entry["widgets"]
+        for name, text in texts.items():
+            widgets[name].configure(text=text)
         dialog.title(title)
-        dialog.geometry("400x180")
-        dialog.resizable(False, False)
-        dialog.transient(self)
-        dialog.grab_set()
 
         # Center on parent
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 400) // 2
-        y = self.winfo_y() + (self.winfo_height() - 180) // 2
-        dialog.geometry(f"+{x}+{y}")
+        width, height = size
+        x = self.winfo_x() + (self.winfo_width() - width) // 2
+        y = self.winfo_y() + (self.winfo_height() - height) // 2
+        dialog.geometry(f"{width}x{height}+{x}+{y}")
 
-        # Container
-        container = ctk.CTkFrame(dialog)
-        container.pack(fill="both", expand=True, padx=PADDING["medium"], pady=PADDING["medium"])
+        choice.set("")
+        dialog.deiconify()
+        dialog.grab_set()
+        if "focus" in widgets:
+            widgets["focus"].focus_set()
 
-        # Info icon and title row
-        title_frame = ctk.CTkFrame(container, fg_color="transparent")
-        title_frame.pack(fill="x", pady=(0, PADDING["small"]))
+        # Wait for a button (or the close box)
+        dialog.wait_variable(choice)
 
-        title_label = ctk.CTkLabel(
-            title_frame,
-            text="Information",
-            font=FONTS["heading"],
-            text_color=COLORS["primary"]
-        )
-        title_label.pack(anchor="w")
+        result = choice.get()
+        try:
+            reusable = bool(dialog.winfo_exists())
+        except tk.TclError:
+            reusable = False  # The whole app was destroyed meanwhile
+        if reusable:
+            dialog.grab_release()
+            dialog.withdraw()
+            pool.append(entry)
+        return result
 
-        # Message
-        message_label = ctk.CTkLabel(
-            container,
-            text=message,
-            font=FONTS["body"],
-            wraplength=350,
-            justify="left"
-        )
-        message_label.pack(fill="x", expand=True, pady=PADDING["small"])
+    def _show_info_dialog(self, title: str, message: str):
+        """Show a themed information dialog with OK button only.
 
-        # OK button
-        button_frame = ctk.CTkFrame(container, fg_color="transparent")
-        button_frame.pack(fill="x", pady=(PADDING["small"], 0))
+        Args:
+            title: Dialog title
+            message: Message to display
+        """
+        def build(dialog, close):
+            # Container
+            container = ctk.CTkFrame(dialog)
+            container.pack(fill="both", expand=True, padx=PADDING["medium"], pady=PADDING["medium"])
+
+            # Info icon and title row
+            title_frame = ctk.CTkFrame(container, fg_color="transparent")
+            title_frame.pack(fill="x", pady=(0, PADDING["small"]))
+
+            title_label = ctk.CTkLabel(
+                title_frame,
+                text="Information",
+                font=FONTS["heading"],
+                text_color=COLORS["primary"]
+            )
+            title_label.pack(anchor="w")
 
-        ok_btn = ctk.CTkButton(
-            button_frame,
-            text="OK",
-            width=100,
-            command=dialog.destroy
-        )
-        ok_btn.pack(side="right")
+            # Message
+            message_label = ctk.CTkLabel(
+                container,
+                text="",
+                font=FONTS["body"],
+                wraplength=350,
+                justify="left"
+            )
+            message_label.pack(fill="x", expand=True, pady=PADDING["small"])
 
-        # Handle window close
-        dialog.protocol("WM_DELETE_WINDOW", dialog.destroy)
+            # OK button
+            button_frame = ctk.CTkFrame(container, fg_color="transparent")
+            button_frame.pack(fill="x", pady=(PADDING["small"], 0))
 
-        # Wait for dialog to close
-        dialog.wait_window()
+            ok_btn = ctk.CTkButton(
+                button_frame,
+                text="OK",
+                width=100,
+                command=lambda: close("ok")
+            )
+            ok_btn.pack(side="right")
+            return {"message": message_label}
+
+        self._show_pooled_dialog("info", title, (400, 180), build, "ok", message=message)
 
     def _show_about_dialog(self):
         """Show the About dialog with version and compatibility information."""
-        from .. import __version__, __app_name__
+        def build(dialog, close):
+            # Container
+            container = ctk.CTkFrame(dialog)
+            container.pack(fill="both", expand=True, padx=PADDING["large"], pady=PADDING["large"])
 
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("About")
-        dialog.geometry("350x200")
-        dialog.resizable(False, False)
-        dialog.transient(self)
-        dialog.grab_set()
-
-        # Center on parent
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 350) // 2
-        y = self.winfo_y() + (self.winfo_height() - 200) // 2
-        dialog.geometry(f"+{x}+{y}")
-
-        # Container
-        container = ctk.CTkFrame(dialog)
-        container.pack(fill="both", expand=True, padx=PADDING["large"], pady=PADDING["large"])
-
-        # App name
-        name_label = ctk.CTkLabel(
-            container,
-            text=__app_name__,
-            font=("Segoe UI", 20, "bold"),
-            text_color=COLORS["primary"]
-        )
-        name_label.pack(pady=(PADDING["medium"], PADDING["small"]))
-
-        # Version
-        version_label = ctk.CTkLabel(
-            container,
-            text=f"Version {__version__}",
-            font=FONTS["body"]
-        )
-        version_label.pack(pady=PADDING["small"])
+            # App name
+            name_label = ctk.CTkLabel(
+                container,
+                text=__app_name__,
+                font=("Segoe UI", 20, "bold"),
+                text_color=COLORS["primary"]
+            )
+            name_label.pack(pady=(PADDING["medium"], PADDING["small"]))
 
-        # OK button
-        button_frame = ctk.CTkFrame(container, fg_color="transparent")
-        button_frame.pack(fill="x", pady=(PADDING["large"], 0))
+            # Version
+            version_label = ctk.CTkLabel(
+                container,
+                text=f"Version {__version__}",
+                font=FONTS["body"]
+            )
+            version_label.pack(pady=PADDING["small"])
 
-        ok_btn = ctk.CTkButton(
-            button_frame,
-            text="OK",
-            width=100,
-            command=dialog.destroy
-        )
-        ok_btn.pack()
+            # OK button
+            button_frame = ctk.CTkFrame(container, fg_color="transparent")
+            button_frame.pack(fill="x", pady=(PADDING["large"], 0))
 
-        # Handle window close
-        dialog.protocol("WM_DELETE_WINDOW", dialog.destroy)
+            ok_btn = ctk.CTkButton(
+                button_frame,
+                text="OK",
+                width=100,
+                command=lambda: close("ok")
+            )
+            ok_btn.pack()
+            return {}
 
-        # Wait for dialog to close
-        dialog.wait_window()
+        self._show_pooled_dialog("about", "About", (350, 200), build, "ok")
 
     def _show_overwrite_skip_dialog(self, title: str, message: str) -> str:
         """Show a themed dialog with Overwrite and Skip buttons.
@@ -3970,96 +5333,70 @@ class MainWindow(ctk.CTk):
         Returns:
             "overwrite" if Overwrite was clicked, "skip" if Skip was clicked or dialog closed
         """
-        result = {"choice": "skip"}  # Default to skip
-
-        dialog = ctk.CTkToplevel(self)
-        dialog.title(title)
-        dialog.geometry("400x180")
-        dialog.resizable(False, False)
-        dialog.transient(self)
-        dialog.grab_set()
-
-        # Center on parent
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 400) // 2
-        y = self.winfo_y() + (self.winfo_height() - 180) // 2
-        dialog.geometry(f"+{x}+{y}")
-
-        # Container
-        container = ctk.CTkFrame(dialog)
-        container.pack(fill="both", expand=True, padx=PADDING["medium"], pady=PADDING["medium"])
-
-        # Info icon and title row
-        title_frame = ctk.CTkFrame(container, fg_color="transparent")
-        title_frame.pack(fill="x", pady=(0, PADDING["small"]))
-
-        title_label = ctk.CTkLabel(
-            title_frame,
-            text="Already Installed",
-            font=FONTS["heading"],
-            text_color=COLORS["warning"]
-        )
-        title_label.pack(anchor="w")
-
-        # Message
-        message_label = ctk.CTkLabel(
-            container,
-            text=message,
-            font=FONTS["body"],
-            wraplength=350,
-            justify="left"
-        )
-        message_label.pack(fill="x", expand=True, pady=PADDING["small"])
-
-        # Button frame
-        button_frame = ctk.CTkFrame(container, fg_color="transparent")
-        button_frame.pack(fill="x", pady=(PADDING["small"], 0))
-
-        def on_overwrite():
-            result["choice"] = "overwrite"
-            dialog.destroy()
-
-        def on_skip():
-            result["choice"] = "skip"
-            dialog.destroy()
+        def build(dialog, close):
+            # Container
+            container = ctk.CTkFrame(dialog)
+            container.pack(fill="both", expand=True, padx=PADDING["medium"], pady=PADDING["medium"])
+
+            # Info icon and title row
+            title_frame = ctk.CTkFrame(container, fg_color="transparent")
+            title_frame.pack(fill="x", pady=(0, PADDING["small"]))
+
+            title_label = ctk.CTkLabel(
+                title_frame,
+                text="Already Installed",
+                font=FONTS["heading"],
+                text_color=COLORS["warning"]
+            )
+            title_label.pack(anchor="w")
 
-        # Overwrite button (left side)
-        overwrite_btn = ctk.CTkButton(
-            button_frame,
-            text="Overwrite",
-            width=100,
-            fg_color=COLORS["warning"],
-            hover_color="#cc9900",
-            command=on_overwrite
-        )
-        overwrite_btn.pack(side="left")
+            # Message
+            message_label = ctk.CTkLabel(
+                container,
+                text="",
+                font=FONTS["body"],
+                wraplength=350,
+                justify="left"
+            )
+            message_label.pack(fill="x", expand=True, pady=PADDING["small"])
 
-        # Skip button (right side, default focus)
-        skip_btn = ctk.CTkButton(
-            button_frame,
-            text="Skip",
-            width=100,
-            command=on_skip
-        )
-        skip_btn.pack(side="right")
-        skip_btn.focus_set()  # Set as default selection
+            # Button frame
+            button_frame = ctk.CTkFrame(container, fg_color="transparent")
+            button_frame.pack(fill="x", pady=(PADDING["small"], 0))
 
-        # Handle window close as Skip
-        dialog.protocol("WM_DELETE_WINDOW", on_skip)
+            # Overwrite button (left side)
+            overwrite_btn = ctk.CTkButton(
+                button_frame,
+                text="Overwrite",
+                width=100,
+                fg_color=COLORS["warning"],
+                hover_color="#cc9900",
+                command=lambda: close("overwrite")
+            )
+            overwrite_btn.pack(side="left")
 
-        # Bind Enter key to Skip (default action)
-        dialog.bind("<Return>", lambda e: on_skip())
+            # Skip button (right side, default focus)
+            skip_btn = ctk.CTkButton(
+                button_frame,
+                text="Skip",
+                width=100,
+                command=lambda: close("skip")
+            )
+            skip_btn.pack(side="right")
 
-        # Wait for dialog to close
-        dialog.wait_window()
+            # Bind Enter key to Skip (default action)
+            dialog.bind("<Return>", lambda e: close("skip"))
+            return {"message": message_label, "focus": skip_btn}
 
-        return result["choice"]
+        return self._show_pooled_dialog("overwrite", title, (400, 180), build, "skip", message=message)
 
     def _on_toolbar_mods(self):
         """Handle toolbar Mods button click.
 
         Opens a mod management interface showing Paks folder contents.
         """
+        # An explicit click always rescans Paks, even if its mtime is unchanged
+        self._paks_mtime_ns = None
         if self.current_mode == "mods":
             # Already in mods mode, just refresh
             self._refresh_mods_list()
@@ -4101,9 +5438,7 @@ class MainWindow(ctk.CTk):
 
         # Load server list for current installation
         if self.current_installation:
-            install_id = self.current_installation.id.value
-            if install_id not in self.server_entries_by_install:
-                self._load_server_list(install_id)
+            self._load_server_list(self.current_installation.id.value)
             self._rebuild_server_list_current()
 
         self._set_status("Switched to Server List mode")
@@ -4173,88 +5508,61 @@ class MainWindow(ctk.CTk):
         Returns:
             True if user clicked Yes, False otherwise
         """
-        result = [False]  # Use list to allow modification in nested function
-
-        dialog = ctk.CTkToplevel(self)
-        dialog.title(title)
-        dialog.geometry("400x200")
-        dialog.resizable(False, False)
-        dialog.transient(self)
-        dialog.grab_set()
-
-        # Center on parent
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 400) // 2
-        y = self.winfo_y() + (self.winfo_height() - 200) // 2
-        dialog.geometry(f"+{x}+{y}")
-
-        # Container
-        container = ctk.CTkFrame(dialog)
-        container.pack(fill="both", expand=True, padx=PADDING["medium"], pady=PADDING["medium"])
-
-        # Warning icon and title row
-        title_frame = ctk.CTkFrame(container, fg_color="transparent")
-        title_frame.pack(fill="x", pady=(0, PADDING["small"]))
-
-        title_label = ctk.CTkLabel(
-            title_frame,
-            text="Warning",
-            font=FONTS["heading"],
-            text_color=COLORS["warning"]
-        )
-        title_label.pack(anchor="w")
-
-        # Message
-        message_label = ctk.CTkLabel(
-            container,
-            text=message,
-            font=FONTS["body"],
-            wraplength=350,
-            justify="left"
-        )
-        message_label.pack(fill="x", expand=True, pady=PADDING["small"])
-
-        # Buttons
-        button_frame = ctk.CTkFrame(container, fg_color="transparent")
-        button_frame.pack(fill="x", pady=(PADDING["small"], 0))
-
-        def on_yes():
-            result[0] = True
-            dialog.destroy()
-
-        def on_no():
-            result[0] = False
-            dialog.destroy()
+        def build(dialog, close):
+            # Container
+            container = ctk.CTkFrame(dialog)
+            container.pack(fill="both", expand=True, padx=PADDING["medium"], pady=PADDING["medium"])
+
+            # Warning icon and title row
+            title_frame = ctk.CTkFrame(container, fg_color="transparent")
+            title_frame.pack(fill="x", pady=(0, PADDING["small"]))
+
+            title_label = ctk.CTkLabel(
+                title_frame,
+                text="Warning",
+                font=FONTS["heading"],
+                text_color=COLORS["warning"]
+            )
+            title_label.pack(anchor="w")
 
-        no_btn = ctk.CTkButton(
-            button_frame,
-            text="No",
-            width=100,
-            fg_color="transparent",
-            border_width=1,
-            text_color=("gray10", "gray90"),
-            command=on_no
-        )
-        no_btn.pack(side="left", padx=(0, PADDING["small"]))
+            # Message
+            message_label = ctk.CTkLabel(
+                container,
+                text="",
+                font=FONTS["body"],
+                wraplength=350,
+                justify="left"
+            )
+            message_label.pack(fill="x", expand=True, pady=PADDING["small"])
 
-        yes_btn = ctk.CTkButton(
-            button_frame,
-            text="Yes",
-            width=100,
-            fg_color=COLORS["warning"],
-            hover_color="#d4a106",
-            text_color="black",
-            command=on_yes
-        )
-        yes_btn.pack(side="right")
+            # Buttons
+            button_frame = ctk.CTkFrame(container, fg_color="transparent")
+            button_frame.pack(fill="x", pady=(PADDING["small"], 0))
 
-        # Handle window close
-        dialog.protocol("WM_DELETE_WINDOW", on_no)
+            no_btn = ctk.CTkButton(
+                button_frame,
+                text="No",
+                width=100,
+                fg_color="transparent",
+                border_width=1,
+                text_color=("gray10", "gray90"),
+                command=lambda: close("no")
+            )
+            no_btn.pack(side="left", padx=(0, PADDING["small"]))
 
-        # Wait for dialog to close
-        dialog.wait_window()
+            yes_btn = ctk.CTkButton(
+                button_frame,
+                text="Yes",
+                width=100,
+                fg_color=COLORS["warning"],
+                hover_color="#d4a106",
+                text_color="black",
+                command=lambda: close("yes")
+            )
+            yes_btn.pack(side="right")
+            return {"message": message_label}
 
-        return result[0]
+        return self._show_pooled_dialog("confirm", title, (400, 200), build, "no", message=message) == "yes"
 
     def _show_delete_confirm_dialog(self, item_name: str, item_type: str = "world") -> bool:
         """Show a delete confirmation dialog with red Cancel and green Yes buttons.
@@ -4266,88 +5574,65 @@ class MainWindow(ctk.CTk):
         Returns:
             True if user clicked Yes, False otherwise
         """
-        result = [False]
-
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("Confirm Delete")
-        dialog.geometry("450x230")
-        dialog.resizable(False, False)
-        dialog.transient(self)
-        dialog.grab_set()
-
-        # Center on parent
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 450) // 2
-        y = self.winfo_y() + (self.winfo_height() - 230) // 2
-        dialog.geometry(f"+{x}+{y}")
-
-        # Container
-        container = ctk.CTkFrame(dialog)
-        container.pack(fill="both", expand=True, padx=PADDING["medium"], pady=PADDING["medium"])
-
-        # Warning title - capitalize item type for display
-        title_text = f"Delete {item_type.title()}"
-        title_label = ctk.CTkLabel(
-            container,
-            text=title_text,
-            font=FONTS["heading"],
-            text_color=COLORS["danger"]
-        )
-        title_label.pack(anchor="w", pady=(0, PADDING["small"]))
-
-        # Message
-        message_label = ctk.CTkLabel(
-            container,
-            text=f"Are you sure you want to delete '{item_name}'?\n\nThis will delete ALL files for this {item_type} and cannot be undone.",
-            font=FONTS["body"],
-            wraplength=400,
-            justify="left"
-        )
-        message_label.pack(fill="x", expand=True, pady=PADDING["small"])
-
-        # Buttons
-        button_frame = ctk.CTkFrame(container, fg_color="transparent")
-        button_frame.pack(fill="x", pady=(PADDING["small"], 0))
-
-        def on_yes():
-            result[0] = True
-            dialog.destroy()
-
-        def on_cancel():
-            result[0] = False
-            dialog.destroy()
-
-        # Red Cancel button on the left
-        cancel_btn = ctk.CTkButton(
-            button_frame,
-            text="Cancel",
-            width=120,
-            fg_color=COLORS["danger"],
-            hover_color=COLORS["danger_hover"],
-            text_color="white",
-            command=on_cancel
-        )
-        cancel_btn.pack(side="left")
+        def build(dialog, close):
+            # Container
+            container = ctk.CTkFrame(dialog)
+            container.pack(fill="both", expand=True, padx=PADDING["medium"], pady=PADDING["medium"])
 
-        # Green Yes button on the right
-        yes_btn = ctk.CTkButton(
-            button_frame,
-            text="Yes",
-            width=120,
-            fg_color=COLORS["success"],
-            hover_color=COLORS["success_hover"],
-            text_color="white",
-            command=on_yes
-        )
-        yes_btn.pack(side="right")
+            # Warning title
+            title_label = ctk.CTkLabel(
+                container,
+                text="",
+                font=FONTS["heading"],
+                text_color=COLORS["danger"]
+            )
+            title_label.pack(anchor="w", pady=(0, PADDING["small"]))
 
-        # Handle window close
-        dialog.protocol("WM_DELETE_WINDOW", on_cancel)
+            # Message
+            message_label = ctk.CTkLabel(
+                container,
+                text="",
+                font=FONTS["body"],
+                wraplength=400,
+                justify="left"
+            )
+            message_label.pack(fill="x", expand=True, pady=PADDING["small"])
+
+            # Buttons
+            button_frame = ctk.CTkFrame(container, fg_color="transparent")
+            button_frame.pack(fill="x", pady=(PADDING["small"], 0))
+
+            # Red Cancel button on the left
+            cancel_btn = ctk.CTkButton(
+                button_frame,
+                text="Cancel",
+                width=120,
+                fg_color=COLORS["danger"],
+                hover_color=COLORS["danger_hover"],
+                text_color="white",
+                command=lambda: close("cancel")
+            )
+            cancel_btn.pack(side="left")
 
-        # Wait for dialog to close
-        dialog.wait_window()
+            # Green Yes button on the right
+            yes_btn = ctk.CTkButton(
+                button_frame,
+                text="Yes",
+                width=120,
+                fg_color=COLORS["success"],
+                hover_color=COLORS["success_hover"],
+                text_color="white",
+                command=lambda: close("yes")
+            )
+            yes_btn.pack(side="right")
+            return {"title": title_label, "message": message_label}
 
-        return result[0]
+        # Capitalize item type for the title
+        return self._show_pooled_dialog(
+            "delete_confirm", "Confirm Delete", (450, 230), build, "cancel",
+            title=f"Delete {item_type.title()}",
+            message=f"Are you sure you want to delete '{item_name}'?\n\nThis will delete ALL files for this {item_type} and cannot be undone.",
+        ) == "yes"
 
     def _prompt_delete_world(self, item: 'WorldWithVersions | CharacterWithVersions'):
         """Prompt to delete a world/character and all its files."""
@@ -4374,11 +5659,18 @@ class MainWindow(ctk.CTk):
         # Find and delete all files matching the base name with any extension
         deleted_count = 0
         try:
-            for file_path in save_dir.iterdir():
-                if file_path.is_file() and file_path.name.startswith(base_name):
-                    file_path.unlink()
-                    deleted_count += 1
-                    logger.info("Deleted: %s", file_path)
+            # One scandir pass; entries carry their file type, so no stat per file.
+            # Files are grouped by the name before the first '.', as base_name is
+            # derived, so another save whose name merely starts with it is kept.
+            with os.scandir(save_dir) as it:
+                matches = [
+                    entry.path for entry in it
+                    if entry.name.partition('.')[0] == base_name and entry.is_file(follow_symlinks=False)
+                ]
+            for file_path in matches:
+                os.unlink(file_path)
+                deleted_count += 1
+                logger.info("Deleted: %s", file_path)
 
             if deleted_count > 0:
                 self._set_status(f"Deleted {deleted_count} files for '{display_name}'")
@@ -4428,7 +5720,7 @@ class MainWindow(ctk.CTk):
     def _prompt_delete_restore_entry(self, entry: BackupIndexEntry):
         """Prompt to delete all backups for a world/character in restore mode."""
         display_name = entry.display_name
-        item_type = "world" if self.current_view_type == "Worlds" else "character"
+        item_type = self._item_type_cache
 
         # Show confirmation dialog
         if not self._show_delete_confirm_dialog(f"all backups for '{display_name}'", f"{item_type} backups"):
@@ -4440,57 +5732,67 @@ class MainWindow(ctk.CTk):
             or GamePaths.BACKUP_DEFAULT
         )
 
-        category = "worlds" if self.current_view_type == "Worlds" else "characters"
+        category = self._category_cache
 
         try:
             index_manager = BackupIndexManager(backup_root, category)
             safe_name = index_manager._sanitize_dirname(entry.display_name)
             item_dir = index_manager.category_dir / safe_name
+            if self._backup_delete_pending(item_dir):
+                return
+            item_dir_exists = item_dir.exists()
+        except (OSError, IOError) as e:
+            logger.error("Error deleting backups for %s: %s", display_name, e)
+            self._set_status(f"Error deleting backups: {e}")
+            return
+
+        def refresh():
+            # Refresh both panes - left (entries) and right (timestamps)
+            self.selected_restore_entry = None
+            if self.current_mode == "restore":
+                self._refresh_restore_list()
+                self._refresh_restore_timestamps()
 
-            if item_dir.exists():
-                import shutil
-                shutil.rmtree(item_dir)
+        if not item_dir_exists:
+            self._set_status(f"Backup directory not found for '{display_name}'")
+            refresh()
+            return
+
+        def on_deleted(future):
+            try:
+                future.result()
                 logger.info("Deleted backup directory: %s", item_dir)
 
                 # Remove from index
                 if entry.filename in index_manager._entries:
                     del index_manager._entries[entry.filename]
                     index_manager._save_index()
+            except (OSError, IOError) as e:
+                logger.error("Error deleting backups for %s: %s", display_name, e)
+                self._set_status(f"Error deleting backups: {e}")
+                return
 
-                self._set_status(f"Deleted all backups for '{display_name}'")
-            else:
-                self._set_status(f"Backup directory not found for '{display_name}'")
-
-            # Refresh both panes - left (entries) and right (timestamps)
-            self.selected_restore_entry = None
-            self._refresh_restore_list()
-            self._refresh_restore_timestamps()
+            self._set_status(f"Deleted all backups for '{display_name}'")
+            refresh()
 
-        except (OSError, IOError) as e:
-            logger.error("Error deleting backups for %s: %s", display_name, e)
-            self._set_status(f"Error deleting backups: {e}")
+        self._set_status(f"Deleting all backups for '{display_name}'...")
+        self._rmtree_in_background(item_dir, on_deleted)
 
     def _prompt_delete_backup_timestamp(self, timestamp_dir: Path):
         """Prompt to delete a single backup timestamp directory in restore mode."""
+        if self._backup_delete_pending(timestamp_dir):
+            return
+
         # Parse timestamp for display
-        try:
-            dt = datetime.strptime(timestamp_dir.name, "%Y-%m-%d_%H%M%S")
-            display_text = dt.strftime("%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            display_text = timestamp_dir.name
+        display_text = _format_backup_ts(timestamp_dir.name)
 
         # Show confirmation dialog
         if not self._show_delete_confirm_dialog(f"backup from {display_text}", "backup"):
             return
 
-        try:
-            if timestamp_dir.exists():
-                import shutil
-                shutil.rmtree(timestamp_dir)
-                logger.info("Deleted backup timestamp: %s", timestamp_dir)
-                self._set_status(f"Deleted backup from {display_text}")
-            else:
-                self._set_status(f"Backup not found: {display_text}")
+        def refresh():
+            if self.current_mode != "restore":
+                return
 
             # Refresh the timestamps list, keeping the current entry selected
             self._refresh_restore_timestamps()
@@ -4502,9 +5804,54 @@ class MainWindow(ctk.CTk):
             if current_entry:
                 self._on_restore_entry_selected(current_entry)
 
-        except (OSError, IOError) as e:
-            logger.error("Error deleting backup %s: %s", timestamp_dir, e)
-            self._set_status(f"Error deleting backup: {e}")
+        def on_deleted(future):
+            try:
+                future.result()
+            except (OSError, IOError) as e:
+                logger.error("Error deleting backup %s: %s", timestamp_dir, e)
+                self._set_status(f"Error deleting backup: {e}")
+                return
+
+            logger.info("Deleted backup timestamp: %s", timestamp_dir)
+            self._set_status(f"Deleted backup from {display_text}")
+            refresh()
+
+        if timestamp_dir.exists():
+            self._set_status(f"Deleting backup from {display_text}...")
+            self._rmtree_in_background(timestamp_dir, on_deleted)
+        else:
+            self._set_status(f"Backup not found: {display_text}")
+            refresh()
+
+    def _rmtree_in_background(self, path: Path, on_done):
+        """Remove a backup directory tree on the I/O workers.
+
+        Until on_done runs the directory counts as being deleted (see
+        _backup_delete_pending), so it can't be restored from or deleted again.
+
+        Args:
+            path: Directory to delete
+            on_done: Called on the Tk thread with the finished future
+        """
+        key = os.path.normcase(os.fspath(path))
+        self._deleting_backup_dirs.add(key)
+
+        def finish(future):
+            self._deleting_backup_dirs.discard(key)
+            on_done(future)
+
+        future = self._parallel_io.submit(shutil.rmtree, path)
+        future.add_done_callback(lambda f: self._post_to_main(finish, f))
+
+    def _backup_delete_pending(self, path: Path) -> bool:
+        """Return True (and say so in the status bar) if path or a parent is being deleted."""
+        if self._deleting_backup_dirs:
+            key = os.path.normcase(os.fspath(path))
+            for deleting in self._deleting_backup_dirs:
+                if key == deleting or key.startswith(deleting + os.sep):
+                    self._set_status("That backup is still being deleted")
+                    return True
+        return False
 
     def _show_import_dialog(self):
         """Show the import dialog for archived save files.
@@ -4513,10 +5860,6 @@ class MainWindow(ctk.CTk):
         world (MW_*.sav) and character (MC_*.sav) files, displaying
         results in a preview dialog. Detects and logs duplicates.
         """
-        from tkinter import filedialog
-        import os
-        from datetime import datetime
-
         # Show directory selector
         selected_dir = filedialog.askdirectory(
             parent=self,
@@ -4532,16 +5875,15 @@ class MainWindow(ctk.CTk):
         # Create progress dialog
         progress_dialog = ctk.CTkToplevel(self)
         progress_dialog.title("Scanning Files")
-        progress_dialog.geometry("400x150")
         progress_dialog.resizable(False, False)
         progress_dialog.transient(self)
         progress_dialog.grab_set()
 
-        # Center on parent
-        progress_dialog.update_idletasks()
+        # Center on parent; size and position are set together, so no
+        # update_idletasks() is needed to lay the new window out first
         x = self.winfo_x() + (self.winfo_width() - 400) // 2
         y = self.winfo_y() + (self.winfo_height() - 150) // 2
-        progress_dialog.geometry(f"+{x}+{y}")
+        progress_dialog.geometry(f"400x150+{x}+{y}")
 
         # Progress UI
         progress_frame = ctk.CTkFrame(progress_dialog)
@@ -4554,26 +5896,29 @@ class MainWindow(ctk.CTk):
         )
         status_label.pack(pady=(PADDING["small"], PADDING["medium"]))
 
+        # Progress labels are driven by StringVars, so updates skip CTk's configure()
+        progress_var = ctk.StringVar(progress_dialog, value="Counting files...")
         progress_label = ctk.CTkLabel(
             progress_frame,
-            text="Counting files...",
+            textvariable=progress_var,
             font=FONTS["body"]
         )
         progress_label.pack(pady=PADDING["small"])
 
+        files_found_var = ctk.StringVar(progress_dialog, value="Save files found: 0")
         files_found_label = ctk.CTkLabel(
             progress_frame,
-            text="Save files found: 0",
+            textvariable=files_found_var,
             font=FONTS["small"],
             text_color="gray"
         )
         files_found_label.pack(pady=PADDING["small"])
 
-        # Cancel flag
-        scan_cancelled = {"value": False}
+        # Cancel flag (also read by the scan worker)
+        scan_cancelled = threading.Event()
 
         def cancel_scan():
-            scan_cancelled["value"] = True
+            scan_cancelled.set()
             progress_dialog.destroy()
 
         cancel_btn = ctk.CTkButton(
@@ -4587,166 +5932,242 @@ class MainWindow(ctk.CTk):
         cancel_btn.pack(pady=PADDING["small"])
 
         progress_dialog.protocol("WM_DELETE_WINDOW", cancel_scan)
-        progress_dialog.update()
 
-        # Scan recursively for save files
-        all_files = []
-        seen_keys = {}  # Track (filename, modified_timestamp) -> first file info
-        duplicates = []  # Track duplicate files for logging
+        # Scan on the I/O worker; results come back through a queue polled here,
+        # so the dialog keeps repainting without forced update() calls
+        scan = {
+            "path": selected_path,
+            "cancelled": scan_cancelled,
+            "queue": queue.Queue(),
+            "files": [],
+            "type_counts": {"World": 0, "Character": 0},  # Unique saves by type
+            "duplicates": [],
+            "dialog": progress_dialog,
+            "progress_var": progress_var,
+            "files_found_var": files_found_var,
+        }
+        self._serial_io.submit(self._scan_import_files, selected_path, scan_cancelled, scan["queue"])
+        self.after(_IMPORT_SCAN_POLL_MS, self._drain_import_scan, scan)
+
+    def _scan_import_files(self, selected_path: Path, cancelled: threading.Event, results: queue.Queue):
+        """Recursively find and parse world/character saves (runs on the I/O worker).
+
+        Candidate saves are parsed on a pool of threads while the walk goes
+        on, so slow reads (network shares) overlap; results are still posted
+        in scan order. Duplicates (same filename and modified minute as an
+        earlier save) are detected as saves are posted. Posts ("progress",
+        files_processed, found_count) every few files, ("file", file_info)
+        per unique save, ("duplicate", {"duplicate", "original"}) per
+        duplicate, and ("done",) when finished or cancelled.
+        """
         files_processed = 0
-        update_interval = 50  # Update UI every N files
+        found_count = 0
+        seen_keys = {}  # (filename, modified minute) -> first file info
+        parsing = deque()  # (future, entry, is_world) in scan order
+
+        # Bound once, as locals, for the per-file loops below
+        parse_world = self.parser.parse_world_save
+        parse_character = self.parser.parse_character_save
+        is_cancelled = cancelled.is_set
+        is_closing = self._closing.is_set
+        post = results.put
+        queue_parse = parsing.append
+        fromtimestamp = datetime.fromtimestamp
+
+        def post_parsed(wait: bool):
+            """Post the parsed saves at the head of the queue (all of them if wait)."""
+            nonlocal found_count
+            while parsing and (wait or parsing[0][0].done()):
+                if is_cancelled():
+                    return
+                future, entry, is_world = parsing.popleft()
+                info = future.result()
+                if not info:
+                    continue
 
-        for root, dirs, files in os.walk(selected_path):
-            if scan_cancelled["value"]:
-                break
+                try:
+                    modified = fromtimestamp(entry.stat().st_mtime)
+                except OSError:
+                    modified = None
+                file_info = {
+                    "path": Path(entry.path),
+                    "filename": entry.name,
+                    "type": "World" if is_world else "Character",
+                    "name": info.world_name if is_world else info.display_name,
+                    "modified": modified,
+                }
+                found_count += 1
+
+                # Duplicate = same filename AND same modified time (to the minute)
+                time_key = modified.strftime("%Y-%m-%d %H:%M") if modified else "Unknown"
+                dup_key = (entry.name, time_key)
+                original = seen_keys.get(dup_key)
+                if original is not None:
+                    post(("duplicate", {"duplicate": file_info, "original": original}))
+                else:
+                    seen_keys[dup_key] = file_info
+                    post(("file", file_info))
 
-            root_path = Path(root)
-            for filename in files:
-                if scan_cancelled["value"]:
+        parse_pool = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 4), thread_name_prefix="moria-scan"
+        )
+        submit = parse_pool.submit
+        progress_countdown = _IMPORT_SCAN_PROGRESS_EVERY
+        try:
+            for entry in _iter_files(selected_path):
+                if is_cancelled() or is_closing():
                     break
 
                 files_processed += 1
 
-                # Update progress periodically
-                if files_processed % update_interval == 0:
-                    progress_label.configure(text=f"Processed {files_processed:,} files...")
-                    files_found_label.configure(text=f"Save files found: {len(all_files):,}")
-                    progress_dialog.update()
+                # Report progress periodically
+                progress_countdown -= 1
+                if not progress_countdown:
+                    progress_countdown = _IMPORT_SCAN_PROGRESS_EVERY
+                    post_parsed(wait=False)
+                    post(("progress", files_processed, found_count))
+
+                # World (MW_*.sav) and character (MC_*.sav) saves; the cheap
+                # name checks run first so only candidates are opened
+                filename = entry.name
+                prefix = filename[:3]
+                if prefix != "MW_" and prefix != "MC_":
+                    continue
+                if not filename.endswith(".sav") or ".sav." in filename:
+                    continue
+
+                is_world = prefix == "MW_"
+                parse = parse_world if is_world else parse_character
+                queue_parse((submit(parse, Path(entry.path)), entry, is_world))
 
-                file_path = root_path / filename
+            post_parsed(wait=True)
+        finally:
+            parse_pool.shutdown(wait=False, cancel_futures=True)
+            results.put(("done",))
 
-                # Check for world files (MW_*.sav)
-                if filename.startswith("MW_") and filename.endswith(".sav") and ".sav." not in filename:
-                    info = self.parser.parse_world_save(file_path)
-                    if info:
-                        try:
-                            stat = file_path.stat()
-                            modified = datetime.fromtimestamp(stat.st_mtime)
-                        except OSError:
-                            modified = None
-                        file_info = {
-                            "path": file_path,
-                            "filename": filename,
-                            "type": "World",
-                            "name": info.world_name,
-                            "modified": modified,
-                        }
-                        all_files.append(file_info)
-
-                # Check for character files (MC_*.sav)
-                elif filename.startswith("MC_") and filename.endswith(".sav") and ".sav." not in filename:
-                    info = self.parser.parse_character_save(file_path)
-                    if info:
-                        try:
-                            stat = file_path.stat()
-                            modified = datetime.fromtimestamp(stat.st_mtime)
-                        except OSError:
-                            modified = None
-                        file_info = {
-                            "path": file_path,
-                            "filename": filename,
-                            "type": "Character",
-                            "name": info.display_name,
-                            "modified": modified,
-                        }
-                        all_files.append(file_info)
-
-        # Close progress dialog if not cancelled
-        if not scan_cancelled["value"]:
-            progress_dialog.destroy()
-        else:
+    def _drain_import_scan(self, scan: dict):
+        """Apply queued import scan results on the Tk thread, then poll again."""
+        if scan["cancelled"].is_set():
             self._set_status("Import cancelled")
             return
 
-        # Detect duplicates (same filename AND same timestamp)
-        found_files = []
-        for file_info in all_files:
-            # Create key from filename and modified time (rounded to minute)
-            if file_info["modified"]:
-                time_key = file_info["modified"].strftime("%Y-%m-%d %H:%M")
-            else:
-                time_key = "Unknown"
-            dup_key = (file_info["filename"], time_key)
-
-            if dup_key in seen_keys:
-                # This is a duplicate
-                duplicates.append({
-                    "duplicate": file_info,
-                    "original": seen_keys[dup_key]
-                })
-            else:
-                seen_keys[dup_key] = file_info
-                found_files.append(file_info)
+        # Only the newest progress message per poll is shown, so the labels
+        # are redrawn at most once per _IMPORT_SCAN_POLL_MS
+        progress = None
+        for _ in range(_IMPORT_SCAN_POLL_MAX):
+            try:
+                message = scan["queue"].get_nowait()
+            except queue.Empty:
+                break
+
+            if message[0] == "file":
+                scan["files"].append(message[1])
+                scan["type_counts"][message[1]["type"]] += 1
+            elif message[0] == "duplicate":
+                scan["duplicates"].append(message[1])
+            elif message[0] == "progress":
+                progress = message
+            else:  # "done"
+                scan["dialog"].destroy()
+                self._finish_import_scan(scan["files"], scan["type_counts"], scan["duplicates"], scan["path"])
+                return
 
-        # Log duplicates if any were found
+        if progress is not None:
+            _, files_processed, found_count = progress
+            scan["progress_var"].set(f"Processed {files_processed:,} files...")
+            scan["files_found_var"].set(f"Save files found: {found_count:,}")
+
+        self.after(_IMPORT_SCAN_POLL_MS, self._drain_import_scan, scan)
+
+    def _finish_import_scan(self, found_files: list, type_counts: dict, duplicates: list, selected_path: Path):
+        """Log the duplicates skipped by a finished import scan and show the preview.
+
+        Args:
+            found_files: Unique file info dicts from _scan_import_files, in scan order
+            type_counts: Number of found_files per type ("World", "Character")
+            duplicates: List of dicts with 'duplicate' and 'original' file info
+            selected_path: The directory that was scanned
+        """
+        # Log duplicates if any were found; the ordered I/O worker appends the
+        # log so the preview opens without waiting on the disk
         duplicate_count = len(duplicates)
         if duplicates:
-            self._write_duplicate_import_log(duplicates, selected_path)
+            self._serial_io.submit(self._write_duplicate_import_log, duplicates, selected_path)
 
         self._set_status("Ready")
 
         # Show results dialog
-        self._show_import_preview_dialog(found_files, source_dir=selected_path, duplicate_count=duplicate_count)
+        self._show_import_preview_dialog(
+            found_files, source_dir=selected_path, type_counts=type_counts, duplicate_count=duplicate_count
+        )
 
     def _write_duplicate_import_log(self, duplicates: list, source_dir: Path):
-        """Write duplicate import information to a log file.
+        """Write duplicate import information to a log file (runs on the I/O worker).
 
         Args:
             duplicates: List of dicts with 'duplicate' and 'original' file info
             source_dir: The directory that was scanned
         """
-        from datetime import datetime
-
         log_path = GamePaths.CONFIG_DIR / "Duplicate imports.log"
 
         try:
             GamePaths.ensure_config_dir()
 
+            # Build the whole entry first and append it with a single write
+            lines = [
+                f"\n{'='*60}\n",
+                f"Import Scan: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+                f"Source Directory: {source_dir}\n",
+                f"Duplicates Found: {len(duplicates)}\n",
+                f"{'='*60}\n\n",
+            ]
+            for i, dup_info in enumerate(duplicates, 1):
+                dup = dup_info["duplicate"]
+                orig = dup_info["original"]
+
+                lines.append(
+                    f"Duplicate #{i}:\n"
+                    f"  Filename: {dup['filename']}\n"
+                    f"  Type: {dup['type']}\n"
+                    f"  Name: {dup['name']}\n"
+                )
+                if dup["modified"]:
+                    lines.append(f"  Modified: {dup['modified'].strftime('%Y-%m-%d %H:%M:%S')}\n")
+                lines.append(
+                    f"  Duplicate Path: {dup['path']}\n"
+                    f"  Original Path: {orig['path']}\n"
+                    "\n"
+                )
+
             with open(log_path, "a", encoding="utf-8") as f:
-                f.write(f"\n{'='*60}\n")
-                f.write(f"Import Scan: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Source Directory: {source_dir}\n")
-                f.write(f"Duplicates Found: {len(duplicates)}\n")
-                f.write(f"{'='*60}\n\n")
-
-                for i, dup_info in enumerate(duplicates, 1):
-                    dup = dup_info["duplicate"]
-                    orig = dup_info["original"]
-
-                    f.write(f"Duplicate #{i}:\n")
-                    f.write(f"  Filename: {dup['filename']}\n")
-                    f.write(f"  Type: {dup['type']}\n")
-                    f.write(f"  Name: {dup['name']}\n")
-                    if dup["modified"]:
-                        f.write(f"  Modified: {dup['modified'].strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"  Duplicate Path: {dup['path']}\n")
-                    f.write(f"  Original Path: {orig['path']}\n")
-                    f.write("\n")
+                f.write("".join(lines))
 
             logger.info("Wrote %d duplicate entries to %s", len(duplicates), log_path)
         except (OSError, IOError) as e:
             logger.error("Failed to write duplicate import log: %s", e)
 
-    def _show_import_preview_dialog(self, found_files: list, source_dir: Path, duplicate_count: int = 0):
+    def _show_import_preview_dialog(
+        self, found_files: list, source_dir: Path, type_counts: dict, duplicate_count: int = 0
+    ):
         """Show preview dialog with found save files and sorting capability.
 
         Args:
             found_files: List of dicts with file info (duplicates already removed)
             source_dir: The directory that was scanned
+            type_counts: Number of found_files per type, tallied during the scan
             duplicate_count: Number of duplicate files that were skipped
         """
         dialog = ctk.CTkToplevel(self)
         dialog.title("Import Preview")
-        dialog.geometry("750x550")
         dialog.resizable(True, True)
         dialog.transient(self)
         dialog.grab_set()
 
-        # Center on parent
-        dialog.update_idletasks()
+        # Center on parent; size and position are set together, so no
+        # update_idletasks() is needed to lay the new window out first
         x = self.winfo_x() + (self.winfo_width() - 750) // 2
         y = self.winfo_y() + (self.winfo_height() - 550) // 2
-        dialog.geometry(f"+{x}+{y}")
+        dialog.geometry(f"750x550+{x}+{y}")
 
         # Container
         container = ctk.CTkFrame(dialog)
@@ -4820,10 +6241,84 @@ class MainWindow(ctk.CTk):
             sort_state = {"column": "type", "reverse": False}
             files_list = list(found_files)  # Make a copy for sorting
 
-            # Scrollable list frame (will be rebuilt on sort)
+            # Native Treeview: rows are drawn by Tk itself instead of one
+            # canvas-backed CTk frame plus four labels per file
             list_container = ctk.CTkFrame(container, fg_color="transparent")
             list_container.pack(fill="both", expand=True, pady=PADDING["small"])
 
+            # ttk doesn't follow the CTk appearance mode, so take the theme's
+            # (light, dark) colour pairs for the current mode
+            theme = ctk.ThemeManager.theme
+            mode = 1 if ctk.get_appearance_mode() == "Dark" else 0
+            bg_color = theme["CTkFrame"]["fg_color"][mode]
+            heading_color = theme["CTkFrame"]["top_fg_color"][mode]
+            text_color = theme["CTkLabel"]["text_color"][mode]
+            style = ttk.Style(dialog)
+            style.configure(
+                "ImportPreview.Treeview", background=bg_color, fieldbackground=bg_color,
+                foreground=text_color, font=FONTS["small"], rowheight=22, borderwidth=0
+            )
+            style.configure(
+                "ImportPreview.Treeview.Heading", background=heading_color,
+                foreground=text_color, font=FONTS["small_bold"]
+            )
+
+            columns = {  # column -> (heading text, width)
+                "type": ("Type", 80),
+                "name": ("Name", 180),
+                "filename": ("Filename", 160),
+                "modified": ("Modified", 140),
+            }
+            tree = ttk.Treeview(
+                list_container, columns=tuple(columns), show="headings",
+                style="ImportPreview.Treeview", selectmode="none"
+            )
+            for column, (text, width) in columns.items():
+                tree.heading(column, text=text, anchor="w", command=lambda c=column: sort_files(c))
+                tree.column(column, width=width, anchor="w")
+
+            # Type (with color coding)
+            tree.tag_configure("World", foreground=COLORS["primary"])
+            tree.tag_configure("Character", foreground=COLORS["success"])
+
+            scrollbar = ctk.CTkScrollbar(list_container, command=tree.yview)
+            tree.configure(yscrollcommand=scrollbar.set)
+            scrollbar.pack(side="right", fill="y")
+            tree.pack(side="left", fill="both", expand=True)
+
+            row_ids = {}  # id(file_info) -> Treeview item id
+            load_state = {"done": False, "resorted": False}
+
+            def insert_chunk(load_order: list, start: int = 0):
+                """Insert the next chunk of rows, then yield to the event loop."""
+                end = min(start + _PREVIEW_INSERT_CHUNK, len(load_order))
+                insert = tree.insert
+                try:
+                    for file_info in load_order[start:end]:
+                        file_type = file_info["type"]
+                        modified = file_info["modified"]
+                        date_str = modified.strftime("%Y-%m-%d %H:%M") if modified else "Unknown"
+                        row_ids[id(file_info)] = insert(
+                            "", "end", tags=(file_type,),
+                            values=(file_type, file_info["name"] or "Unknown", file_info["filename"], date_str)
+                        )
+                except tk.TclError:
+                    # Dialog was closed while rows were streaming in
+                    return
+                if end < len(load_order):
+                    dialog.after(1, insert_chunk, load_order, end)
+                    return
+                load_state["done"] = True
+                if load_state["resorted"]:
+                    reorder_rows()
+
+            def reorder_rows():
+                """Move the inserted items to match files_list."""
+                for index, file_info in enumerate(files_list):
+                    row_id = row_ids.get(id(file_info))
+                    if row_id is not None:
+                        tree.move(row_id, "", index)
+
             def sort_files(column: str):
                 """Sort files by the specified column."""
                 # Toggle direction if same column clicked again
@@ -4846,101 +6341,26 @@ class MainWindow(ctk.CTk):
                         reverse=sort_state["reverse"]
                     )
 
-                rebuild_list()
-
-            def rebuild_list():
-                """Rebuild the file list display."""
-                # Clear existing list
-                for widget in list_container.winfo_children():
-                    widget.destroy()
-
-                list_frame = ctk.CTkScrollableFrame(list_container, fg_color=("#2b2b2b", "#1a1a1a"))
-                list_frame.pack(fill="both", expand=True)
-
-                # Column headers (clickable for sorting)
-                header_row = ctk.CTkFrame(list_frame, fg_color="transparent")
-                header_row.pack(fill="x", padx=PADDING["small"], pady=(0, PADDING["small"]))
-
-                def make_header(text: str, column: str, width: int):
-                    """Create a clickable column header."""
+                # Sort arrow on the active column only
+                for header_column, (text, _width) in columns.items():
                     arrow = ""
-                    if sort_state["column"] == column:
+                    if header_column == sort_state["column"]:
                         arrow = " \u25bc" if sort_state["reverse"] else " \u25b2"
-                    btn = ctk.CTkButton(
-                        header_row, text=text + arrow, font=FONTS["small_bold"],
-                        width=width, anchor="w", fg_color="transparent",
-                        hover_color=("gray70", "gray40"), text_color=COLORS["primary"],
-                        command=lambda c=column: sort_files(c)
-                    )
-                    btn.pack(side="left", padx=(0, PADDING["small"]))
+                    tree.heading(header_column, text=text + arrow)
 
-                make_header("Type", "type", 80)
-                make_header("Name", "name", 180)
-                make_header("Filename", "filename", 160)
-                make_header("Modified", "modified", 140)
+                # Reorder the existing items in place; rows still streaming
+                # in are reordered once the last chunk lands
+                reorder_rows()
+                if not load_state["done"]:
+                    load_state["resorted"] = True
 
-                # Separator
-                sep = ctk.CTkFrame(list_frame, height=1, fg_color="gray50")
-                sep.pack(fill="x", padx=PADDING["small"], pady=2)
-
-                # Update to show headers before building rows
-                dialog.update_idletasks()
-
-                # File rows - update UI periodically to prevent freezing
-                update_interval = 100
-                for i, file_info in enumerate(files_list):
-                    try:
-                        # Check if dialog still exists
-                        if not dialog.winfo_exists():
-                            return
-
-                        row = ctk.CTkFrame(list_frame, fg_color="transparent")
-                        row.pack(fill="x", padx=PADDING["small"], pady=1)
-
-                        # Type (with color coding)
-                        type_color = COLORS["primary"] if file_info["type"] == "World" else COLORS["success"]
-                        ctk.CTkLabel(
-                            row, text=file_info["type"], font=FONTS["small"],
-                            width=80, anchor="w", text_color=type_color
-                        ).pack(side="left")
-
-                        # Name
-                        ctk.CTkLabel(
-                            row, text=file_info["name"] or "Unknown", font=FONTS["small"],
-                            width=180, anchor="w"
-                        ).pack(side="left", padx=PADDING["small"])
-
-                        # Filename
-                        ctk.CTkLabel(
-                            row, text=file_info["filename"], font=FONTS["small"],
-                            width=160, anchor="w", text_color="gray"
-                        ).pack(side="left", padx=PADDING["small"])
-
-                        # Modified date
-                        if file_info["modified"]:
-                            date_str = file_info["modified"].strftime("%Y-%m-%d %H:%M")
-                        else:
-                            date_str = "Unknown"
-                        ctk.CTkLabel(
-                            row, text=date_str, font=FONTS["small"],
-                            width=140, anchor="w", text_color="gray"
-                        ).pack(side="left", padx=PADDING["small"])
-
-                        # Update UI periodically to keep it responsive
-                        if (i + 1) % update_interval == 0:
-                            dialog.update_idletasks()
-                    except tk.TclError:
-                        # Dialog was closed during list building
-                        return
-
-            # Initial sort by type
-            from datetime import datetime
+            # Initial sort by type, then stream the rows in sorted order
             sort_files("type")
+            load_state["resorted"] = False
+            insert_chunk(list(files_list))
 
             # Summary by type
-            worlds = sum(1 for f in found_files if f["type"] == "World")
-            chars = sum(1 for f in found_files if f["type"] == "Character")
-            summary_text = f"Worlds: {worlds}  |  Characters: {chars}"
+            summary_text = f"Worlds: {type_counts['World']}  |  Characters: {type_counts['Character']}"
             if duplicate_count > 0:
                 summary_text += f"  |  Duplicates skipped: {duplicate_count}"
             summary_label = ctk.CTkLabel(
@@ -4974,9 +6394,6 @@ class MainWindow(ctk.CTk):
         Args:
             files_to_import: List of dicts with file info from scan
         """
-        import shutil
-        from datetime import datetime
-
         if not files_to_import:
             self._set_status("No files to import")
             return
@@ -4988,10 +6405,12 @@ class MainWindow(ctk.CTk):
                 or GamePaths.BACKUP_DEFAULT
             )
 
-            imported_worlds = 0
-            imported_chars = 0
+            # Resolve every backup directory up front (index updates stay on this thread)
+            pending = []
+            planned = set()  # (category, base filename, timestamp) already claimed
             skipped = 0
-
+            index_managers = {}  # category -> index manager, loaded once per import
+            item_dirs = {}  # (category, base filename) -> item backup directory
             for file_info in files_to_import:
                 file_path = file_info["path"]
                 item_name = file_info["name"] or "Unknown"
@@ -5002,60 +6421,126 @@ class MainWindow(ctk.CTk):
                 category = "worlds" if file_type == "World" else "characters"
 
                 # Get or create the backup directory using the index manager
-                index_manager = BackupIndexManager(backup_root, category)
+                index_manager = index_managers.get(category)
+                if index_manager is None:
+                    index_manager = index_managers[category] = BackupIndexManager(backup_root, category)
                 # Strip Windows copy suffixes like " (2)" from filenames
                 base_filename = _strip_windows_copy_suffix(file_path.stem)  # e.g., "MW_12345678"
-                item_backup_dir = index_manager.get_backup_directory(base_filename, item_name)
+                # A later file with a new name renames the directory, so the
+                # last directory returned is where all of the item's backups live
+                item_dirs[(category, base_filename)] = index_manager.get_backup_directory(base_filename, item_name)
 
                 # Get the file's modification timestamp (not current time)
                 if modified:
-                    timestamp_dir_name = modified.strftime("%Y-%m-%d_%H%M%S")
+                    timestamp_dir_name = _backup_ts_name(modified)
                 else:
                     # Fallback to current time if no modification time
                     timestamp_dir_name = datetime.now().strftime("%Y-%m-%d_%H%M%S")
 
-                # Create timestamp subdirectory
-                timestamp_dir = item_backup_dir / timestamp_dir_name
-                timestamp_dir.mkdir(parents=True, exist_ok=True)
-
-                # Backup filename uses the clean base filename (without copy suffixes)
-                backup_path = timestamp_dir / f"{base_filename}.sav"
-
-                # Check if this exact backup already exists
-                if backup_path.exists():
+                # A copy-suffixed twin of an earlier file maps to the same backup
+                key = (category, base_filename, timestamp_dir_name)
+                if key in planned:
                     skipped += 1
                     continue
+                planned.add(key)
+                pending.append((file_path, category, base_filename, timestamp_dir_name, file_type))
 
-                # Copy the file
-                shutil.copy2(file_path, backup_path)
+            jobs = []
+            for file_path, category, base_filename, timestamp_dir_name, file_type in pending:
+                # Backup filename uses the clean base filename (without copy suffixes);
+                # plain string joins, as the workers only hand these to os calls
+                timestamp_dir = os.path.join(item_dirs[(category, base_filename)], timestamp_dir_name)
+                jobs.append((file_path, timestamp_dir, os.path.join(timestamp_dir, base_filename + ".sav"), file_type))
 
-                if file_type == "World":
-                    imported_worlds += 1
-                else:
-                    imported_chars += 1
-
-            # Build status message
-            parts = []
-            if imported_worlds > 0:
-                parts.append(f"{imported_worlds} world(s)")
-            if imported_chars > 0:
-                parts.append(f"{imported_chars} character(s)")
-            if skipped > 0:
-                parts.append(f"{skipped} skipped (already exist)")
-
-            if parts:
-                self._set_status(f"Imported: {', '.join(parts)}")
-            else:
-                self._set_status("No new files imported (all already exist)")
+        except (OSError, IOError, shutil.Error) as e:
+            logger.error("Import error: %s", e)
+            self._set_status(f"Import failed: {e}")
+            return
 
-            # Refresh the restore list if in restore mode
-            if self.current_mode == "restore":
-                self._refresh_restore_list()
+        # Copy on the I/O workers; results are tallied back on the Tk thread
+        progress = {"pending": len(jobs), "worlds": 0, "characters": 0, "skipped": skipped, "error": None}
+        if not jobs:
+            self._finish_import_all(progress)
+            return
+
+        self._set_status(f"Importing {len(jobs)} file(s)...")
+        for file_path, timestamp_dir, backup_path, file_type in jobs:
+            future = self._parallel_io.submit(self._import_save_file, file_path, timestamp_dir, backup_path)
+            future.add_done_callback(
+                lambda f, t=file_type, p=progress: self._post_to_main(self._on_import_file_done, f, t, p)
+            )
+
+    @staticmethod
+    def _import_save_file(file_path: Path, timestamp_dir: str, backup_path: str) -> bool:
+        """Copy one imported save into its backup directory (worker thread).
 
+        Returns:
+            True if copied, False if this exact backup already exists
+        """
+        # Create timestamp subdirectory; a directory made just now is empty,
+        # so only a pre-existing one needs checking for this exact backup
+        try:
+            os.mkdir(timestamp_dir)
+        except FileExistsError:
+            if os.path.exists(backup_path):
+                return False
+        except FileNotFoundError:
+            os.makedirs(timestamp_dir, exist_ok=True)
+
+        # Copy the file (native CopyFileExW on Windows)
+        _fastcopy_times(file_path, backup_path)
+        return True
+
+    def _on_import_file_done(self, future, file_type: str, progress: dict):
+        """Tally one finished import copy and report after the last one."""
+        try:
+            if not future.result():
+                progress["skipped"] += 1
+            elif file_type == "World":
+                progress["worlds"] += 1
+            else:
+                progress["characters"] += 1
         except (OSError, IOError, shutil.Error) as e:
             logger.error("Import error: %s", e)
-            self._set_status(f"Import failed: {e}")
+            progress["error"] = e
+        finally:
+            # Counted even if the copy raised something unexpected, so Import
+            # All is always reported
+            progress["pending"] -= 1
+            if not progress["pending"]:
+                self._finish_import_all(progress)
+
+    def _finish_import_all(self, progress: dict):
+        """Report a finished Import All and refresh the restore list."""
+        # Build status message
+        parts = []
+        if progress["worlds"] > 0:
+            parts.append(f"{progress['worlds']} world(s)")
+        if progress["characters"] > 0:
+            parts.append(f"{progress['characters']} character(s)")
+        if progress["skipped"] > 0:
+            parts.append(f"{progress['skipped']} skipped (already exist)")
+
+        if progress["error"] is not None:
+            self._set_status(f"Import failed: {progress['error']}")
+        elif parts:
+            self._set_status(f"Imported: {', '.join(parts)}")
+        else:
+            self._set_status("No new files imported (all already exist)")
+
+        # Refresh the restore list if in restore mode
+        if self.current_mode == "restore":
+            self._refresh_restore_list()
 
     def _on_close(self):
         """Handle window close event."""
+        # Write any debounced server list edits before exiting
+        for install_id in list(getattr(self, "_pending_server_saves", {})):
+            self._flush_server_save(install_id)
+        # Release a worker waiting on a prompt; queued imports are dropped
+        self._closing.set()
+        self._serial_io.shutdown(wait=False, cancel_futures=True)
+        # Backup/restore copies already queued still finish before the process exits;
+        # their done-callbacks see _closing and skip the UI (see _post_to_main)
+        self._parallel_io.shutdown(wait=False)
         self.destroy()
@@ -8,10 +8,15 @@ Constants:
     FONTS: Font family, size, and weight configurations
     PADDING: Spacing values for margins and padding
     WINDOW_SIZES: Default and minimum window dimensions
+
+Each table is a read-only mapping, so a widget can't change the shared
+style for everyone else by accident.
 """
 
+from types import MappingProxyType
+
 # Color palette - semantic color names for consistent theming
-COLORS = {
+COLORS = MappingProxyType({
     "primary": "#1f538d",        # Main action buttons (blue)
     "primary_hover": "#14375e",  # Primary button hover state
     "success": "#2d8a4e",        # Success/confirm actions (green)
@@ -20,27 +25,27 @@ COLORS = {
     "danger_hover": "#a71d2a",   # Danger button hover state
     "warning": "#ffc107",        # Warning indicators (yellow)
     "muted": "#6c757d",          # Disabled/secondary text (gray)
-}
+})
 
 # Font configurations - tuple format: (family, size, weight)
-FONTS = {
+FONTS = MappingProxyType({
     "title": ("Segoe UI", 18, "bold"),   # Window titles, major headings
     "heading": ("Segoe UI", 14, "bold"), # Section headers
     "body": ("Segoe UI", 12),            # Standard body text
     "small": ("Segoe UI", 10),           # Captions, status text
     "small_bold": ("Segoe UI", 10, "bold"),  # Bold captions, column headers
-}
+})
 
 # Padding and spacing values in pixels
-PADDING = {
+PADDING = MappingProxyType({
     "small": 10,   # Tight spacing (between related elements)
     "medium": 18,  # Standard spacing (between sections)
     "large": 30,   # Wide spacing (window margins)
-}
+})
 
 # Window sizes - tuple format: (width, height)
-WINDOW_SIZES = {
+WINDOW_SIZES = MappingProxyType({
     "main": (900, 600),          # Main window default size
     "config_dialog": (750, 650), # Configuration dialog size
     "min_main": (700, 500),      # Minimum main window size
-}
+})
@@ -1,11 +1,16 @@
 """Reusable path selection widget"""
 
+import os
+import stat
 from pathlib import Path
 from tkinter import filedialog
 from typing import Callable, Optional
 
 import customtkinter as ctk
 
+# Delay after the last keystroke before the path is checked (milliseconds)
+_ENTRY_DEBOUNCE_MS = 150
+
 
 class PathSelector(ctk.CTkFrame):
     """A widget for selecting file or directory paths.
@@ -37,6 +42,8 @@ class PathSelector(ctk.CTkFrame):
 
         self.directory = directory
         self.on_change = on_change
+        self._debounce_id = None
+        self._cached_path: tuple[str, Optional[Path]] = ("", None)  # (value, path)
 
         # Configure grid
         self.grid_columnconfigure(1, weight=1)
@@ -77,8 +84,14 @@ class PathSelector(ctk.CTkFrame):
         """Open file dialog to select path."""
         initial_dir = None
         current_path = self.get_path()
-        if current_path and current_path.exists():
-            initial_dir = str(current_path if current_path.is_dir() else current_path.parent)
+        if current_path:
+            # One stat answers both "exists" and "is a directory"
+            try:
+                mode = os.stat(current_path).st_mode
+            except (OSError, ValueError):
+                pass
+            else:
+                initial_dir = str(current_path if stat.S_ISDIR(mode) else current_path.parent)
 
         if self.directory:
             selected = filedialog.askdirectory(
@@ -95,7 +108,14 @@ class PathSelector(ctk.CTkFrame):
             self.set_path(Path(selected))
 
     def _on_entry_change(self, *args):
-        """Handle entry text changes."""
+        """Handle entry text changes (debounced, so a burst of typing is checked once)."""
+        if self._debounce_id is not None:
+            self.after_cancel(self._debounce_id)
+        self._debounce_id = self.after(_ENTRY_DEBOUNCE_MS, self._apply_change)
+
+    def _apply_change(self):
+        """Validate the entry and notify on_change once typing has paused."""
+        self._debounce_id = None
         self._update_status()
         if self.on_change:
             path = self.get_path()
@@ -119,7 +139,10 @@ class PathSelector(ctk.CTkFrame):
             Path object or None if empty
         """
         value = self.path_var.get().strip()
-        return Path(value) if value else None
+        # Reuse the Path built for the same text last time
+        if value != self._cached_path[0]:
+            self._cached_path = (value, Path(value) if value else None)
+        return self._cached_path[1]
 
     def set_path(self, path: Optional[Path]):
         """Set the path value.
@@ -130,6 +153,13 @@ class PathSelector(ctk.CTkFrame):
         self.path_var.set(str(path) if path else "")
         self._update_status()
 
+    def destroy(self):
+        """Cancel a pending entry check before destroying the widget."""
+        if self._debounce_id is not None:
+            self.after_cancel(self._debounce_id)
+            self._debounce_id = None
+        super().destroy()
+
     def set_enabled(self, enabled: bool):
         """Enable or disable the widget.
 
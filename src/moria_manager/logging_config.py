@@ -1,21 +1,32 @@
 """Logging configuration for Moria Manager.
 
 Provides centralized logging setup with file and console handlers.
-Log files are stored in the application's config directory.
+Log files are stored in the application's config directory. Records are
+handed to a background listener thread, so logging callers never block
+on the log file.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
+from typing import Optional
 
 from .config.paths import GamePaths
 
+# Background thread that writes queued records to the real handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(debug: bool = False) -> logging.Logger:
     """Configure application-wide logging.
 
     Sets up logging to both file and console (if debug mode).
-    Log file is stored in %APPDATA%/MoriaManager/moria_manager.log
+    Log file is stored in %APPDATA%/MoriaManager/moria_manager.log.
+    The logger itself only gets a QueueHandler; the file and console
+    handlers run on a QueueListener thread.
 
     Args:
         debug: If True, also log to console at DEBUG level
@@ -31,9 +42,14 @@ def setup_logging(debug: bool = False) -> logging.Logger:
     # Create logger
     logger = logging.getLogger("moria_manager")
     logger.setLevel(logging.DEBUG)
+    # Our handlers cover everything; don't also walk up to the root logger
+    logger.propagate = False
 
-    # Clear any existing handlers
+    # Clear any existing handlers (and stop a listener from an earlier setup)
+    global _queue_listener
+    _stop_queue_listener()
     logger.handlers.clear()
+    handlers = []
 
     # File handler - always logs DEBUG and above
     file_handler = logging.FileHandler(log_file, encoding="utf-8")
@@ -43,7 +59,7 @@ def setup_logging(debug: bool = False) -> logging.Logger:
         datefmt="%Y-%m-%d %H:%M:%S"
     )
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    handlers.append(file_handler)
 
     # Console handler - only in debug mode
     if debug:
@@ -53,14 +69,38 @@ def setup_logging(debug: bool = False) -> logging.Logger:
             "%(levelname)s - %(name)s - %(message)s"
         )
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    # Callers only enqueue records; the listener thread does the writes
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
 
     return logger
 
 
+def _stop_queue_listener() -> None:
+    """Flush queued records, stop the listener thread and close its handlers."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a child logger for a specific module.
 
+    Pass values as %-style arguments (logger.info("Copied %s", path)) rather
+    than pre-formatting them, so nothing is built for filtered records. If
+    an argument is itself costly to compute, guard the call with
+    logger.isEnabledFor(logging.DEBUG).
+
     Args:
         name: Module name (e.g., 'save_parser', 'backup_service')
 